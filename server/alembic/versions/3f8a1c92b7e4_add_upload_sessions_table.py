@@ -0,0 +1,43 @@
+"""add_upload_sessions_table
+
+Revision ID: 3f8a1c92b7e4
+Revises: df9da11e2c7c
+Create Date: 2026-10-16 23:12:05.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a1c92b7e4'
+down_revision: Union[str, Sequence[str], None] = 'df9da11e2c7c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('upload_sessions',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('filename', sa.String(length=1024), nullable=False),
+    sa.Column('mime_type', sa.String(length=255), nullable=True),
+    sa.Column('size', sa.BigInteger(), nullable=False),
+    sa.Column('offset', sa.BigInteger(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('batch_id', sa.Integer(), nullable=True),
+    sa.Column('image_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['batch_id'], ['image_clustering.image_batches.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['image_id'], ['image_clustering.images.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id'),
+    schema='image_clustering'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('upload_sessions', schema='image_clustering')
@@ -0,0 +1,34 @@
+"""add_image_listing_indexes
+
+Revision ID: 7d2e4b91c0a5
+Revises: 3f8a1c92b7e4
+Create Date: 2026-10-17 10:41:37.216054
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e4b91c0a5'
+down_revision: Union[str, Sequence[str], None] = '3f8a1c92b7e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_images_created_at_id', 'images', ['created_at', 'id'], unique=False, schema='image_clustering')
+    op.create_index('ix_images_shot_at_id', 'images', ['shot_at', 'id'], unique=False, schema='image_clustering')
+    op.create_index('ix_images_camera_shot_at_id', 'images', ['camera_make', 'camera_model', 'shot_at', 'id'], unique=False, schema='image_clustering')
+    op.create_index('ix_images_quality_score', 'images', ['quality_score'], unique=False, schema='image_clustering')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_images_quality_score', table_name='images', schema='image_clustering')
+    op.drop_index('ix_images_camera_shot_at_id', table_name='images', schema='image_clustering')
+    op.drop_index('ix_images_shot_at_id', table_name='images', schema='image_clustering')
+    op.drop_index('ix_images_created_at_id', table_name='images', schema='image_clustering')
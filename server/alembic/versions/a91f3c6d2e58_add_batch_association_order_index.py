@@ -0,0 +1,34 @@
+"""add_batch_association_order_index
+
+Revision ID: a91f3c6d2e58
+Revises: 7d2e4b91c0a5
+Create Date: 2026-10-17 11:28:09.630147
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91f3c6d2e58'
+down_revision: Union[str, Sequence[str], None] = '7d2e4b91c0a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_image_batch_association_batch_group_rank',
+        'image_batch_association',
+        ['batch_id', sa.text('group_label NULLS FIRST'), sa.text('quality_rank NULLS LAST'), 'image_id'],
+        unique=False,
+        schema='image_clustering'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_image_batch_association_batch_group_rank', table_name='image_batch_association', schema='image_clustering')
@@ -0,0 +1,32 @@
+"""use_batch_status_constants
+
+Revision ID: e4c7a2b19d63
+Revises: a91f3c6d2e58
+Create Date: 2026-10-18 09:12:44.108273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4c7a2b19d63'
+down_revision: Union[str, Sequence[str], None] = 'a91f3c6d2e58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Statuses written before the batch status constants were used, and their replacements
+RENAMED_STATUSES = {'processing': 'analyzing', 'complete': 'completed'}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for old, new in RENAMED_STATUSES.items():
+        op.execute(f"UPDATE image_clustering.image_batches SET status = '{new}' WHERE status = '{old}'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for old, new in RENAMED_STATUSES.items():
+        op.execute(f"UPDATE image_clustering.image_batches SET status = '{old}' WHERE status = '{new}'")
@@ -1,17 +1,27 @@
+import asyncio
 import logging
 import shutil
+import sys
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
 
 from src.images.router import router as images_router
 from src.batches.router import router as batches_router
+from src.jobs.router import router as jobs_router
+from src.uploads.router import router as uploads_router
+from src.uploads import service as uploads_service
+from src.uploads.constants import UPLOAD_SWEEP_INTERVAL_SECONDS
 from src.images import crud as images_crud
-from utils.file_handling import setup_directories
-from database import get_db
-from tasks import generate_thumbnail_task, generate_embedding_task
-from config import IMAGE_DIR, THUMB_DIR, DB_SCHEMA
+from utils.file_handling import setup_directories, clear_directory
+from database import get_db, async_engine
+from src.images.utils import chunked
+from src.images.constants import NEXT_CURSOR_HEADER
+from src.images.service import similarity_index, clear_file_info_cache
+from task_queue import ingest_images_task, rebuild_similarity_index_task
+from config import IMAGE_DIR, THUMB_DIR, RENDITION_DIR, VARIANT_DIR, DB_SCHEMA, EMBEDDING_TASK_CHUNK_SIZE
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +31,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# ML libraries that belong to Celery workers; the API only publishes task messages
+HEAVY_ML_MODULES = ("torch", "torchvision", "transformers", "hdbscan", "pyiqa")
+
 app = FastAPI(
     title="Image Clustering API",
     description="An API for uploading, processing, and clustering images.",
@@ -29,25 +42,55 @@ app = FastAPI(
 
 
 def process_missing_assets(db: Session):
-    """Queue Celery tasks for missing thumbnails and embeddings."""
+    """Queue Celery ingest tasks for images missing thumbnails or embeddings."""
     logger.info("Startup: Checking for missing thumbnails and embeddings...")
     
-    images_without_thumbnails = images_crud.get_without_thumbnails(db)
-    images_without_embeddings = images_crud.get_without_embeddings(db)
+    images_without_thumbnails = images_crud.get_ids_without_thumbnails(db)
+    images_without_embeddings = images_crud.get_ids_without_embeddings(db)
     
-    for image in images_without_thumbnails:
-        generate_thumbnail_task.delay(image.id)
-        
-    for image in images_without_embeddings:
-        generate_embedding_task.delay(image.id)
+    image_ids = sorted(set(images_without_thumbnails) | set(images_without_embeddings))
+    ingest_chunks = list(chunked(image_ids, EMBEDDING_TASK_CHUNK_SIZE))
+    for chunk in ingest_chunks:
+        ingest_images_task.delay(chunk)
             
-    logger.info(f"Startup: Queued {len(images_without_thumbnails)} thumbnail tasks, {len(images_without_embeddings)} embedding tasks")
+    logger.info(
+        f"Startup: Queued {len(ingest_chunks)} ingest tasks for "
+        f"{len(images_without_thumbnails)} missing thumbnails and "
+        f"{len(images_without_embeddings)} missing embeddings"
+    )
+
+    if not similarity_index.exists():
+        rebuild_similarity_index_task.delay()
+        logger.info("Startup: Queued similarity index rebuild")
+
+
+def expire_abandoned_uploads():
+    """Delete upload sessions and partial files that have been idle past their TTL."""
+    db: Session = next(get_db())
+    try:
+        uploads_service.expire_stale_uploads(db)
+    finally:
+        db.close()
+
+
+async def expire_abandoned_uploads_periodically():
+    """Runs expire_abandoned_uploads every UPLOAD_SWEEP_INTERVAL_SECONDS while the app is up."""
+    while True:
+        try:
+            await run_in_threadpool(expire_abandoned_uploads)
+        except Exception as e:
+            logger.error(f"Error expiring abandoned uploads: {e}")
+        await asyncio.sleep(UPLOAD_SWEEP_INTERVAL_SECONDS)
 
 
 @app.on_event("startup")
 async def startup_event():
     """Runs when the application starts."""
     logger.info("Running startup tasks...")
+    loaded_ml_modules = [name for name in HEAVY_ML_MODULES if name in sys.modules]
+    if loaded_ml_modules:
+        logger.warning(f"API process imported ML modules at startup: {loaded_ml_modules}")
+
     setup_directories()
     logger.info("Asset directories are set up.")
     
@@ -57,6 +100,8 @@ async def startup_event():
     finally:
         db.close()
 
+    app.state.upload_sweeper = asyncio.create_task(expire_abandoned_uploads_periodically())
+
 origins = [
     "http://localhost:5173",
     "http://localhost:3000",
@@ -68,10 +113,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(images_router)
 app.include_router(batches_router)
+app.include_router(jobs_router)
+app.include_router(uploads_router)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stops the upload sweeper and closes the async engine's pooled connections."""
+    app.state.upload_sweeper.cancel()
+    await async_engine.dispose()
+
 
 @app.get("/", tags=["Root"])
 def read_root():
@@ -92,22 +147,22 @@ def truncate_all_data(db: Session = Depends(get_db)):
         db.execute(text(f"TRUNCATE TABLE {DB_SCHEMA}.image_batches CASCADE"))
         db.execute(text(f"TRUNCATE TABLE {DB_SCHEMA}.images CASCADE"))
         db.commit()
+        clear_file_info_cache()
         
         # Delete all image files
         deleted_images = 0
         deleted_thumbnails = 0
         
         if IMAGE_DIR.exists():
-            for file in IMAGE_DIR.glob("*"):
-                if file.is_file():
-                    file.unlink()
-                    deleted_images += 1
+            deleted_images = clear_directory(IMAGE_DIR)
         
         if THUMB_DIR.exists():
-            for file in THUMB_DIR.glob("*"):
-                if file.is_file():
-                    file.unlink()
-                    deleted_thumbnails += 1
+            deleted_thumbnails = clear_directory(THUMB_DIR)
+        
+        if RENDITION_DIR.exists():
+            clear_directory(RENDITION_DIR)
+        if VARIANT_DIR.exists():
+            clear_directory(VARIANT_DIR)
         
         logger.warning(f"Truncated all tables. Deleted {deleted_images} images and {deleted_thumbnails} thumbnails.")
         
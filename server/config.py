@@ -9,12 +9,32 @@ from pathlib import Path
 load_dotenv(".env.development")
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Async (asyncpg) engine used by the read-heavy API routes; derived from DATABASE_URL by default
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or (
+    DATABASE_URL.replace("postgresql+psycopg2://", "postgresql://", 1).replace("postgresql://", "postgresql+asyncpg://", 1)
+    if DATABASE_URL else None
+)
+
+# Connection pools, per process: the sync pool serves threadpool routes and Celery
+# tasks, the async pool the async routes. Connections are checked with a ping before
+# use and replaced after DB_POOL_RECYCLE seconds
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+ASYNC_DB_POOL_SIZE = int(os.getenv("ASYNC_DB_POOL_SIZE", "20"))
+ASYNC_DB_MAX_OVERFLOW = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "40"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
 
 RABBITMQ_USER = os.getenv("RABBITMQ_USER", "user")
 RABBITMQ_PASSWORD = os.getenv("RABBITMQ_PASSWORD", "password")
 RABBITMQ_HOST = os.getenv("RABBITMQ_HOST", "localhost")
 CELERY_BROKER_URL = f"amqp://{RABBITMQ_USER}:{RABBITMQ_PASSWORD}@{RABBITMQ_HOST}:5672/"
 
+# Every change to the similarity index goes through this queue, consumed by a single
+# solo-pool worker that keeps the index in memory (see README)
+SIMILARITY_INDEX_QUEUE = "similarity_index"
+
 CELERY_TASK_CONFIG = {
     "task_serializer": "json",
     "accept_content": ["json"],
@@ -23,17 +43,92 @@ CELERY_TASK_CONFIG = {
     "enable_utc": True,
     "worker_prefetch_multiplier": 1,
     "worker_max_tasks_per_child": 50,
+    "task_routes": {
+        "tasks.update_similarity_index_task": {"queue": SIMILARITY_INDEX_QUEUE},
+        "tasks.remove_from_similarity_index_task": {"queue": SIMILARITY_INDEX_QUEUE},
+        "tasks.rebuild_similarity_index_task": {"queue": SIMILARITY_INDEX_QUEUE},
+    },
 }
 
+# Images per CLIP forward pass, and image ids per queued embedding task
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "16"))
+EMBEDDING_TASK_CHUNK_SIZE = int(os.getenv("EMBEDDING_TASK_CHUNK_SIZE", "64"))
+
 DB_SCHEMA = "image_clustering"
 
 STORAGE_ROOT = Path(os.getenv("STORAGE_ROOT", str(Path(__file__).parent.resolve())))
 
 IMAGE_DIR = STORAGE_ROOT / "assets" / "images"
 THUMB_DIR = STORAGE_ROOT / "assets" / "thumbnails"
+RENDITION_DIR = STORAGE_ROOT / "assets" / "renditions"
+VARIANT_DIR = STORAGE_ROOT / "assets" / "variants"
+
+MODEL_DIR = STORAGE_ROOT / "models"
+
+# CLIP weight hosting for Celery workers:
+#   "private" - each prefork child loads its own copy with from_pretrained
+#   "shared"  - weights are exported once to a safetensors file and memory-mapped
+#               read-only in the worker parent, so children inherit them on fork (CPU only)
+CLIP_WEIGHTS_MODE = os.getenv("CLIP_WEIGHTS_MODE", "private")
+CLIP_SHARED_WEIGHTS_PATH = MODEL_DIR / "clip-vit-large-patch14.safetensors"
+
+# Memory budget for PyIQA quality models kept resident per process (LRU-evicted)
+QUALITY_MODEL_CACHE_MB = int(os.getenv("QUALITY_MODEL_CACHE_MB", "2048"))
+# Same-sized images scored per quality-model forward pass
+QUALITY_BATCH_SIZE = int(os.getenv("QUALITY_BATCH_SIZE", "8"))
+# Longest edge images are scored at in batches; larger ones are downscaled first,
+# which bounds the stacked input tensor regardless of camera resolution
+QUALITY_MAX_EDGE = int(os.getenv("QUALITY_MAX_EDGE", "1024"))
+
+# Approximate nearest-neighbour index over CLIP embeddings (HNSW)
+EMBEDDING_DIM = 768
+SIMILARITY_INDEX_PATH = STORAGE_ROOT / "index" / "clip_hnsw.bin"
+SIMILARITY_INDEX_M = int(os.getenv("SIMILARITY_INDEX_M", "16"))
+SIMILARITY_INDEX_EF_CONSTRUCTION = int(os.getenv("SIMILARITY_INDEX_EF_CONSTRUCTION", "200"))
+SIMILARITY_INDEX_EF_SEARCH = int(os.getenv("SIMILARITY_INDEX_EF_SEARCH", "64"))
+# Seconds between checks for a newer index file written by the workers
+SIMILARITY_INDEX_RELOAD_SECONDS = float(os.getenv("SIMILARITY_INDEX_RELOAD_SECONDS", "30"))
+# The index worker persists changes after this many additions/deletions, or this many
+# seconds after the first unsaved one, instead of rewriting the file on every insert
+SIMILARITY_INDEX_SAVE_EVERY = int(os.getenv("SIMILARITY_INDEX_SAVE_EVERY", "1024"))
+SIMILARITY_INDEX_SAVE_SECONDS = float(os.getenv("SIMILARITY_INDEX_SAVE_SECONDS", "60"))
+
+# Downscaled renditions served at /images/{id}/rendition/{name}, as name:long_edge pairs.
+# RENDITION_FORMAT is jpeg, webp or avif (falls back to jpeg if Pillow lacks the codec)
+RENDITION_SIZES = {
+    name: int(long_edge)
+    for name, long_edge in (
+        item.split(":") for item in os.getenv("RENDITION_SIZES", "grid:400,preview:1280,large:2560").split(",")
+    )
+}
+RENDITION_FORMAT = os.getenv("RENDITION_FORMAT", "webp").lower()
+RENDITION_QUALITY = int(os.getenv("RENDITION_QUALITY", "80"))
+
+# On-demand variants served at /images/{id}/variant: disk cache budget (least recently
+# used files are evicted) and the largest width or height that may be requested
+VARIANT_CACHE_MB = int(os.getenv("VARIANT_CACHE_MB", "2048"))
+VARIANT_MAX_EDGE = int(os.getenv("VARIANT_MAX_EDGE", "4096"))
+
+# Memory budget per process for packed batch thumbnail bundles (LRU-evicted)
+THUMBNAIL_BUNDLE_CACHE_MB = int(os.getenv("THUMBNAIL_BUNDLE_CACHE_MB", "64"))
+
+# Server-local import: only paths below these directories (os.pathsep-separated)
+# may be imported; import is disabled while unset
+IMPORT_ROOTS = [Path(root).resolve() for root in os.getenv("IMPORT_ROOTS", "").split(os.pathsep) if root]
+# "copy" makes an independent copy. "hardlink" shares the source file's blocks when on
+# the same filesystem (falls back to copying otherwise), which saves space but means
+# editing the source in place changes the stored original under its old hash, so
+# thumbnails, embeddings and content ETags go stale; only use it for read-only sources
+IMPORT_LINK_MODE = os.getenv("IMPORT_LINK_MODE", "copy")
+IMPORT_HASH_WORKERS = int(os.getenv("IMPORT_HASH_WORKERS", "8"))
+
+# Open resumable uploads and partial files with no activity for this long are deleted
+UPLOAD_SESSION_TTL_HOURS = float(os.getenv("UPLOAD_SESSION_TTL_HOURS", "24"))
 
 IMAGE_DIR.mkdir(parents=True, exist_ok=True)
 THUMB_DIR.mkdir(parents=True, exist_ok=True)
+RENDITION_DIR.mkdir(parents=True, exist_ok=True)
+VARIANT_DIR.mkdir(parents=True, exist_ok=True)
 
 SCALE = 150
 ASPECT_16x9 = 16 / 9
@@ -3,17 +3,46 @@ Manages the database connection and session.
 Provides a centralized way to interact with the database.
 """
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from config import DATABASE_URL, DB_SCHEMA
+from config import (
+    DATABASE_URL,
+    ASYNC_DATABASE_URL,
+    DB_SCHEMA,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    ASYNC_DB_POOL_SIZE,
+    ASYNC_DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+)
 
 Base = declarative_base()
 
 engine = create_engine(
     DATABASE_URL,
-    connect_args={'options': f'-csearch_path={DB_SCHEMA}'}
+    connect_args={'options': f'-csearch_path={DB_SCHEMA}'},
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read-heavy routes run on the event loop with this engine instead of occupying threadpool workers
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    connect_args={'server_settings': {'search_path': DB_SCHEMA}},
+    pool_size=ASYNC_DB_POOL_SIZE,
+    max_overflow=ASYNC_DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 def init_db():
     """Creates all tables in the database based on the defined models."""
     Base.metadata.create_all(bind=engine)
@@ -24,4 +53,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    """Provides an async database session for a single request; it connects on first use."""
+    async with AsyncSessionLocal() as db:
+        yield db
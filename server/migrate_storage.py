@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Moves originals and thumbnails from the flat asset directories into the
+content-addressed, sharded layout (ab/cd/<hash><ext>) and rewrites
+images.filename and images.file_path to match.
+
+Safe to re-run: images already in place are skipped, and each chunk is
+committed only after its files have been moved.
+
+Usage:
+    python migrate_storage.py [--dry-run] [--chunk-size N]
+"""
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+
+from database import SessionLocal
+from src.images.models import Image
+from utils.file_handling import content_filename, shard_path
+from config import IMAGE_DIR, THUMB_DIR
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("migrate_storage")
+
+
+def _move(source: Path, target: Path, dry_run: bool) -> bool:
+    """Moves source to target; identical content already at target wins. Returns whether target exists."""
+    if target.is_file():
+        if source.is_file() and source != target and not dry_run:
+            source.unlink()
+        return True
+    if not source.is_file():
+        return False
+    if not dry_run:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(source, target)
+    return True
+
+
+def migrate(dry_run: bool = False, chunk_size: int = 500) -> dict:
+    """Migrates every image row, chunk by chunk in id order."""
+    stats = {"moved": 0, "already_migrated": 0, "missing_original": 0, "missing_thumbnail": 0}
+    db = SessionLocal()
+    try:
+        last_id = 0
+        while True:
+            images = db.query(Image).filter(Image.id > last_id).order_by(Image.id).limit(chunk_size).all()
+            if not images:
+                break
+            last_id = images[-1].id
+
+            for image in images:
+                filename = content_filename(image.image_hash, image.original_filename)
+                image_path = shard_path(IMAGE_DIR, filename)
+
+                if image.filename == filename and image.file_path == str(image_path):
+                    stats["already_migrated"] += 1
+                    continue
+
+                if not _move(Path(image.file_path), image_path, dry_run):
+                    logger.warning(f"Original for image {image.id} not found at {image.file_path}; leaving row unchanged")
+                    stats["missing_original"] += 1
+                    continue
+
+                if image.has_thumbnail and not _move(THUMB_DIR / image.filename, shard_path(THUMB_DIR, filename), dry_run):
+                    # The ingest pass recreates it on the next startup
+                    image.has_thumbnail = False
+                    stats["missing_thumbnail"] += 1
+
+                image.filename = filename
+                image.file_path = str(image_path)
+                stats["moved"] += 1
+
+            if dry_run:
+                db.rollback()
+            else:
+                db.commit()
+            logger.info(f"Processed images up to ID {last_id}: {stats}")
+    finally:
+        db.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without touching files or rows")
+    parser.add_argument("--chunk-size", type=int, default=500, help="images per transaction")
+    args = parser.parse_args()
+
+    stats = migrate(dry_run=args.dry_run, chunk_size=args.chunk_size)
+    print(f"{'Would migrate' if args.dry_run else 'Migrated'}: {stats}")
+    sys.exit(1 if stats["missing_original"] else 0)
+
+
+if __name__ == "__main__":
+    main()
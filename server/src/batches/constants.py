@@ -12,6 +12,26 @@ VALID_BATCH_STATUSES = {
     BATCH_STATUS_FAILED
 }
 
+# Progress phases reported by background batch analysis
+ANALYSIS_PHASE_LOADING_FEATURES = 'loading_features'
+ANALYSIS_PHASE_CLUSTERING = 'clustering'
+ANALYSIS_PHASE_WRITING_LABELS = 'writing_labels'
+
+# Images whose embeddings are fetched per query while loading features
+ANALYSIS_FEATURE_CHUNK_SIZE = 1000
+
+# Images previewed on a batch card in the summary listing; the first is the cover
+BATCH_PREVIEW_IMAGE_COUNT = 4
+
+# Thumbnails per bundle page: default and maximum
+THUMBNAIL_BUNDLE_DEFAULT_LIMIT = 200
+THUMBNAIL_BUNDLE_MAX_LIMIT = 1000
+# Record header of a bundle entry: image id and payload length, both big-endian uint32
+THUMBNAIL_BUNDLE_RECORD_HEADER = ">II"
+THUMBNAIL_BUNDLE_MEDIA_TYPE = "application/octet-stream"
+# Batch membership changes, so bundles are revalidated against their ETag on every use
+THUMBNAIL_BUNDLE_CACHE_CONTROL = "no-cache"
+
 DEFAULT_MIN_CLUSTER_SIZE = 5
 DEFAULT_MIN_SAMPLES = 5
 DEFAULT_METRIC = 'cosine'
@@ -1,8 +1,13 @@
 """CRUD operations for Batch domain."""
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert, aggregate_order_by
+from sqlalchemy.orm import Session, selectinload, joinedload, load_only
 from src.batches.models import ImageBatch, ImageBatchAssociation
 from src.images.models import Image
-from typing import List, Optional, Dict
+from src.images.crud import RESPONSE_COLUMNS
+from src.batches.constants import BATCH_STATUS_PENDING, BATCH_PREVIEW_IMAGE_COUNT
+from typing import Any, List, Optional, Dict, Tuple
 
 
 def get(db: Session, batch_id: int) -> Optional[ImageBatch]:
@@ -10,11 +15,54 @@ def get(db: Session, batch_id: int) -> Optional[ImageBatch]:
     return db.query(ImageBatch).filter(ImageBatch.id == batch_id).first()
 
 
+async def get_with_images(db: AsyncSession, batch_id: int) -> Optional[ImageBatch]:
+    """
+    Get a batch with its associations and their images loaded in one extra
+    query, associations in display order and images limited to response columns.
+    """
+    result = await db.scalars(
+        select(ImageBatch).options(
+            selectinload(ImageBatch.image_associations)
+            .joinedload(ImageBatchAssociation.image)
+            .load_only(*RESPONSE_COLUMNS)
+        ).where(ImageBatch.id == batch_id)
+    )
+    return result.first()
+
+
 def get_multi(db: Session, skip: int = 0, limit: int = 100) -> List[ImageBatch]:
     """Get multiple batches with pagination."""
     return db.query(ImageBatch).offset(skip).limit(limit).all()
 
 
+def get_summaries(db: Session) -> List[Any]:
+    """
+    Get id, batch_name, status, created_at, image_count, group_count and
+    preview_image_ids of every batch with one aggregate query. Preview images
+    are those with thumbnails, best-ranked first.
+    """
+    preview_ids = func.array_agg(
+        aggregate_order_by(
+            ImageBatchAssociation.image_id,
+            ImageBatchAssociation.quality_rank.asc().nulls_last(),
+            ImageBatchAssociation.image_id
+        )
+    ).filter(Image.has_thumbnail)
+    return db.query(
+        ImageBatch.id,
+        ImageBatch.batch_name,
+        ImageBatch.status,
+        ImageBatch.created_at,
+        func.count(ImageBatchAssociation.image_id).label("image_count"),
+        func.count(ImageBatchAssociation.group_label.distinct()).label("group_count"),
+        preview_ids[1:BATCH_PREVIEW_IMAGE_COUNT].label("preview_image_ids"),
+    ).outerjoin(
+        ImageBatchAssociation, ImageBatchAssociation.batch_id == ImageBatch.id
+    ).outerjoin(
+        Image, Image.id == ImageBatchAssociation.image_id
+    ).group_by(ImageBatch.id).order_by(ImageBatch.id).all()
+
+
 def get_all(db: Session) -> List[ImageBatch]:
     """Get all batches."""
     return db.query(ImageBatch).all()
@@ -22,7 +70,7 @@ def get_all(db: Session) -> List[ImageBatch]:
 
 def create(db: Session, *, name: str, images: List[Image]) -> ImageBatch:
     """Create new batch with images."""
-    new_batch = ImageBatch(batch_name=name, images=images, status='pending')
+    new_batch = ImageBatch(batch_name=name, images=images, status=BATCH_STATUS_PENDING)
     db.add(new_batch)
     db.commit()
     db.refresh(new_batch)
@@ -43,6 +91,26 @@ def remove(db: Session, batch: ImageBatch):
     db.commit()
 
 
+def add_image_ids(db: Session, batch_id: int, image_ids: List[int]):
+    """Add images to a batch by ID in one statement, skipping ones already in it. Does not commit."""
+    if not image_ids:
+        return
+    db.execute(
+        insert(ImageBatchAssociation)
+        .values([{"batch_id": batch_id, "image_id": image_id} for image_id in image_ids])
+        .on_conflict_do_nothing()
+    )
+
+
+def get_thumbnail_page(db: Session, batch_id: int, offset: int, limit: int) -> List[Tuple[int, str, str, bool]]:
+    """Get (id, image_hash, filename, has_thumbnail) for one page of a batch's images, ordered by image ID."""
+    return db.query(Image.id, Image.image_hash, Image.filename, Image.has_thumbnail).join(
+        ImageBatchAssociation, ImageBatchAssociation.image_id == Image.id
+    ).filter(
+        ImageBatchAssociation.batch_id == batch_id
+    ).order_by(Image.id).offset(offset).limit(limit).all()
+
+
 def get_associations_map(db: Session, batch_id: int) -> Dict[int, ImageBatchAssociation]:
     """Get image associations for a batch as a map."""
     associations = db.query(ImageBatchAssociation).filter(
@@ -1,7 +1,8 @@
 """FastAPI dependencies for Batch domain."""
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database import get_db
+from database import get_db, get_async_db
 from src.batches import crud
 from src.batches.models import ImageBatch
 from src.batches.exceptions import BatchNotFound
@@ -13,3 +14,11 @@ def get_batch_or_404(batch_id: int, db: Session = Depends(get_db)) -> ImageBatch
     if not batch:
         raise BatchNotFound(batch_id)
     return batch
+
+
+async def get_batch_with_images_or_404(batch_id: int, db: AsyncSession = Depends(get_async_db)) -> ImageBatch:
+    """Validate batch exists and return it with its images eagerly loaded."""
+    batch = await crud.get_with_images(db, batch_id=batch_id)
+    if not batch:
+        raise BatchNotFound(batch_id)
+    return batch
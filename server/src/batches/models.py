@@ -1,5 +1,5 @@
 """SQLAlchemy models for Batch domain."""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.associationproxy import association_proxy
@@ -7,6 +7,7 @@ from sqlalchemy.sql import func
 
 from database import Base
 from config import DB_SCHEMA
+from src.batches.constants import BATCH_STATUS_PENDING
 
 
 class ImageBatch(Base):
@@ -16,13 +17,19 @@ class ImageBatch(Base):
     id = Column(Integer, primary_key=True)
     batch_name = Column(String(255), nullable=False)
     parameters = Column(JSONB)
-    status = Column(String(50), default='pending', nullable=False)
+    status = Column(String(50), default=BATCH_STATUS_PENDING, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Ungrouped images first, then each group best-ranked first; unranked images last
     image_associations = relationship(
         "ImageBatchAssociation",
         back_populates="batch",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        order_by=lambda: (
+            ImageBatchAssociation.group_label.asc().nulls_first(),
+            ImageBatchAssociation.quality_rank.asc().nulls_last(),
+            ImageBatchAssociation.image_id,
+        )
     )
 
     images = association_proxy(
@@ -48,4 +55,14 @@ class ImageBatchAssociation(Base):
     batch = relationship("ImageBatch", back_populates="image_associations")
     image = relationship("Image", back_populates="batch_associations")
     
-    __table_args__ = {'schema': DB_SCHEMA}
+    # Serves the batch view's ORDER BY from the index
+    __table_args__ = (
+        Index(
+            'ix_image_batch_association_batch_group_rank',
+            'batch_id',
+            text('group_label NULLS FIRST'),
+            text('quality_rank NULLS LAST'),
+            'image_id',
+        ),
+        {'schema': DB_SCHEMA},
+    )
@@ -1,17 +1,24 @@
 """API router for Batch domain."""
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Header, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from database import get_db
 from src.batches import service, crud
 from src.batches.models import ImageBatch
-from src.batches.schemas import BatchCreate, BatchResponse, BatchRename, BatchAnalyze, BatchUpdateImages, BatchGroupUpdate
+from src.batches.schemas import BatchCreate, BatchResponse, BatchSummaryResponse, BatchRename, BatchAnalyze, BatchUpdateImages, BatchGroupUpdate
 from src.batches.exceptions import BatchNotFound, BatchValidationError
-from src.batches.dependencies import get_batch_or_404
+from src.batches.dependencies import get_batch_or_404, get_batch_with_images_or_404
 from src.images.models import Image as ImageModel
-from src.images.utils import queue_image_tasks
-from tasks import generate_thumbnail_task, generate_embedding_task
+from src.batches.constants import (
+    THUMBNAIL_BUNDLE_DEFAULT_LIMIT,
+    THUMBNAIL_BUNDLE_MAX_LIMIT,
+    THUMBNAIL_BUNDLE_MEDIA_TYPE,
+    THUMBNAIL_BUNDLE_CACHE_CONTROL,
+)
+from src.images.utils import queue_image_tasks, etag_matches, not_modified_response
+from src.jobs.schemas import JobResponse
+from task_queue import ingest_images_task, analyze_batch_task
 
 
 router = APIRouter(prefix="/batches", tags=["Grouping Batches"])
@@ -26,26 +33,42 @@ def create_batch(batch_data: BatchCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=e.status_code, detail=str(e))
 
 
-@router.get("/", response_model=List[BatchResponse], operation_id="getAllBatches")
+@router.get("/", response_model=List[BatchSummaryResponse], operation_id="getAllBatches")
 def get_all_batches(db: Session = Depends(get_db)):
-    """Returns all batches."""
-    return crud.get_multi(db)
+    """Returns a summary of every batch; associations are only served by the detail endpoint."""
+    return service.list_batch_summaries(db)
 
 
 @router.get("/{batch_id}", response_model=BatchResponse, operation_id="getBatch")
-def get_batch_details(batch: ImageBatch = Depends(get_batch_or_404)):
+async def get_batch_details(batch: ImageBatch = Depends(get_batch_with_images_or_404)):
     """Returns details for a specific batch with images sorted by quality_rank within groups."""
-    batch.image_associations = sorted(
-        batch.image_associations,
-        key=lambda a: (
-            a.group_label or "",
-            a.quality_rank if a.quality_rank is not None else float('inf')
-        )
-    )
-    
     return batch
 
 
+@router.get("/{batch_id}/thumbnails", operation_id="getBatchThumbnailBundle")
+def get_batch_thumbnail_bundle(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(THUMBNAIL_BUNDLE_DEFAULT_LIMIT, ge=1, le=THUMBNAIL_BUNDLE_MAX_LIMIT),
+    if_none_match: Optional[str] = Header(None),
+    batch: ImageBatch = Depends(get_batch_or_404),
+    db: Session = Depends(get_db)
+):
+    """
+    Returns the thumbnails of one page of a batch, ordered by image ID, in a single
+    binary body so a grid loads with one request instead of one per image. Each
+    record is a big-endian uint32 image ID, a big-endian uint32 byte length and
+    that many JPEG bytes; a length of 0 means the thumbnail is not generated yet.
+    """
+    etag, rows = service.get_thumbnail_page(db, batch_id=batch.id, offset=offset, limit=limit)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag, THUMBNAIL_BUNDLE_CACHE_CONTROL)
+    return Response(
+        content=service.get_thumbnail_bundle(etag, rows),
+        media_type=THUMBNAIL_BUNDLE_MEDIA_TYPE,
+        headers={"ETag": etag, "Cache-Control": THUMBNAIL_BUNDLE_CACHE_CONTROL}
+    )
+
+
 @router.put("/{batch_id}", response_model=BatchResponse, operation_id="renameBatch")
 def rename_batch(batch_id: int, batch_data: BatchRename, db: Session = Depends(get_db)):
     """Renames an existing batch."""
@@ -81,7 +104,7 @@ def upload_and_add_to_batch(
     try:
         updated_batch, upload_results = service.upload_and_add(db, batch_id=batch_id, files=files)
         new_images = [res for res in upload_results if isinstance(res, ImageModel)]
-        queue_image_tasks(new_images, generate_thumbnail_task, generate_embedding_task)
+        queue_image_tasks(new_images, ingest_images_task)
         return updated_batch
     except (BatchNotFound, BatchValidationError) as e:
         raise HTTPException(status_code=e.status_code, detail=str(e))
@@ -105,6 +128,25 @@ def analyze_batch(batch_id: int, analysis_params: BatchAnalyze, db: Session = De
         raise HTTPException(status_code=e.status_code, detail=str(e))
 
 
+@router.post(
+    "/{batch_id}/analysis-jobs",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    operation_id="startBatchAnalysisJob"
+)
+def start_batch_analysis_job(batch_id: int, analysis_params: BatchAnalyze, db: Session = Depends(get_db)):
+    """
+    Queues clustering of a batch as a background job and returns the job.
+    Follow progress at /jobs/{job_id} or /jobs/{job_id}/events.
+    """
+    try:
+        job = service.start_analysis_job(db, batch_id=batch_id, params=analysis_params)
+    except (BatchNotFound, BatchValidationError) as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    analyze_batch_task.delay(job.id)
+    return job
+
+
 @router.put("/{batch_id}/groups", response_model=BatchResponse, operation_id="updateGroupsInBatch")
 def update_groups(batch_id: int, group_data: BatchGroupUpdate, db: Session = Depends(get_db)):
     """Manually updates the group assignments for images in a batch."""
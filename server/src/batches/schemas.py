@@ -39,6 +39,20 @@ class BatchUpdateImages(BaseModel):
     image_ids: List[int]
 
 
+class BatchSummaryResponse(BaseModel):
+    """Batch as listed on the landing page: counts and preview images instead of associations."""
+    id: int
+    batch_name: str
+    status: str
+    created_at: datetime | None = None
+    image_count: int
+    group_count: int
+    cover_image_id: int | None = None
+    preview_image_ids: List[int]
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
 class BatchResponse(BaseModel):
     """Full batch details with image associations."""
     id: int
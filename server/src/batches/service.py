@@ -1,19 +1,39 @@
 """Business logic for Batch domain."""
+import hashlib
+import struct
+import threading
+from collections import OrderedDict
 import numpy as np
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timezone
 
 from src.batches import crud
 from src.batches.models import ImageBatch
-from src.batches.schemas import BatchAnalyze
+from src.batches.schemas import BatchAnalyze, BatchSummaryResponse
 from src.batches.exceptions import BatchNotFound, BatchValidationError
+from src.batches.constants import (
+    BATCH_STATUS_ANALYZING,
+    BATCH_STATUS_COMPLETED,
+    ANALYSIS_PHASE_LOADING_FEATURES,
+    ANALYSIS_PHASE_CLUSTERING,
+    ANALYSIS_PHASE_WRITING_LABELS,
+    ANALYSIS_FEATURE_CHUNK_SIZE,
+    THUMBNAIL_BUNDLE_RECORD_HEADER,
+)
 from src.images import crud as image_crud
 from src.images.models import Image
 from src.images import service as image_service
 from src.images.schemas import ImageResponse
+from src.images.utils import chunked
+from src.jobs import crud as job_crud
+from src.jobs.constants import JOB_KIND_BATCH_ANALYSIS
+from src.jobs.models import Job
+from src.jobs.service import ProgressCallback
 from src.processing.clustering import ImageGrouper
+from utils.file_handling import thumbnail_path
+from config import THUMBNAIL_BUNDLE_CACHE_MB
 
 
 def create_new_batch(db: Session, name: str, image_ids: List[int]) -> ImageBatch:
@@ -24,6 +44,23 @@ def create_new_batch(db: Session, name: str, image_ids: List[int]) -> ImageBatch
     return crud.create(db, name=name, images=images_to_add)
 
 
+def list_batch_summaries(db: Session) -> List[BatchSummaryResponse]:
+    """List every batch with image and group counts and its preview images."""
+    return [
+        BatchSummaryResponse(
+            id=row.id,
+            batch_name=row.batch_name,
+            status=row.status,
+            created_at=row.created_at,
+            image_count=row.image_count,
+            group_count=row.group_count,
+            cover_image_id=row.preview_image_ids[0] if row.preview_image_ids else None,
+            preview_image_ids=row.preview_image_ids or [],
+        )
+        for row in crud.get_summaries(db)
+    ]
+
+
 def rename_batch(db: Session, batch_id: int, new_name: str) -> ImageBatch:
     """Rename an existing batch."""
     batch = crud.get(db, batch_id)
@@ -98,48 +135,84 @@ def update_manual_groups(db: Session, batch_id: int, group_map: Dict[str, List[i
             if image_id in association_map:
                 association_map[image_id].group_label = group_label
     
-    batch.status = 'complete'
+    batch.status = BATCH_STATUS_COMPLETED
     return crud.update(db, db_obj=batch)
 
 
-def analyze_batch(db: Session, batch_id: int, params: BatchAnalyze) -> ImageBatch:
-    """Analyze batch using HDBSCAN clustering."""
+def analyze_batch(
+    db: Session,
+    batch_id: int,
+    params: BatchAnalyze,
+    progress: Optional[ProgressCallback] = None
+) -> ImageBatch:
+    """Analyze batch using HDBSCAN clustering, reporting per-phase progress if asked."""
+    report = progress or (lambda phase, done, total: None)
+
     batch = crud.get(db, batch_id)
     if not batch:
         raise BatchNotFound(batch_id)
-        
-    if not batch.images:
+
+    image_ids = [assoc.image_id for assoc in batch.image_associations]
+    if not image_ids:
         raise BatchValidationError("Cannot analyze an empty batch.")
-        
-    if any(img.features is None for img in batch.images):
+
+    features_by_id = {}
+    report(ANALYSIS_PHASE_LOADING_FEATURES, 0, len(image_ids))
+    for id_chunk in chunked(image_ids, ANALYSIS_FEATURE_CHUNK_SIZE):
+        features_by_id.update(image_crud.get_features_by_ids(db, image_ids=id_chunk))
+        report(ANALYSIS_PHASE_LOADING_FEATURES, len(features_by_id), len(image_ids))
+
+    if len(features_by_id) != len(image_ids):
         raise BatchValidationError("One or more images are missing feature embeddings.")
 
-    batch.status = 'processing'
+    batch.status = BATCH_STATUS_ANALYZING
     batch.parameters = params.model_dump()
     crud.update(db, db_obj=batch)
     
-    features_matrix = np.array([img.features for img in batch.images])
+    features_matrix = np.stack([
+        np.frombuffer(features_by_id[image_id], dtype=np.float32) for image_id in image_ids
+    ])
     
+    report(ANALYSIS_PHASE_CLUSTERING, 0, 1)
     grouper = ImageGrouper(
         min_cluster_size=params.min_cluster_size,
         min_samples=params.min_samples,
         metric=params.metric
     )
     labels = grouper.fit_predict(features_matrix)
+    report(ANALYSIS_PHASE_CLUSTERING, 1, 1)
     
     unique_cluster_labels = sorted([label for label in np.unique(labels) if label != -1])
     label_map = {label: f"Group {i+1}" for i, label in enumerate(unique_cluster_labels)}
     label_map[-1] = "Ungrouped"
 
     association_map = crud.get_associations_map(db, batch_id=batch.id)
-    for image, label in zip(batch.images, labels):
-        if image.id in association_map:
-            association_map[image.id].group_label = label_map.get(label, "Ungrouped")
+    report(ANALYSIS_PHASE_WRITING_LABELS, 0, len(image_ids))
+    for written, (image_id, label) in enumerate(zip(image_ids, labels), start=1):
+        if image_id in association_map:
+            association_map[image_id].group_label = label_map.get(label, "Ungrouped")
+        report(ANALYSIS_PHASE_WRITING_LABELS, written, len(image_ids))
     
-    batch.status = 'complete'
+    batch.status = BATCH_STATUS_COMPLETED
     return crud.update(db, db_obj=batch)
 
 
+def start_analysis_job(db: Session, batch_id: int, params: BatchAnalyze) -> Job:
+    """Validate the batch and create a queued analysis job for it."""
+    batch = crud.get(db, batch_id)
+    if not batch:
+        raise BatchNotFound(batch_id)
+
+    if not batch.image_associations:
+        raise BatchValidationError("Cannot analyze an empty batch.")
+
+    return job_crud.create(
+        db,
+        kind=JOB_KIND_BATCH_ANALYSIS,
+        params={"batch_id": batch_id, **params.model_dump()}
+    )
+
+
 def rank_group_images(db: Session, batch_id: int, group_label: str, metric: str = "liqe") -> ImageBatch:
     """Rank images within a group by quality score."""
     batch = crud.get(db, batch_id)
@@ -156,16 +229,17 @@ def rank_group_images(db: Session, batch_id: int, group_label: str, metric: str
     
     image_ids = [assoc.image_id for assoc in group_associations]
     
-    quality_results = []
-    for image_id in image_ids:
-        score = image_service.analyze_image_quality(db, image_id, metric, force_reanalyze=False)
-        quality_results.append((image_id, score))
+    scores = image_service.analyze_images_quality(db, image_ids, metric, force_reanalyze=False)
     
-    quality_results.sort(key=lambda x: x[1], reverse=True)
+    # Images that could not be scored keep no rank and sort last
+    quality_results = sorted(scores.items(), key=lambda x: x[1], reverse=True)
     
     association_map = {assoc.image_id: assoc for assoc in group_associations}
     now = datetime.now(timezone.utc)
     
+    for assoc in group_associations:
+        assoc.quality_rank = None
+    
     for rank, (image_id, score) in enumerate(quality_results, start=1):
         assoc = association_map[image_id]
         assoc.quality_rank = rank
@@ -175,3 +249,58 @@ def rank_group_images(db: Session, batch_id: int, group_label: str, metric: str
     db.commit()
     db.refresh(batch)
     return batch
+
+
+# Packed bundles keyed by ETag; the ETag changes whenever the page's content does
+_bundle_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_bundle_cache_bytes = 0
+_bundle_lock = threading.Lock()
+
+
+def get_thumbnail_page(db: Session, batch_id: int, offset: int, limit: int) -> Tuple[str, List[Tuple[int, str, str, bool]]]:
+    """
+    Return the rows of one page of a batch's thumbnails together with a strong
+    ETag over the page's image ids, content hashes and thumbnail availability.
+    """
+    rows = crud.get_thumbnail_page(db, batch_id=batch_id, offset=offset, limit=limit)
+    digest = hashlib.sha256(f"{batch_id}:{offset}:{limit}".encode())
+    for image_id, image_hash, _, has_thumbnail in rows:
+        digest.update(f"|{image_id}:{image_hash}:{int(has_thumbnail)}".encode())
+    return f'"bundle-{digest.hexdigest()[:32]}"', rows
+
+
+def get_thumbnail_bundle(etag: str, rows: List[Tuple[int, str, str, bool]]) -> bytes:
+    """
+    Pack the thumbnails of a page into one body, reusing a cached copy for the
+    same ETag. Each record is a big-endian uint32 image id and uint32 length
+    followed by that many JPEG bytes; length 0 means no thumbnail exists yet.
+    """
+    global _bundle_cache_bytes
+    with _bundle_lock:
+        bundle = _bundle_cache.get(etag)
+        if bundle is not None:
+            _bundle_cache.move_to_end(etag)
+            return bundle
+
+    parts = []
+    for row in rows:
+        data = b""
+        if row.has_thumbnail:
+            try:
+                data = thumbnail_path(row).read_bytes()
+            except FileNotFoundError:
+                pass
+        parts.append(struct.pack(THUMBNAIL_BUNDLE_RECORD_HEADER, row.id, len(data)))
+        parts.append(data)
+    bundle = b"".join(parts)
+
+    budget = THUMBNAIL_BUNDLE_CACHE_MB * 1024 * 1024
+    if len(bundle) <= budget:
+        with _bundle_lock:
+            if etag not in _bundle_cache:
+                _bundle_cache[etag] = bundle
+                _bundle_cache_bytes += len(bundle)
+            while _bundle_cache_bytes > budget:
+                _, evicted = _bundle_cache.popitem(last=False)
+                _bundle_cache_bytes -= len(evicted)
+    return bundle
@@ -8,6 +8,29 @@ ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.
 # Maximum file size (10 MB)
 MAX_IMAGE_SIZE = 10 * 1024 * 1024
 
+# Image bytes behind an id never change, so responses may be cached for a year
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Per-process LRU of id -> (hash, filename, path) used to answer file requests
+FILE_INFO_CACHE_SIZE = 100_000
+
+# On-demand variants: "contain" fits inside width x height, "cover" fills it and center-crops
+VARIANT_FITS = ('contain', 'cover')
+DEFAULT_VARIANT_FIT = 'contain'
+
+# Keyset-paginated listing: page sizes and the header carrying the next cursor
+IMAGE_LIST_DEFAULT_LIMIT = 100
+IMAGE_LIST_MAX_LIMIT = 1000
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+# Maximum number of content hashes accepted by one existence check
+MAX_HASH_CHECK = 10000
+
+# Server-local import: files hashed and inserted per transaction, and job phases
+IMPORT_CHUNK_SIZE = 500
+IMPORT_PHASE_SCANNING = 'scanning'
+IMPORT_PHASE_IMPORTING = 'importing'
+IMPORT_PHASE_ATTACHING = 'attaching_to_batch'
+
 # Supported quality metrics
 QUALITY_METRICS = [
     'clipiqa+',
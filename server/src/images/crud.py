@@ -2,14 +2,42 @@
 CRUD operations for Image entity.
 Handles database operations for images.
 """
-from sqlalchemy.orm import Session
+from datetime import datetime
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only, undefer
 from src.images.models import Image
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+# Columns ImageResponse reads; listings load only these
+RESPONSE_COLUMNS = (
+    Image.id,
+    Image.filename,
+    Image.original_filename,
+    Image.file_path,
+    Image.has_thumbnail,
+    Image.quality_score,
+    Image.quality_metric,
+)
 
-def get(db: Session, image_id: int) -> Optional[Image]:
-    """Get a single image by ID."""
-    return db.query(Image).filter(Image.id == image_id).first()
+
+def _query(db: Session, with_features: bool = False):
+    """Image query; the deferred embedding column is only loaded when asked for."""
+    query = db.query(Image)
+    return query.options(undefer(Image._features)) if with_features else query
+
+
+def get(db: Session, image_id: int, with_features: bool = False) -> Optional[Image]:
+    """Get a single image by ID, optionally with its embedding loaded."""
+    return _query(db, with_features).filter(Image.id == image_id).first()
+
+
+async def get_file_info(db: AsyncSession, image_id: int) -> Optional[Tuple[str, str, str]]:
+    """Get (image_hash, filename, file_path) of an image without loading the full row."""
+    result = await db.execute(
+        select(Image.image_hash, Image.filename, Image.file_path).where(Image.id == image_id)
+    )
+    return result.first()
 
 
 def get_by_hash(db: Session, image_hash: str) -> Optional[Image]:
@@ -17,19 +45,78 @@ def get_by_hash(db: Session, image_hash: str) -> Optional[Image]:
     return db.query(Image).filter(Image.image_hash == image_hash).first()
 
 
+def get_by_hashes(db: Session, image_hashes: Iterable[str]) -> Dict[str, Image]:
+    """Get existing images for many file hashes with one query, keyed by hash."""
+    image_hashes = list(image_hashes)
+    if not image_hashes:
+        return {}
+    images = db.query(Image).filter(Image.image_hash.in_(image_hashes)).all()
+    return {image.image_hash: image for image in images}
+
+
 def get_multi(db: Session, skip: int = 0, limit: int = 100) -> List[Image]:
     """Get multiple images with pagination."""
     return db.query(Image).offset(skip).limit(limit).all()
 
 
-def get_all(db: Session) -> List[Image]:
-    """Get all images."""
-    return db.query(Image).all()
-
-
-def get_multi_by_ids(db: Session, image_ids: List[int]) -> List[Image]:
-    """Get multiple images by their IDs."""
-    return db.query(Image).filter(Image.id.in_(image_ids)).all()
+async def list_page(
+    db: AsyncSession,
+    *,
+    sort: str,
+    limit: int,
+    after: Optional[Tuple[datetime, int]] = None,
+    camera_make: Optional[str] = None,
+    camera_model: Optional[str] = None,
+    iso_min: Optional[int] = None,
+    iso_max: Optional[int] = None,
+    f_number_min: Optional[float] = None,
+    f_number_max: Optional[float] = None,
+    shot_after: Optional[datetime] = None,
+    shot_before: Optional[datetime] = None,
+    has_thumbnail: Optional[bool] = None,
+    quality_min: Optional[float] = None,
+    quality_max: Optional[float] = None,
+    rating_min: Optional[int] = None
+) -> List[Image]:
+    """
+    Get one page of images matching the filters (None means unfiltered), newest
+    first by (sort, id), starting after the given (sort value, id) key. Seeks
+    through the composite index instead of using OFFSET, so every page costs the
+    same. Images without a value for the sort column are not listed. Loads only
+    the columns ImageResponse needs.
+    """
+    sort_column = getattr(Image, sort)
+    # The sort column is loaded too, since the next page's cursor is built from it
+    statement = select(Image).options(load_only(*RESPONSE_COLUMNS, sort_column)).where(sort_column.isnot(None))
+
+    filters = [
+        (camera_make, lambda v: Image.camera_make == v),
+        (camera_model, lambda v: Image.camera_model == v),
+        (iso_min, lambda v: Image.iso >= v),
+        (iso_max, lambda v: Image.iso <= v),
+        (f_number_min, lambda v: Image.f_number >= v),
+        (f_number_max, lambda v: Image.f_number <= v),
+        (shot_after, lambda v: Image.shot_at >= v),
+        (shot_before, lambda v: Image.shot_at < v),
+        (has_thumbnail, lambda v: Image.has_thumbnail == v),
+        (quality_min, lambda v: Image.quality_score >= v),
+        (quality_max, lambda v: Image.quality_score <= v),
+        (rating_min, lambda v: Image.rating >= v),
+    ]
+    for value, condition in filters:
+        if value is not None:
+            statement = statement.where(condition(value))
+
+    if after is not None:
+        statement = statement.where(tuple_(sort_column, Image.id) < after)
+
+    statement = statement.order_by(sort_column.desc(), Image.id.desc()).limit(limit)
+    return list((await db.scalars(statement)).all())
+
+
+def get_multi_by_ids(db: Session, image_ids: List[int], with_features: bool = False) -> List[Image]:
+    """Get multiple images by their IDs, optionally with their embeddings loaded."""
+    return _query(db, with_features).filter(Image.id.in_(image_ids)).all()
 
 
 def create(db: Session, image_data: dict) -> Image:
@@ -41,6 +128,17 @@ def create(db: Session, image_data: dict) -> Image:
     return new_image
 
 
+def create_many(db: Session, images_data: List[dict]) -> List[Image]:
+    """
+    Insert many image records with a single multi-row INSERT ... RETURNING.
+    Does not commit; returned images are in the same order as images_data.
+    """
+    if not images_data:
+        return []
+    statement = insert(Image).returning(Image, sort_by_parameter_order=True)
+    return list(db.scalars(statement, images_data))
+
+
 def update(db: Session, image: Image, update_data: dict) -> Image:
     """Update an existing image record."""
     for key, value in update_data.items():
@@ -57,11 +155,34 @@ def remove(db: Session, image: Image):
     db.commit()
 
 
-def get_without_thumbnails(db: Session) -> List[Image]:
-    """Get all images that don't have thumbnails yet."""
-    return db.query(Image).filter(Image.has_thumbnail == False).all()
+def get_ids_without_thumbnails(db: Session) -> List[int]:
+    """Get the IDs of all images that don't have thumbnails yet."""
+    return [image_id for image_id, in db.query(Image.id).filter(Image.has_thumbnail == False)]
+
+
+def get_ids_without_embeddings(db: Session) -> List[int]:
+    """Get the IDs of all images that don't have feature embeddings yet."""
+    return [image_id for image_id, in db.query(Image.id).filter(Image._features.is_(None))]
+
+
+def get_features_by_ids(db: Session, image_ids: List[int]) -> List[Tuple[int, bytes]]:
+    """Get (id, raw feature bytes) pairs for the given images that have embeddings."""
+    return db.query(Image.id, Image._features).filter(
+        Image.id.in_(image_ids),
+        Image._features.isnot(None)
+    ).all()
 
 
-def get_without_embeddings(db: Session) -> List[Image]:
-    """Get all images that don't have feature embeddings yet."""
-    return db.query(Image).filter(Image._features.is_(None)).all()
+def iter_features(db: Session, chunk_size: int = 1000) -> Iterator[List[Tuple[int, bytes]]]:
+    """Stream (id, raw feature bytes) pairs for every embedded image in chunks."""
+    query = db.query(Image.id, Image._features).filter(
+        Image._features.isnot(None)
+    ).order_by(Image.id).execution_options(yield_per=chunk_size)
+    chunk = []
+    for image_id, features in query:
+        chunk.append((image_id, features))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
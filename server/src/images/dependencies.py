@@ -4,13 +4,11 @@ Reusable dependency functions for route validation.
 """
 from fastapi import Depends
 from sqlalchemy.orm import Session
-from pathlib import Path
 
 from database import get_db
 from src.images import crud
 from src.images.models import Image
-from src.images.exceptions import ImageNotFound, ImageFileNotFound, ThumbnailNotFound
-from config import THUMB_DIR
+from src.images.exceptions import ImageNotFound
 
 
 def get_image_or_404(image_id: int, db: Session = Depends(get_db)) -> Image:
@@ -23,26 +21,3 @@ def get_image_or_404(image_id: int, db: Session = Depends(get_db)) -> Image:
         raise ImageNotFound(image_id)
     return image
 
-
-def validate_image_file_exists(image: Image = Depends(get_image_or_404)) -> Image:
-    """
-    Dependency to validate that the image file exists on disk.
-    """
-    file_path = Path(image.file_path)
-    if not file_path.is_file():
-        raise ImageFileNotFound(f"Image file not found: {file_path}")
-    return image
-
-
-def validate_thumbnail_exists(image: Image = Depends(get_image_or_404)) -> Image:
-    """
-    Dependency to validate that the thumbnail exists.
-    """
-    if not image.has_thumbnail:
-        raise ThumbnailNotFound()
-    
-    thumbnail_path = THUMB_DIR / image.filename
-    if not thumbnail_path.is_file():
-        raise ImageFileNotFound(f"Thumbnail file not found on disk")
-    
-    return image
@@ -26,6 +26,31 @@ class ThumbnailNotFound(HTTPException):
         )
 
 
+class RenditionNotFound(HTTPException):
+    """Raised when a rendition size is not configured."""
+    def __init__(self, size: str):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown rendition size '{size}'")
+
+
+class InvalidVariantRequest(HTTPException):
+    """Raised when variant parameters don't describe an image that can be rendered."""
+    def __init__(self, detail: str):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class InvalidCursor(HTTPException):
+    """Raised when a listing cursor is malformed or was issued for another sort order."""
+    def __init__(self):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired cursor")
+
+
+class EmbeddingNotFound(HTTPException):
+    """Raised when an image has no feature embedding yet."""
+    def __init__(self, image_id: int = None):
+        detail = f"Image {image_id} has no embedding yet" if image_id else "Image has no embedding yet"
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
 class DuplicateImageError(HTTPException):
     """Raised when attempting to upload a duplicate image."""
     def __init__(self, existing_id: int):
@@ -35,6 +60,38 @@ class DuplicateImageError(HTTPException):
         )
 
 
+class ImageTooLarge(HTTPException):
+    """Raised when an uploaded file exceeds the maximum image size."""
+    def __init__(self, filename: str = None, max_bytes: int = None):
+        detail = f"'{filename}' exceeds" if filename else "Image exceeds"
+        detail += f" the maximum size of {max_bytes} bytes" if max_bytes else " the maximum size"
+        super().__init__(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+
+
+class ImportSourceNotAllowed(HTTPException):
+    """Raised when an import path lies outside the configured import roots."""
+    def __init__(self, path: str):
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Import path {path} is not below any configured IMPORT_ROOTS"
+        )
+
+
+class ImportSourceNotFound(HTTPException):
+    """Raised when an import path does not exist on the server."""
+    def __init__(self, path: str):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=f"Import path {path} not found")
+
+
+class InvalidImportSource(HTTPException):
+    """Raised when an import path is neither a directory nor a zip or tar archive."""
+    def __init__(self, path: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Import path {path} is not a directory or a zip or tar archive"
+        )
+
+
 class InvalidImageFormat(HTTPException):
     """Raised when an invalid image format is uploaded."""
     def __init__(self, format: str = None):
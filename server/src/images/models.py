@@ -2,9 +2,9 @@
 SQLAlchemy ORM model for Image entity.
 """
 import numpy as np
-from sqlalchemy import Column, Integer, String, LargeBinary, DateTime, Boolean, BigInteger, Float, Text
+from sqlalchemy import Column, Integer, String, LargeBinary, DateTime, Boolean, BigInteger, Float, Text, Index
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.sql import func
 from typing import TYPE_CHECKING
@@ -28,7 +28,8 @@ class Image(Base):
     file_size = Column(BigInteger)
     mime_type = Column(String(255))
     has_thumbnail = Column(Boolean, default=False)
-    _features = Column('features', LargeBinary, nullable=True)
+    # ~3 KB per row and only needed for embedding work; load with crud's with_features=True
+    _features = deferred(Column('features', LargeBinary, nullable=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Essential Attributes
@@ -82,4 +83,11 @@ class Image(Base):
         else:
             self._features = value.astype(np.float32).tobytes()
 
-    __table_args__ = {'schema': DB_SCHEMA}
+    # Keyset pagination walks these newest-first; see crud.list_page
+    __table_args__ = (
+        Index('ix_images_created_at_id', 'created_at', 'id'),
+        Index('ix_images_shot_at_id', 'shot_at', 'id'),
+        Index('ix_images_camera_shot_at_id', 'camera_make', 'camera_model', 'shot_at', 'id'),
+        Index('ix_images_quality_score', 'quality_score'),
+        {'schema': DB_SCHEMA},
+    )
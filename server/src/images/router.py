@@ -3,18 +3,36 @@ FastAPI router for Images domain.
 Defines all image-related API endpoints.
 """
 import logging
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query, Header, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from starlette.concurrency import run_in_threadpool
+from typing import Annotated, List, Optional
 from pathlib import Path
 
-from database import get_db
-from src.images import service, schemas
-from src.images.dependencies import get_image_or_404, validate_thumbnail_exists
+from database import get_db, get_async_db
+from src.images import service, schemas, crud
+from src.images.dependencies import get_image_or_404
 from src.images.models import Image
-from tasks import generate_thumbnail_task, generate_embedding_task
-from src.images.utils import get_file_response, queue_image_tasks
-from config import THUMB_DIR
+from src.jobs.schemas import JobResponse
+from task_queue import ingest_images_task, import_images_task, remove_from_similarity_index_task
+from src.images.exceptions import ThumbnailNotFound
+from src.images.utils import (
+    get_file_response,
+    queue_image_tasks,
+    content_etag,
+    etag_matches,
+    not_modified_response,
+)
+from src.images.constants import DEFAULT_VARIANT_FIT, NEXT_CURSOR_HEADER
+from utils.file_handling import (
+    thumbnail_path,
+    RENDITION_EXTENSION,
+    RENDITION_MEDIA_TYPE,
+    RENDITION_FORMATS,
+    RENDITION_FORMAT_NAME,
+)
+from config import RENDITION_SIZES, VARIANT_MAX_EDGE
 
 logger = logging.getLogger(__name__)
 
@@ -33,31 +51,161 @@ def upload_images(
         raise HTTPException(status_code=400, detail="No images were processed successfully.")
     
     new_images = [res for res in results if isinstance(res, Image)]
-    queue_image_tasks(
-        new_images,
-        generate_thumbnail_task,
-        generate_embedding_task
-    )
+    queue_image_tasks(new_images, ingest_images_task)
     
     return results
 
 
+@router.post(
+    "/import-jobs",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    operation_id="startImageImportJob"
+)
+def start_image_import_job(request: schemas.ImageImportRequest, db: Session = Depends(get_db)):
+    """
+    Queues an import of a server-local directory, zip or tar archive below IMPORT_ROOTS,
+    optionally adding every imported image to a batch. Follow progress at /jobs/{job_id}.
+    """
+    job = service.start_import_job(db, request)
+    import_images_task.delay(job.id)
+    return job
+
+
+@router.post("/exists", response_model=schemas.ImageHashCheckResponse, operation_id="checkImageHashes")
+def check_image_hashes(request: schemas.ImageHashCheckRequest, db: Session = Depends(get_db)):
+    """
+    Reports which SHA-256 content hashes are already stored, with their image IDs.
+    Clients upload only the missing files and add existing ones to batches by ID.
+    """
+    return service.check_existing_hashes(db, request.hashes)
+
+
 @router.get("/", response_model=List[schemas.ImageResponse], operation_id="getAllImages")
-def get_all_images(db: Session = Depends(get_db)):
-    """Get all images."""
-    return service.get_all(db)
+async def get_all_images(
+    response: Response,
+    params: Annotated[schemas.ImageListParams, Query()],
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Lists images newest first by created_at or shot_at, one page at a time.
+    Pass the X-Next-Cursor header of a response as `cursor` to get the next
+    page; the header is absent on the last page.
+    """
+    images, next_cursor = await service.list_images(db, params)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return images
 
 
 @router.get("/{image_id}", operation_id="getImageFile")
-def get_image_file(image: Image = Depends(get_image_or_404)):
-    """Returns the full-size image file."""
-    return get_file_response(Path(image.file_path), "Image")
+async def get_image_file(
+    image_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Returns the full-size image file with a content-hash ETag and immutable caching.
+    Supports Range requests; revalidation answers 304 without touching the disk.
+    """
+    info = await service.get_file_info(db, image_id)
+    etag = content_etag(info.image_hash)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    return get_file_response(Path(info.file_path), "Image", etag=etag)
+
+
+@router.get("/{image_id}/rendition/{size}", operation_id="getImageRendition")
+async def get_image_rendition(
+    image_id: int,
+    size: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Returns a downscaled rendition (e.g. grid, preview, large) with the same caching
+    as the original. Renditions missing on disk are generated on first request.
+    """
+    info = await service.get_file_info(db, image_id)
+    etag = content_etag(info.image_hash, f"{size}-{RENDITION_SIZES.get(size)}{RENDITION_EXTENSION}")
+    if size in RENDITION_SIZES and etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    return get_file_response(
+        await run_in_threadpool(service.get_rendition_file, info, size),
+        "Rendition",
+        etag=etag,
+        media_type=RENDITION_MEDIA_TYPE
+    )
+
+
+@router.get("/{image_id}/variant", operation_id="getImageVariant")
+async def get_image_variant(
+    image_id: int,
+    width: Optional[int] = Query(None, ge=1, le=VARIANT_MAX_EDGE),
+    height: Optional[int] = Query(None, ge=1, le=VARIANT_MAX_EDGE),
+    fit: str = DEFAULT_VARIANT_FIT,
+    format: str = RENDITION_FORMAT_NAME,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Returns the image resized to fit inside (fit=contain) or cropped to fill
+    (fit=cover) width x height, in the requested format. Images are never
+    upscaled. Variants are rendered on first request and kept in a size-bounded
+    disk cache.
+    """
+    service.validate_variant_request(width, height, fit, format)
+    info = await service.get_file_info(db, image_id)
+    _, extension, media_type = RENDITION_FORMATS[format]
+    etag = content_etag(info.image_hash, f"{width or 0}x{height or 0}-{fit}{extension}")
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    return get_file_response(
+        await run_in_threadpool(service.get_variant_file, info, width, height, fit, format),
+        "Variant",
+        etag=etag,
+        media_type=media_type
+    )
+
+
+@router.get("/{image_id}/similar", response_model=List[schemas.SimilarImageResponse], operation_id="getSimilarImages")
+def get_similar_images(
+    image_id: int,
+    k: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """Returns the k most visually similar images by CLIP embedding."""
+    return [
+        schemas.SimilarImageResponse(
+            id=image.id,
+            filename=image.filename,
+            original_filename=image.original_filename,
+            has_thumbnail=image.has_thumbnail,
+            similarity=similarity
+        )
+        for image, similarity in service.find_similar_images(db, image_id=image_id, k=k)
+    ]
 
 
 @router.get("/thumbnail/{image_id}", operation_id="getImageThumbnail")
-def get_thumbnail_file(image: Image = Depends(validate_thumbnail_exists)):
-    """Returns the thumbnail image file."""
-    return get_file_response(THUMB_DIR / image.filename, "Thumbnail")
+async def get_thumbnail_file(
+    image_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Returns the thumbnail image file with a content-hash ETag and immutable caching.
+    Revalidation answers 304 without touching the disk.
+    """
+    info = await service.get_file_info(db, image_id)
+    etag = content_etag(info.image_hash, "thumb")
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    
+    path = thumbnail_path(info)
+    if not path.is_file():
+        raise ThumbnailNotFound()
+    return get_file_response(path, "Thumbnail", etag=etag)
 
 
 @router.delete("/{image_id}", operation_id="deleteImage")
@@ -65,6 +213,7 @@ def delete_image(image_id: int, db: Session = Depends(get_db)):
     """Delete an image and its files."""
     try:
         service.delete_image_and_files(db=db, image_id=image_id)
+        remove_from_similarity_index_task.delay([image_id])
         return {"message": f"Image ID {image_id} and its files have been deleted."}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -117,24 +266,34 @@ def analyze_batch_quality(
     force_reanalyze: bool = False,
     db: Session = Depends(get_db)
 ):
-    """Analyze quality for multiple images at once."""
+    """Analyze quality for multiple images at once, scoring them in batched forward passes."""
+    try:
+        scores = service.analyze_images_quality(db, image_ids, metric, force_reanalyze)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error analyzing batch quality: {e}")
+        raise HTTPException(status_code=500, detail="Failed to analyze image quality")
+    
+    images_by_id = {image.id: image for image in crud.get_multi_by_ids(db, image_ids=list(scores))}
     results = []
     errors = []
     
     for image_id in image_ids:
-        try:
-            score = service.analyze_image_quality(db, image_id, metric, force_reanalyze)
-            image = service.get_by_id(db, image_id)
-            results.append(schemas.ImageQualityResponse(
-                image_id=image.id,
-                quality_score=score,
-                quality_metric=image.quality_metric,
-                analyzed_at=image.quality_analyzed_at,
-                file_name=image.original_filename
-            ))
-        except Exception as e:
-            errors.append(f"Image {image_id}: {str(e)}")
-            logger.error(f"Error analyzing image {image_id}: {e}")
+        if image_id not in scores:
+            errors.append(f"Image {image_id}: not found or could not be analyzed")
+            continue
+        image = images_by_id[image_id]
+        results.append(schemas.ImageQualityResponse(
+            image_id=image.id,
+            quality_score=scores[image_id],
+            quality_metric=image.quality_metric,
+            analyzed_at=image.quality_analyzed_at,
+            file_name=image.original_filename
+        ))
+    
+    if errors:
+        logger.error(f"Batch quality analysis errors: {'; '.join(errors)}")
     
     if errors and not results:
         raise HTTPException(
@@ -3,8 +3,10 @@ Pydantic schemas for Image domain.
 Defines request and response models for API validation.
 """
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict
-from typing import Optional, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Any, Literal
+
+from src.images.constants import MAX_HASH_CHECK, IMAGE_LIST_DEFAULT_LIMIT, IMAGE_LIST_MAX_LIMIT
 
 
 class ImageResponse(BaseModel):
@@ -22,6 +24,57 @@ class ImageResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ImageListParams(BaseModel):
+    """Query parameters of the image listing: sort order, page cursor and filters."""
+    sort: Literal['created_at', 'shot_at'] = 'created_at'
+    cursor: Optional[str] = None
+    limit: int = Field(IMAGE_LIST_DEFAULT_LIMIT, ge=1, le=IMAGE_LIST_MAX_LIMIT)
+    camera_make: Optional[str] = None
+    camera_model: Optional[str] = None
+    iso_min: Optional[int] = None
+    iso_max: Optional[int] = None
+    f_number_min: Optional[float] = None
+    f_number_max: Optional[float] = None
+    shot_after: Optional[datetime] = None
+    shot_before: Optional[datetime] = None
+    has_thumbnail: Optional[bool] = None
+    quality_min: Optional[float] = None
+    quality_max: Optional[float] = None
+    rating_min: Optional[int] = None
+
+
+class ImageHashCheckRequest(BaseModel):
+    """Request model for checking which content hashes are already stored."""
+    hashes: list[str] = Field(max_length=MAX_HASH_CHECK)
+
+
+class ImageImportRequest(BaseModel):
+    """Request model for importing a server-local directory or archive."""
+    path: str
+    batch_id: Optional[int] = None
+
+
+class ExistingImage(BaseModel):
+    """An already stored image matched by its content hash."""
+    image_hash: str
+    id: int
+
+
+class ImageHashCheckResponse(BaseModel):
+    """Which of the requested hashes are already stored and which still need uploading."""
+    existing: list[ExistingImage]
+    missing: list[str]
+
+
+class SimilarImageResponse(BaseModel):
+    """Schema for a nearest-neighbour match of an image."""
+    id: int
+    filename: str
+    original_filename: str
+    has_thumbnail: bool
+    similarity: float
+
+
 class Metadata(BaseModel):
     """Schema for detailed image metadata."""
     width: Optional[int] = None
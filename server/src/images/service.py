@@ -2,83 +2,580 @@
 Business logic for Images domain.
 Orchestrates operations between CRUD, file handling, and processing.
 """
+import base64
+import json
 import logging
+import mimetypes
+import tarfile
+import threading
+import zipfile
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 from datetime import datetime, timezone
+from pathlib import Path
 
 from src.images import crud, schemas
 from src.images.models import Image
-from src.images.exceptions import ImageNotFound
-from utils.file_handling import save_uploaded_file, _calculate_file_hash, delete_image_files
-from src.processing.metadata import extract_exif_data
+from src.images.constants import (
+    MAX_IMAGE_SIZE,
+    FILE_INFO_CACHE_SIZE,
+    IMPORT_CHUNK_SIZE,
+    IMPORT_PHASE_SCANNING,
+    IMPORT_PHASE_IMPORTING,
+    VARIANT_FITS,
+)
+from src.images.exceptions import (
+    ImageNotFound,
+    EmbeddingNotFound,
+    ImageTooLarge,
+    ImportSourceNotAllowed,
+    ImportSourceNotFound,
+    InvalidImportSource,
+    ImageFileNotFound,
+    RenditionNotFound,
+    InvalidVariantRequest,
+    InvalidCursor,
+)
+from src.images.utils import chunked
+from src.batches import crud as batch_crud
+from src.batches.exceptions import BatchNotFound
+from src.jobs import crud as job_crud
+from src.jobs.constants import JOB_KIND_IMAGE_IMPORT
+from src.jobs.models import Job
+from src.jobs.service import ProgressCallback
+from utils.file_handling import (
+    stream_upload_to_temp,
+    stream_to_temp,
+    commit_temp_file,
+    discard_temp_file,
+    delete_image_files,
+    hash_file,
+    store_local_file,
+    scan_image_files,
+    open_image_archive,
+    rendition_path,
+    create_renditions,
+    variant_path,
+    write_variant,
+    can_encode,
+    RENDITION_FORMATS,
+)
 from src.processing.quality import ImageQualityAnalyzer
+from src.processing.similarity import SimilarityIndex
+from utils.disk_cache import DiskLRUCache, RenderLocks
+from config import (
+    EMBEDDING_DIM,
+    SIMILARITY_INDEX_PATH,
+    SIMILARITY_INDEX_M,
+    SIMILARITY_INDEX_EF_CONSTRUCTION,
+    SIMILARITY_INDEX_EF_SEARCH,
+    SIMILARITY_INDEX_RELOAD_SECONDS,
+    SIMILARITY_INDEX_SAVE_EVERY,
+    SIMILARITY_INDEX_SAVE_SECONDS,
+    QUALITY_BATCH_SIZE,
+    IMPORT_ROOTS,
+    IMPORT_LINK_MODE,
+    IMPORT_HASH_WORKERS,
+    RENDITION_SIZES,
+    VARIANT_DIR,
+    VARIANT_CACHE_MB,
+)
 
 logger = logging.getLogger(__name__)
 
+# Shared per process; the index file itself is loaded lazily on first use
+similarity_index = SimilarityIndex(
+    SIMILARITY_INDEX_PATH,
+    dim=EMBEDDING_DIM,
+    m=SIMILARITY_INDEX_M,
+    ef_construction=SIMILARITY_INDEX_EF_CONSTRUCTION,
+    ef_search=SIMILARITY_INDEX_EF_SEARCH,
+    reload_interval=SIMILARITY_INDEX_RELOAD_SECONDS,
+    save_every=SIMILARITY_INDEX_SAVE_EVERY,
+    save_interval=SIMILARITY_INDEX_SAVE_SECONDS,
+)
+
+# Shared by every process serving variants from the same storage root
+variant_cache = DiskLRUCache(VARIANT_DIR, VARIANT_CACHE_MB * 1024 * 1024)
+
+# Renditions missing on request are generated once per image, however many requests wait
+rendition_render_locks = RenderLocks()
+
+
+
+class ImageFileInfo(NamedTuple):
+    """What serving an image's files needs: its id, content hash and storage names."""
+    id: int
+    image_hash: str
+    filename: str
+    file_path: str
+
+
+# Image files are immutable per id, so their lookup can be cached for the process lifetime
+_file_info_cache: "OrderedDict[int, ImageFileInfo]" = OrderedDict()
+_file_info_lock = threading.Lock()
+
+
+async def get_file_info(db: AsyncSession, image_id: int) -> ImageFileInfo:
+    """
+    Return the hash and storage location of an image, from the per-process LRU
+    cache when possible so repeat and conditional file requests skip the database.
+    
+    Raises:
+        ImageNotFound: If image doesn't exist
+    """
+    with _file_info_lock:
+        info = _file_info_cache.get(image_id)
+        if info is not None:
+            _file_info_cache.move_to_end(image_id)
+            return info
+    
+    row = await crud.get_file_info(db, image_id=image_id)
+    if row is None:
+        raise ImageNotFound(image_id)
+    info = ImageFileInfo(image_id, *row)
+    
+    with _file_info_lock:
+        _file_info_cache[image_id] = info
+        while len(_file_info_cache) > FILE_INFO_CACHE_SIZE:
+            _file_info_cache.popitem(last=False)
+    return info
+
+
+def clear_file_info_cache():
+    """Forget every cached file lookup, e.g. after all images were deleted."""
+    with _file_info_lock:
+        _file_info_cache.clear()
+
+
+def get_rendition_file(info: ImageFileInfo, size: str) -> Path:
+    """
+    Return the path of a named rendition, generating all renditions from the
+    original first if they don't exist yet (e.g. for images ingested earlier).
+    Concurrent requests for any rendition of the same image share one render.
+    
+    Raises:
+        RenditionNotFound: If size is not a configured rendition
+        ImageFileNotFound: If the rendition has to be made but the original is missing
+    """
+    if size not in RENDITION_SIZES:
+        raise RenditionNotFound(size)
+    
+    path = rendition_path(info, size)
+    if path.is_file():
+        return path
+    
+    with rendition_render_locks.hold(info.id):
+        # Another request may have rendered them while this one waited
+        if not path.is_file():
+            if not Path(info.file_path).is_file():
+                raise ImageFileNotFound(f"Image file not found: {info.file_path}")
+            create_renditions(info)
+    return path
+
+
+def validate_variant_request(width: Optional[int], height: Optional[int], fit: str, format: str):
+    """
+    Raises:
+        InvalidVariantRequest: If no dimension is given, "cover" lacks one, or fit or format is unknown
+    """
+    if not width and not height:
+        raise InvalidVariantRequest("At least one of width and height is required")
+    if fit not in VARIANT_FITS:
+        raise InvalidVariantRequest(f"Unknown fit '{fit}', expected one of {', '.join(VARIANT_FITS)}")
+    if fit == "cover" and not (width and height):
+        raise InvalidVariantRequest("fit=cover requires both width and height")
+    if not can_encode(format):
+        raise InvalidVariantRequest(f"Format '{format}' is not available, expected one of {', '.join(RENDITION_FORMATS)}")
+
+
+def get_variant_file(info: ImageFileInfo, width: Optional[int], height: Optional[int], fit: str, format: str) -> Path:
+    """
+    Return the path of an on-demand variant, rendering it into the disk cache on
+    first request. Concurrent requests for the same variant share one render.
+    
+    Parameters must already have passed validate_variant_request.
+    
+    Raises:
+        ImageFileNotFound: If the variant has to be rendered but the original is missing
+    """
+    path = variant_path(info, width, height, fit, format)
+    if not path.is_file() and not Path(info.file_path).is_file():
+        raise ImageFileNotFound(f"Image file not found: {info.file_path}")
+    return variant_cache.get_or_create(
+        path, lambda tmp_path: write_variant(info, tmp_path, width, height, fit, format)
+    )
+
 
 def process_new_uploads(
     db: Session,
     files: List[UploadFile]
 ) -> List[Union[Image, schemas.ImageResponse]]:
     """
-    Orchestrates the entire image upload process.
+    Orchestrates the entire image upload process as one bulk transaction.
+    
+    Every file is hashed while it is streamed to disk, duplicates are resolved
+    with a single query, new rows are inserted with one multi-row INSERT and
+    the session commits once. A row that cannot be inserted is retried on its
+    own savepoint so it does not take the rest of the upload down with it.
     
     Args:
         db: Database session
         files: List of uploaded files
         
     Returns:
-        List of created Image objects or ImageResponse schemas for duplicates
+        List of created Image objects or ImageResponse schemas for duplicates,
+        in upload order; files that could not be processed are left out
+        
+    Raises:
+        ImageTooLarge: If every file was rejected for exceeding MAX_IMAGE_SIZE
     """
-    results = []
+    staged = []
+    too_large = []
     
     for file in files:
         try:
-            # Calculate hash to check for duplicates
-            image_hash = _calculate_file_hash(file)
-            existing_image = crud.get_by_hash(db, image_hash=image_hash)
-
-            if existing_image:
-                logger.info(f"Duplicate found for '{file.filename}'. Matches ID: {existing_image.id}")
-                results.append(schemas.ImageResponse(
-                    id=existing_image.id,
-                    filename=existing_image.filename,
-                    original_filename=file.filename,
-                    file_path=existing_image.file_path,
-                    has_thumbnail=existing_image.has_thumbnail,
-                    is_duplicate=True,
-                    message=f"Duplicate of existing image ID: {existing_image.id}"
-                ))
-                continue
-
-            # Save file to disk
-            image_path, unique_filename = save_uploaded_file(file)
-            
-            # Extract metadata
-            metadata = extract_exif_data(str(image_path))
-            
-            # Prepare image data
-            image_data = {
-                "filename": unique_filename,
-                "original_filename": file.filename,
-                "file_path": str(image_path),
-                "file_size": image_path.stat().st_size,
-                "mime_type": file.content_type,
-                "image_hash": image_hash,
-                **metadata
-            }
-            
-            # Create database record
-            new_image = crud.create(db, image_data=image_data)
-            logger.info(f"Saved new file: {file.filename} as {unique_filename}")
-            results.append(new_image)
-            
+            # Single pass: hash while streaming to a temp file
+            tmp_path, image_hash, file_size = stream_upload_to_temp(file, MAX_IMAGE_SIZE)
+            staged.append((file.filename, file.content_type, tmp_path, image_hash, file_size))
+        except ImageTooLarge as e:
+            logger.warning(f"Rejected '{file.filename}': {e.detail}. Skipping.")
+            too_large.append(file.filename)
         except Exception as e:
             logger.error(f"Could not process file '{file.filename}'. Error: {e}. Skipping.")
+    
+    # Surface the size limit when it is the reason nothing was accepted
+    if not staged and too_large:
+        raise ImageTooLarge(too_large[0] if len(too_large) == 1 else None, MAX_IMAGE_SIZE)
+    
+    return register_staged_uploads(db, staged)
+
+
+def register_staged_uploads(
+    db: Session,
+    staged: List[Tuple[str, str, Path, str, int]],
+    commit: bool = True
+) -> List[Union[Image, schemas.ImageResponse]]:
+    """
+    Dedupes, stores and inserts uploads that were already written to temporary
+    files and hashed, with one hash lookup, one multi-row INSERT and one commit.
+    
+    Args:
+        db: Database session
+        staged: (original filename, MIME type, temp path, SHA-256 hash, size) per file
+        commit: Whether to commit; callers that pass False commit the new rows
+            together with their own changes
+        
+    Returns:
+        List of created Image objects or ImageResponse schemas for duplicates,
+        in staged order; files that could not be stored are left out
+    """
+    existing = crud.get_by_hashes(db, {image_hash for _, _, _, image_hash, _ in staged})
+    
+    pending = []
+    pending_hashes = set()
+    duplicates = []
+    for position, (original_filename, mime_type, tmp_path, image_hash, file_size) in enumerate(staged):
+        # Also catches the same file uploaded twice within this request
+        if image_hash in existing or image_hash in pending_hashes:
+            discard_temp_file(tmp_path)
+            duplicates.append((position, original_filename, image_hash))
+            continue
+        try:
+            # Move into place; metadata is filled in by the ingest task
+            image_path, stored_filename = commit_temp_file(tmp_path, image_hash, original_filename)
+        except Exception as e:
+            discard_temp_file(tmp_path)
+            logger.error(f"Could not process file '{original_filename}'. Error: {e}. Skipping.")
+            continue
+        pending_hashes.add(image_hash)
+        pending.append((position, original_filename, {
+            "filename": stored_filename,
+            "original_filename": original_filename,
+            "file_path": str(image_path),
+            "file_size": file_size,
+            "mime_type": mime_type,
+            "image_hash": image_hash,
+        }))
+    
+    created = _insert_images(db, pending)
+    if commit:
+        db.commit()
+    
+    # Rows that lost a race with a concurrent upload of the same content become duplicates
+    created_positions = {position for position, _ in created}
+    duplicates.extend(
+        (position, original_filename, data["image_hash"])
+        for position, original_filename, data in pending if position not in created_positions
+    )
+    
+    # Reload the committed rows in one query instead of one refresh per image
+    crud.get_multi_by_ids(db, image_ids=[image.id for _, image in created])
+    
+    by_hash = {**existing, **{image.image_hash: image for _, image in created}}
+    missing = [image_hash for _, _, image_hash in duplicates if image_hash not in by_hash]
+    by_hash.update(crud.get_by_hashes(db, missing))
+    
+    results = list(created)
+    for position, original_filename, image_hash in duplicates:
+        existing_image = by_hash.get(image_hash)
+        if existing_image is None:
+            logger.error(f"Could not process file '{original_filename}'. Error: original upload failed. Skipping.")
+            continue
+        logger.info(f"Duplicate found for '{original_filename}'. Matches ID: {existing_image.id}")
+        results.append((position, schemas.ImageResponse(
+            id=existing_image.id,
+            filename=existing_image.filename,
+            original_filename=original_filename,
+            file_path=existing_image.file_path,
+            has_thumbnail=existing_image.has_thumbnail,
+            is_duplicate=True,
+            message=f"Duplicate of existing image ID: {existing_image.id}"
+        )))
+    
+    results.sort(key=lambda item: item[0])
+    return [result for _, result in results]
+
+
+def _insert_images(db: Session, pending: List[Tuple[int, str, dict]]) -> List[Tuple[int, Image]]:
+    """
+    Inserts staged images in one statement, falling back to one savepoint per
+    row when the bulk insert fails. Files of rows that cannot be inserted are removed
+    unless another row already stores the same content.
+    """
+    if not pending:
+        return []
+    
+    try:
+        with db.begin_nested():
+            images = crud.create_many(db, [data for _, _, data in pending])
+        for (_, original_filename, data), image in zip(pending, images):
+            logger.info(f"Saved new file: {original_filename} as {data['filename']}")
+        return [(position, image) for (position, _, _), image in zip(pending, images)]
+    except Exception as e:
+        logger.warning(f"Bulk insert of {len(pending)} images failed, retrying row by row. Error: {e}")
+    
+    created = []
+    for position, original_filename, data in pending:
+        try:
+            with db.begin_nested():
+                image = crud.create_many(db, [data])[0]
+            created.append((position, image))
+            logger.info(f"Saved new file: {original_filename} as {data['filename']}")
+        except Exception as e:
+            # Content-addressed: the file belongs to whichever row stored this hash concurrently
+            if crud.get_by_hash(db, image_hash=data["image_hash"]) is None:
+                Path(data["file_path"]).unlink(missing_ok=True)
+            logger.error(f"Could not insert '{original_filename}'. Error: {e}")
+    return created
+
+
+def resolve_import_source(path: str) -> Path:
+    """
+    Resolves a server-local import path and checks it is an existing directory or
+    archive below one of the configured import roots.
+    
+    Raises:
+        ImportSourceNotAllowed: If the path is outside IMPORT_ROOTS (or none are configured)
+        ImportSourceNotFound: If the path does not exist
+        InvalidImportSource: If the path is a file that is not a zip or tar archive
+    """
+    source = Path(path).resolve()
+    if not any(source.is_relative_to(root) for root in IMPORT_ROOTS):
+        raise ImportSourceNotAllowed(path)
+    if not source.exists():
+        raise ImportSourceNotFound(path)
+    if not source.is_dir() and not (zipfile.is_zipfile(source) or tarfile.is_tarfile(source)):
+        raise InvalidImportSource(path)
+    return source
+
+
+def start_import_job(db: Session, request: schemas.ImageImportRequest) -> Job:
+    """Validate the import source and target batch and create a queued import job."""
+    source = resolve_import_source(request.path)
+    if request.batch_id is not None and not batch_crud.get(db, request.batch_id):
+        raise BatchNotFound(request.batch_id)
+    
+    return job_crud.create(
+        db,
+        kind=JOB_KIND_IMAGE_IMPORT,
+        params={"path": str(source), "batch_id": request.batch_id}
+    )
+
+
+def import_images(
+    db: Session,
+    source: Path,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """
+    Imports every image in a server-local directory or zip/tar archive.
+    
+    Files are hashed (directory files in a thread pool, archive members while
+    they are streamed out), known hashes are skipped and new files are
+    hardlinked or copied into storage. Rows are inserted in bulk and committed
+    every IMPORT_CHUNK_SIZE files, so an interrupted import keeps its progress.
+    
+    Returns:
+        Counts of found, imported, duplicate and skipped files, plus the ids of
+        all imported or already known images (image_ids) and of the new ones
+        (new_image_ids)
+    """
+    report = progress or (lambda phase, done, total: None)
+    stats = {"found": 0, "imported": 0, "duplicates": 0, "skipped": 0}
+    known = {}
+    new_image_ids = []
+    
+    def import_chunks(chunks, total):
+        done = 0
+        report(IMPORT_PHASE_IMPORTING, done, total)
+        for chunk_size, staged in chunks:
+            stats["skipped"] += chunk_size - len(staged)
+            new_ids, duplicates = _import_staged(db, staged, known)
+            new_image_ids.extend(new_ids)
+            stats["imported"] += len(new_ids)
+            stats["duplicates"] += duplicates
+            stats["skipped"] += len(staged) - len(new_ids) - duplicates
+            done += chunk_size
+            report(IMPORT_PHASE_IMPORTING, done, total)
+    
+    report(IMPORT_PHASE_SCANNING, 0, 1)
+    if source.is_dir():
+        paths = scan_image_files(source)
+        stats["found"] = len(paths)
+        report(IMPORT_PHASE_SCANNING, 1, 1)
+        
+        hardlink = IMPORT_LINK_MODE == "hardlink"
+        with ThreadPoolExecutor(max_workers=IMPORT_HASH_WORKERS) as pool:
+            import_chunks((
+                (len(chunk), [
+                    staged for staged in pool.map(lambda path: _stage_local_file(source, path, hardlink), chunk)
+                    if staged is not None
+                ])
+                for chunk in chunked(paths, IMPORT_CHUNK_SIZE)
+            ), len(paths))
+    else:
+        with open_image_archive(source) as members:
+            stats["found"] = len(members)
+            report(IMPORT_PHASE_SCANNING, 1, 1)
             
-    return results
+            import_chunks((
+                (len(chunk), [
+                    staged for staged in (_stage_archive_member(*member) for member in chunk)
+                    if staged is not None
+                ])
+                for chunk in chunked(members, IMPORT_CHUNK_SIZE)
+            ), len(members))
+    
+    logger.info(f"Imported {source}: {stats}")
+    return {**stats, "image_ids": list(known.values()), "new_image_ids": new_image_ids}
+
+
+def _stage_local_file(source: Path, path: Path, hardlink: bool):
+    """Hashes one file of an imported directory; returns None if it is skipped."""
+    name = str(path.relative_to(source))
+    try:
+        file_size = path.stat().st_size
+        if file_size > MAX_IMAGE_SIZE:
+            logger.warning(f"Skipping '{name}': larger than {MAX_IMAGE_SIZE} bytes")
+            return None
+        image_hash = hash_file(path)
+    except OSError as e:
+        logger.error(f"Could not read '{name}'. Error: {e}. Skipping.")
+        return None
+    return (
+        name, image_hash, file_size,
+        lambda: store_local_file(path, image_hash, hardlink=hardlink),
+        lambda: None
+    )
+
+
+def _stage_archive_member(name: str, file_size: int, open_member):
+    """Streams one archive member to a temporary file while hashing it; returns None if it is skipped."""
+    if file_size > MAX_IMAGE_SIZE:
+        logger.warning(f"Skipping '{name}': larger than {MAX_IMAGE_SIZE} bytes")
+        return None
+    try:
+        with open_member() as member:
+            tmp_path, image_hash, file_size = stream_to_temp(member, name, MAX_IMAGE_SIZE)
+    except Exception as e:
+        logger.error(f"Could not read '{name}'. Error: {e}. Skipping.")
+        return None
+    return (
+        name, image_hash, file_size,
+        lambda: commit_temp_file(tmp_path, image_hash, name),
+        lambda: discard_temp_file(tmp_path)
+    )
+
+
+def _import_staged(db: Session, staged: List[tuple], known: Dict[str, int]) -> Tuple[List[int], int]:
+    """
+    Stores and inserts one chunk of staged import files with a single hash lookup
+    and a single commit. Records every hash seen in known (hash -> image id).
+    
+    Returns:
+        IDs of the newly created images and the number of duplicates
+    """
+    existing = crud.get_by_hashes(db, {image_hash for _, image_hash, _, _, _ in staged if image_hash not in known})
+    known.update((image_hash, image.id) for image_hash, image in existing.items())
+    
+    pending = []
+    pending_hashes = set()
+    duplicates = 0
+    for position, (name, image_hash, file_size, store, discard) in enumerate(staged):
+        if image_hash in known or image_hash in pending_hashes:
+            discard()
+            duplicates += 1
+            continue
+        try:
+            image_path, stored_filename = store()
+        except Exception as e:
+            discard()
+            logger.error(f"Could not store '{name}'. Error: {e}. Skipping.")
+            continue
+        pending_hashes.add(image_hash)
+        pending.append((position, name, {
+            "filename": stored_filename,
+            "original_filename": name,
+            "file_path": str(image_path),
+            "file_size": file_size,
+            "mime_type": mimetypes.guess_type(name)[0],
+            "image_hash": image_hash,
+        }))
+    
+    created = _insert_images(db, pending)
+    if commit:
+        db.commit()
+    
+    for _, image in created:
+        known[image.image_hash] = image.id
+    # Rows that lost a race with a concurrent upload of the same content count as duplicates
+    lost = crud.get_by_hashes(db, pending_hashes - {image.image_hash for _, image in created})
+    known.update((image_hash, image.id) for image_hash, image in lost.items())
+    
+    return [image.id for _, image in created], duplicates + len(lost)
+
+
+def check_existing_hashes(db: Session, image_hashes: List[str]) -> schemas.ImageHashCheckResponse:
+    """
+    Splits SHA-256 content hashes into already stored images and hashes still to upload,
+    so clients can skip sending duplicates. Hashes are compared case-insensitively.
+    """
+    requested = list(dict.fromkeys(image_hash.strip().lower() for image_hash in image_hashes))
+    existing = crud.get_by_hashes(db, requested)
+    
+    return schemas.ImageHashCheckResponse(
+        existing=[
+            schemas.ExistingImage(image_hash=image_hash, id=existing[image_hash].id)
+            for image_hash in requested if image_hash in existing
+        ],
+        missing=[image_hash for image_hash in requested if image_hash not in existing]
+    )
 
 
 def delete_image_and_files(db: Session, image_id: int) -> Image:
@@ -104,6 +601,8 @@ def delete_image_and_files(db: Session, image_id: int) -> Image:
         raise IOError("Failed to delete image files from disk.")
         
     crud.remove(db, image=image)
+    with _file_info_lock:
+        _file_info_cache.pop(image_id, None)
     return image
 
 
@@ -155,6 +654,60 @@ def analyze_image_quality(
     return score
 
 
+def analyze_images_quality(
+    db: Session,
+    image_ids: List[int],
+    metric: str = 'clipiqa+',
+    force_reanalyze: bool = False
+) -> Dict[int, float]:
+    """
+    Analyze quality for many images with batched scoring and a single commit.
+    Cached scores for the same metric are reused unless force_reanalyze is set.
+    
+    Args:
+        db: Database session
+        image_ids: IDs of images to analyze
+        metric: PyIQA metric to use
+        force_reanalyze: If True, recalculate even if scores exist
+        
+    Returns:
+        Mapping of image ID to quality score; missing or unscorable images are absent
+        
+    Raises:
+        ValueError: If the metric is not supported
+    """
+    images = crud.get_multi_by_ids(db, image_ids=image_ids)
+    
+    scores = {}
+    to_analyze = []
+    for image in images:
+        if not force_reanalyze and image.quality_score is not None and image.quality_metric == metric:
+            scores[image.id] = image.quality_score
+        else:
+            to_analyze.append(image)
+    
+    if to_analyze:
+        logger.info(f"Analyzing quality for {len(to_analyze)} images with metric {metric}")
+        analyzer = ImageQualityAnalyzer(metric)
+        new_scores = analyzer.analyze_batch(
+            [image.file_path for image in to_analyze],
+            batch_size=QUALITY_BATCH_SIZE
+        )
+        
+        now = datetime.now(timezone.utc)
+        for image, score in zip(to_analyze, new_scores):
+            if score is None:
+                continue
+            image.quality_score = score
+            image.quality_metric = metric
+            image.quality_analyzed_at = now
+            scores[image.id] = score
+        
+        db.commit()
+    
+    return scores
+
+
 def get_by_id(db: Session, image_id: int) -> Image:
     """
     Get an image by ID.
@@ -175,14 +728,109 @@ def get_by_id(db: Session, image_id: int) -> Image:
     return image
 
 
-def get_all(db: Session) -> List[Image]:
+def _encode_cursor(sort: str, image: Image) -> str:
+    """Opaque cursor pointing just past an image in the given sort order."""
+    key = json.dumps([sort, getattr(image, sort).isoformat(), image.id])
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(sort: str, cursor: str) -> Tuple[datetime, int]:
+    """
+    Raises:
+        InvalidCursor: If the cursor is malformed or belongs to another sort order
     """
-    Get all images.
+    try:
+        cursor_sort, value, image_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if cursor_sort != sort:
+            raise ValueError(f"Cursor is for sort '{cursor_sort}'")
+        return datetime.fromisoformat(value), int(image_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor() from e
+
+
+async def list_images(db: AsyncSession, params: schemas.ImageListParams) -> Tuple[List[Image], Optional[str]]:
+    """
+    Get one page of images, newest first, and the cursor of the next page
+    (None on the last page).
+    
+    Raises:
+        InvalidCursor: If params.cursor can't be decoded
+    """
+    after = _decode_cursor(params.sort, params.cursor) if params.cursor else None
+    # One extra row tells whether another page follows
+    filters = params.model_dump(exclude={"sort", "cursor", "limit"})
+    images = await crud.list_page(db, sort=params.sort, limit=params.limit + 1, after=after, **filters)
+    if len(images) <= params.limit:
+        return images, None
+    images = images[:params.limit]
+    return images, _encode_cursor(params.sort, images[-1])
+
+
+def find_similar_images(db: Session, image_id: int, k: int = 10) -> List[Tuple[Image, float]]:
+    """
+    Find the k images whose embeddings are closest to the given image's.
     
     Args:
         db: Database session
+        image_id: ID of the query image
+        k: Number of neighbours to return
         
     Returns:
-        List of Image objects
+        List of (Image, cosine similarity) pairs, most similar first
+        
+    Raises:
+        ImageNotFound: If image doesn't exist
+        EmbeddingNotFound: If the image has no embedding yet
     """
-    return crud.get_all(db)
+    image = crud.get(db, image_id=image_id, with_features=True)
+    if not image:
+        raise ImageNotFound(image_id)
+    if image.features is None:
+        raise EmbeddingNotFound(image_id)
+
+    # One extra neighbour because the query image matches itself
+    matches = [
+        (match_id, similarity)
+        for match_id, similarity in similarity_index.query(image.features, k + 1)
+        if match_id != image_id
+    ][:k]
+
+    # Rows deleted since the index was last reloaded drop out here
+    images_by_id = {img.id: img for img in crud.get_multi_by_ids(db, [match_id for match_id, _ in matches])}
+    return [
+        (images_by_id[match_id], similarity)
+        for match_id, similarity in matches
+        if match_id in images_by_id
+    ]
+
+
+def add_to_similarity_index(db: Session, image_ids: List[int]) -> int:
+    """
+    Add the stored embeddings of the given images to the similarity index.
+    
+    Returns:
+        Number of vectors added
+    """
+    rows = crud.get_features_by_ids(db, image_ids=image_ids)
+    if rows:
+        similarity_index.add(
+            [image_id for image_id, _ in rows],
+            np.stack([np.frombuffer(features, dtype=np.float32) for _, features in rows])
+        )
+    return len(rows)
+
+
+def remove_from_similarity_index(image_ids: List[int]):
+    """Remove deleted images from the similarity index."""
+    similarity_index.remove(image_ids)
+
+
+def rebuild_similarity_index(db: Session):
+    """Rebuild the similarity index from every stored embedding."""
+    similarity_index.rebuild(
+        (
+            [image_id for image_id, _ in chunk],
+            np.stack([np.frombuffer(features, dtype=np.float32) for _, features in chunk])
+        )
+        for chunk in crud.iter_features(db)
+    )
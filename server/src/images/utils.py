@@ -2,32 +2,81 @@
 Utility functions for Images domain.
 """
 from pathlib import Path
+from fastapi import Response, status
 from fastapi.responses import FileResponse
-from typing import List
+from typing import Iterator, List, Optional, Sequence, TypeVar
 
 from src.images.models import Image
+from src.images.constants import IMMUTABLE_CACHE_CONTROL
 from src.images.exceptions import ImageFileNotFound
+from config import EMBEDDING_TASK_CHUNK_SIZE
 
+T = TypeVar("T")
 
-def get_file_response(file_path: Path, resource_name: str = "File") -> FileResponse:
+
+def get_file_response(
+    file_path: Path,
+    resource_name: str = "File",
+    etag: Optional[str] = None,
+    media_type: Optional[str] = None
+) -> FileResponse:
     """
     Return a file response or raise 404 if file doesn't exist.
+    With an etag, the response is marked immutable and Range requests can
+    be resumed with If-Range across processes.
     
     Args:
         file_path: Path to the file
         resource_name: Name of the resource for error message
+        etag: Strong validator for the file's content
+        media_type: Content type, if it can't be guessed from the extension
         
     Returns:
         FileResponse for the file
     """
     if not file_path.is_file():
         raise ImageFileNotFound(f"{resource_name} file not found on disk")
-    return FileResponse(file_path)
+    if etag is None:
+        return FileResponse(file_path, media_type=media_type)
+    return FileResponse(
+        file_path,
+        media_type=media_type,
+        headers={"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    )
+
+
+def content_etag(image_hash: str, variant: Optional[str] = None) -> str:
+    """Strong ETag derived from the content hash, distinct per derived variant."""
+    return f'"{image_hash}-{variant}"' if variant else f'"{image_hash}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag, as RFC 9110 requires."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in (candidate.removeprefix("W/") for candidate in candidates)
 
 
-def queue_image_tasks(images: List[Image], thumbnail_task, embedding_task):
-    """Queue Celery tasks for processing multiple images."""
-    for image in images:
-        thumbnail_task.delay(image.id)
-        embedding_task.delay(image.id)
+def not_modified_response(etag: str, cache_control: str = IMMUTABLE_CACHE_CONTROL) -> Response:
+    """A 304 response carrying the validator and caching policy of the full response."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control}
+    )
 
+
+def chunked(items: Sequence[T], size: int) -> Iterator[List[T]]:
+    """Split a sequence into consecutive lists of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
+
+
+def queue_image_tasks(images: List[Image], ingest_task):
+    """
+    Queue Celery tasks for processing multiple images.
+    Images are queued in chunks of ids so the worker decodes each original once
+    and runs the chunk through the model in batched forward passes.
+    """
+    for image_ids in chunked([image.id for image in images], EMBEDDING_TASK_CHUNK_SIZE):
+        ingest_task.delay(image_ids)
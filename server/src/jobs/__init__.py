@@ -0,0 +1,12 @@
+"""Jobs domain package."""
+from src.jobs import models, schemas, crud, service, exceptions, constants, dependencies
+
+__all__ = [
+    "models",
+    "schemas",
+    "crud",
+    "service",
+    "exceptions",
+    "constants",
+    "dependencies",
+]
@@ -0,0 +1,22 @@
+"""Constants for Jobs domain."""
+
+JOB_STATUS_QUEUED = 'queued'
+JOB_STATUS_RUNNING = 'running'
+JOB_STATUS_COMPLETED = 'completed'
+JOB_STATUS_FAILED = 'failed'
+
+TERMINAL_JOB_STATUSES = {
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED
+}
+
+JOB_KIND_BATCH_ANALYSIS = 'batch_analysis'
+JOB_KIND_IMAGE_IMPORT = 'image_import'
+
+# Minimum seconds between progress writes within a phase
+PROGRESS_WRITE_INTERVAL = 0.5
+
+# Server-sent events: how often the job row is polled, and how long a quiet
+# stream may go before a keep-alive comment is sent to proxies
+EVENTS_POLL_INTERVAL = 1.0
+EVENTS_KEEPALIVE_INTERVAL = 15.0
@@ -0,0 +1,20 @@
+"""CRUD operations for Jobs domain."""
+import uuid
+from sqlalchemy.orm import Session
+from src.jobs.models import Job
+from src.jobs.constants import JOB_STATUS_QUEUED
+from typing import Any, Dict, Optional
+
+
+def get(db: Session, job_id: str) -> Optional[Job]:
+    """Get job by ID."""
+    return db.query(Job).filter(Job.id == job_id).first()
+
+
+def create(db: Session, *, kind: str, params: Dict[str, Any]) -> Job:
+    """Create a new queued job."""
+    new_job = Job(id=str(uuid.uuid4()), kind=kind, params=params, status=JOB_STATUS_QUEUED, progress={})
+    db.add(new_job)
+    db.commit()
+    db.refresh(new_job)
+    return new_job
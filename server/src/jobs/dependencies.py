@@ -0,0 +1,15 @@
+"""FastAPI dependencies for Jobs domain."""
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from database import get_db
+from src.jobs import crud
+from src.jobs.models import Job
+from src.jobs.exceptions import JobNotFound
+
+
+def get_job_or_404(job_id: str, db: Session = Depends(get_db)) -> Job:
+    """Validate job exists and return it."""
+    job = crud.get(db, job_id=job_id)
+    if not job:
+        raise JobNotFound(job_id)
+    return job
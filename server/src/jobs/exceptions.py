@@ -0,0 +1,9 @@
+"""Domain-specific exceptions for Jobs."""
+from fastapi import HTTPException, status
+
+
+class JobNotFound(HTTPException):
+    """Raised when job is not found."""
+    def __init__(self, job_id: str = None):
+        detail = f"Job {job_id} not found" if job_id else "Job not found"
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
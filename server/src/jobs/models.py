@@ -0,0 +1,27 @@
+"""SQLAlchemy models for Jobs domain."""
+from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from database import Base
+from config import DB_SCHEMA
+from src.jobs.constants import JOB_STATUS_QUEUED
+
+
+class Job(Base):
+    """Background job with per-phase progress, observed by polling or event streams."""
+    __tablename__ = 'jobs'
+
+    id = Column(String(36), primary_key=True)
+    kind = Column(String(50), nullable=False)
+    status = Column(String(20), default=JOB_STATUS_QUEUED, nullable=False)
+    params = Column(JSONB)
+    phase = Column(String(50), nullable=True)
+    progress = Column(JSONB, nullable=True)
+    result = Column(JSONB, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = {'schema': DB_SCHEMA}
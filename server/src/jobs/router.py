@@ -0,0 +1,33 @@
+"""API router for Jobs domain."""
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from src.jobs import service
+from src.jobs.models import Job
+from src.jobs.schemas import JobResponse
+from src.jobs.exceptions import JobNotFound
+from src.jobs.dependencies import get_job_or_404
+
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+@router.get("/{job_id}", response_model=JobResponse, operation_id="getJob")
+def get_job(job: Job = Depends(get_job_or_404)):
+    """Returns the status and per-phase progress of a background job."""
+    return job
+
+
+@router.get("/{job_id}/events", operation_id="streamJobEvents")
+async def stream_job_events(job_id: str):
+    """Streams job progress as server-sent events until the job finishes."""
+    # Checked up front with a short-lived session, so the stream itself holds no connection
+    if await run_in_threadpool(service.get_job_snapshot, job_id) is None:
+        raise JobNotFound(job_id)
+
+    return StreamingResponse(
+        service.stream_job_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,27 @@
+"""Pydantic schemas for Jobs domain."""
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, Any
+
+
+class PhaseProgress(BaseModel):
+    """Completed and total work units of one job phase."""
+    done: int
+    total: int
+
+
+class JobResponse(BaseModel):
+    """Job status with per-phase progress."""
+    id: str
+    kind: str
+    status: str
+    params: Dict[str, Any] | None = None
+    phase: str | None = None
+    progress: Dict[str, PhaseProgress] | None = None
+    result: Dict[str, Any] | None = None
+    error: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
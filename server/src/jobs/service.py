@@ -0,0 +1,117 @@
+"""Business logic for Jobs domain."""
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from database import SessionLocal
+from src.jobs import crud
+from src.jobs.constants import (
+    JOB_STATUS_RUNNING,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    TERMINAL_JOB_STATUSES,
+    PROGRESS_WRITE_INTERVAL,
+    EVENTS_POLL_INTERVAL,
+    EVENTS_KEEPALIVE_INTERVAL,
+)
+from src.jobs.schemas import JobResponse
+
+logger = logging.getLogger(__name__)
+
+# Receives (phase, done, total) as a job advances
+ProgressCallback = Callable[[str, int, int], None]
+
+
+class JobReporter:
+    """
+    Records status and per-phase progress of a running job.
+    Every write uses its own short-lived session and commits immediately, so
+    pollers see progress without the job's own transaction being committed.
+    """
+
+    def __init__(self, job_id: str, min_interval: float = PROGRESS_WRITE_INTERVAL):
+        self.job_id = job_id
+        self.min_interval = min_interval
+        self._last_phase = None
+        self._last_write = 0.0
+
+    def _update(self, **fields):
+        """Apply field updates to the job row and commit."""
+        with SessionLocal() as db:
+            job = crud.get(db, job_id=self.job_id)
+            if not job:
+                logger.warning(f"Job {self.job_id} vanished while reporting progress")
+                return
+            for key, value in fields.items():
+                setattr(job, key, value)
+            db.commit()
+
+    def start(self):
+        """Mark the job as running."""
+        self._update(status=JOB_STATUS_RUNNING)
+
+    def progress(self, phase: str, done: int, total: int):
+        """
+        Record progress within a phase. Writes are throttled, except for phase
+        changes and phase completion, which are always recorded.
+        """
+        now = time.monotonic()
+        if phase == self._last_phase and done < total and now - self._last_write < self.min_interval:
+            return
+        self._last_phase, self._last_write = phase, now
+
+        with SessionLocal() as db:
+            job = crud.get(db, job_id=self.job_id)
+            if not job:
+                return
+            # Reassign rather than mutate so the JSONB change is detected
+            job.progress = {**(job.progress or {}), phase: {"done": done, "total": total}}
+            job.phase = phase
+            db.commit()
+
+    def complete(self, result: Optional[Dict[str, Any]] = None):
+        """Mark the job as completed with an optional result payload."""
+        self._update(status=JOB_STATUS_COMPLETED, result=result, finished_at=datetime.now(timezone.utc))
+
+    def fail(self, error: str):
+        """Mark the job as failed with an error message."""
+        self._update(status=JOB_STATUS_FAILED, error=error, finished_at=datetime.now(timezone.utc))
+
+
+def get_job_snapshot(job_id: str) -> Optional[JobResponse]:
+    """Read the current state of a job in a fresh session."""
+    with SessionLocal() as db:
+        job = crud.get(db, job_id=job_id)
+        return JobResponse.model_validate(job) if job else None
+
+
+async def stream_job_events(job_id: str) -> AsyncIterator[str]:
+    """
+    Yields server-sent events for a job: a 'progress' event whenever its state
+    changes, keep-alive comments while it is quiet, and ends after the final state.
+    """
+    last_payload = None
+    last_sent = time.monotonic()
+
+    while True:
+        snapshot = await run_in_threadpool(get_job_snapshot, job_id)
+        if snapshot is None:
+            yield "event: error\ndata: {\"detail\": \"Job not found\"}\n\n"
+            return
+
+        payload = snapshot.model_dump_json()
+        if payload != last_payload:
+            event = "done" if snapshot.status in TERMINAL_JOB_STATUSES else "progress"
+            yield f"event: {event}\ndata: {payload}\n\n"
+            last_payload, last_sent = payload, time.monotonic()
+        elif time.monotonic() - last_sent >= EVENTS_KEEPALIVE_INTERVAL:
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
+
+        if snapshot.status in TERMINAL_JOB_STATUSES:
+            return
+        await asyncio.sleep(EVENTS_POLL_INTERVAL)
@@ -1,10 +1,22 @@
-"""Processing domain package."""
-from src.processing import features, metadata, quality, clustering, constants
+"""
+Processing domain package.
+Submodules are imported on first attribute access, so importing one of them (e.g.
+metadata) doesn't pull torch, transformers, hdbscan or pyiqa into the API process.
+"""
+import importlib
 
 __all__ = [
     "features",
     "metadata",
     "quality",
     "clustering",
+    "decoding",
+    "similarity",
     "constants",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
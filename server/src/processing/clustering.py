@@ -1,28 +1,77 @@
 """Image clustering using HDBSCAN algorithm."""
 import numpy as np
-import hdbscan
 from typing import Dict
 
+from src.processing.constants import SCALABLE_CLUSTERING_THRESHOLD
+
 
 class ImageGrouper:
-    """Clusters image features using the HDBSCAN algorithm."""
-
-    def __init__(self, min_cluster_size: int = 5, min_samples: int = 5, metric: str = 'cosine'):
-        """Initializes the HDBSCAN model with specified parameters."""
-        self.clusterer = hdbscan.HDBSCAN(
-            min_cluster_size=min_cluster_size,
-            min_samples=min_samples,
-            metric=metric,
+    """
+    Clusters image features using the HDBSCAN algorithm.
+
+    Small batches use the exact 'generic' algorithm, which builds a dense n x n
+    distance matrix. From scalable_threshold samples upward the grouper switches to
+    Boruvka over a ball tree, which never materialises that matrix. Cosine distance
+    is not supported by the trees, so vectors are L2-normalised and clustered with
+    Euclidean distance instead: for unit vectors ||a - b||^2 = 2 - 2cos(a, b), so
+    neighbour ordering, and therefore the cluster hierarchy, is preserved.
+    """
+
+    def __init__(
+        self,
+        min_cluster_size: int = 5,
+        min_samples: int = 5,
+        metric: str = 'cosine',
+        scalable_threshold: int = SCALABLE_CLUSTERING_THRESHOLD
+    ):
+        """Stores the HDBSCAN parameters; the algorithm is chosen once the batch size is known."""
+        self.min_cluster_size = min_cluster_size
+        self.min_samples = min_samples
+        self.metric = metric
+        self.scalable_threshold = scalable_threshold
+        self.clusterer = None
+        self.algorithm_ = None
+        self.labels_ = None
+
+    def _build_clusterer(self, n_samples: int):
+        """Creates the HDBSCAN model suited to the number of samples."""
+        # Imported here so that importing this module stays cheap for the API process
+        import hdbscan
+
+        if n_samples < self.scalable_threshold:
+            self.algorithm_ = 'generic'
+            return hdbscan.HDBSCAN(
+                min_cluster_size=self.min_cluster_size,
+                min_samples=self.min_samples,
+                metric=self.metric,
+                allow_single_cluster=True,
+                algorithm='generic'
+            )
+
+        self.algorithm_ = 'boruvka_balltree'
+        return hdbscan.HDBSCAN(
+            min_cluster_size=self.min_cluster_size,
+            min_samples=self.min_samples,
+            metric='euclidean' if self.metric == 'cosine' else self.metric,
             allow_single_cluster=True,
-            algorithm='generic'
+            algorithm='boruvka_balltree',
+            core_dist_n_jobs=-1
         )
-        self.labels_ = None
 
     def fit_predict(self, features: np.ndarray) -> np.ndarray:
         """Fits the HDBSCAN model to the features and returns cluster labels."""
-        print(f"Clustering {features.shape[0]} images with HDBSCAN...")
-        features_64 = features.astype(np.float64)
-        self.labels_ = self.clusterer.fit_predict(features_64)
+        self.clusterer = self._build_clusterer(features.shape[0])
+        print(f"Clustering {features.shape[0]} images with HDBSCAN ({self.algorithm_})...")
+
+        if self.algorithm_ == 'generic':
+            data = features.astype(np.float64)
+        else:
+            data = features.astype(np.float32, copy=False)
+            if self.metric == 'cosine':
+                norms = np.linalg.norm(data, axis=1, keepdims=True)
+                data = data / np.maximum(norms, np.finfo(np.float32).tiny)
+
+        self.labels_ = self.clusterer.fit_predict(data)
         return self.labels_
 
     def get_cluster_stats(self) -> Dict:
@@ -13,6 +13,9 @@ DEFAULT_MIN_CLUSTER_SIZE = 5
 DEFAULT_MIN_SAMPLES = 5
 DEFAULT_CLUSTERING_METRIC = 'cosine'
 
+# Batches at least this large skip the O(n^2) generic HDBSCAN and use Boruvka on a ball tree
+SCALABLE_CLUSTERING_THRESHOLD = 2000
+
 # EXIF tags to extract
 EXIF_TAGS = [
     'DateTimeOriginal',
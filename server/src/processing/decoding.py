@@ -0,0 +1,73 @@
+"""Reduced-resolution image decoding for thumbnails and model inputs."""
+from pathlib import Path
+from PIL import Image
+
+# Shortest edge the feature extractors resize their inputs to
+MODEL_INPUT_SIZE = 224
+
+# libjpeg can scale in the DCT domain by 1/2, 1/4 and 1/8
+MAX_JPEG_DRAFT_FACTOR = 8
+
+# Modes Image.reduce() supports; anything else is converted before reducing
+REDUCIBLE_MODES = {"L", "LA", "La", "PA", "RGB", "RGBA", "RGBa", "RGBX", "CMYK", "I", "F"}
+
+
+def reduction_factor(size: tuple[int, int], min_long_edge: int, min_short_edge: int, max_factor: int | None = None) -> int:
+    """
+    Returns the largest power-of-two factor the image can be shrunk by while its
+    long and short edges stay at or above the requested minimums. Edges are never
+    reduced below one pixel, so minimums of 0 still terminate.
+    """
+    long_edge, short_edge = max(size), min(size)
+    min_long_edge, min_short_edge = max(min_long_edge, 1), max(min_short_edge, 1)
+    factor = 1
+    while (
+        (max_factor is None or factor * 2 <= max_factor)
+        and long_edge // (factor * 2) >= min_long_edge
+        and short_edge // (factor * 2) >= min_short_edge
+    ):
+        factor *= 2
+    return factor
+
+
+def _reducible_mode(img: Image.Image) -> str:
+    """Closest mode reduce() can work in: greyscale stays greyscale, transparency is kept."""
+    if img.mode == "1":
+        return "L"
+    if img.mode.startswith("I;16"):
+        return "I"
+    has_alpha = "A" in img.mode or "transparency" in img.info
+    return "RGBA" if has_alpha else "RGB"
+
+
+def decode_reduced(img: Image.Image, min_long_edge: int = 0, min_short_edge: int = 0) -> Image.Image:
+    """
+    Decodes an opened, not yet loaded image at the smallest power-of-two scale that
+    still covers the requested edge lengths. Edges are orientation-agnostic, so the
+    result can be EXIF-transposed afterwards.
+
+    JPEGs are decoded directly at the reduced scale through draft(), which skips most
+    of the pixel work; other formats are decoded in full and box-reduced with reduce().
+    Read metadata such as width/height before calling this, since draft() changes size.
+    """
+    if img.format == "JPEG":
+        factor = reduction_factor(img.size, min_long_edge, min_short_edge, MAX_JPEG_DRAFT_FACTOR)
+        if factor > 1:
+            width, height = img.size
+            img.draft("RGB", (-(-width // factor), -(-height // factor)))
+        img.load()
+        return img
+
+    factor = reduction_factor(img.size, min_long_edge, min_short_edge)
+    img.load()
+    if factor == 1:
+        return img
+    if img.mode not in REDUCIBLE_MODES:
+        # reduce() rejects palette, bilevel and 16-bit modes
+        img = img.convert(_reducible_mode(img))
+    return img.reduce(factor)
+
+
+def open_reduced(image_path: str | Path, min_long_edge: int = 0, min_short_edge: int = 0) -> Image.Image:
+    """Opens an image file and decodes it with decode_reduced; Pillow closes the file once loaded."""
+    return decode_reduced(Image.open(image_path), min_long_edge, min_short_edge)
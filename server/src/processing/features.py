@@ -1,13 +1,75 @@
 """Feature extraction for images using pre-trained models."""
+import os
+from abc import ABC, abstractmethod
 import numpy as np
-from PIL import Image
+from pathlib import Path
+from typing import List, Optional
+from PIL import Image, ImageOps
 import torch
 import torchvision.transforms as transforms
+from safetensors.torch import load_file, save_file
 from torchvision.models import resnet50, ResNet50_Weights
-from transformers import AutoImageProcessor, AutoModel, CLIPProcessor, CLIPModel
+from transformers import AutoImageProcessor, AutoModel, CLIPConfig, CLIPProcessor, CLIPModel
 
+from src.processing.decoding import MODEL_INPUT_SIZE, open_reduced
 
-class RESNET50:
+
+def _iter_image_batches(image_paths: List[str], batch_size: int):
+    """
+    Yields (indices, images) chunks of at most batch_size decoded RGB images.
+    Images are decoded at reduced resolution, just large enough for the model input,
+    and rotated upright from their EXIF orientation as the ingest path does.
+    Files that cannot be opened are reported and skipped, so their index never appears.
+    """
+    for start in range(0, len(image_paths), batch_size):
+        indices, images = [], []
+        for index in range(start, min(start + batch_size, len(image_paths))):
+            try:
+                decoded = open_reduced(image_paths[index], min_short_edge=MODEL_INPUT_SIZE)
+                images.append(ImageOps.exif_transpose(decoded).convert('RGB'))
+                indices.append(index)
+            except Exception as e:
+                print(f"Error processing {image_paths[index]}: {e}")
+        if images:
+            yield indices, images
+
+
+class _BatchedExtractor(ABC):
+    """Batching front-end shared by the extractors; subclasses implement _embed_batch."""
+
+    def get_embedding(self, image_path: str) -> np.ndarray:
+        """Extracts a feature vector from a single image file."""
+        return self.get_embeddings([image_path])[0]
+
+    def get_embeddings(self, image_paths: List[str], batch_size: int = 16) -> List[Optional[np.ndarray]]:
+        """Extracts feature vectors for many image files, batch_size images per forward pass."""
+        embeddings = [None] * len(image_paths)
+        for indices, images in _iter_image_batches(image_paths, batch_size):
+            self._fill_batch(embeddings, indices, images)
+        return embeddings
+
+    def get_image_embeddings(self, images: List[Image.Image], batch_size: int = 16) -> List[Optional[np.ndarray]]:
+        """Like get_embeddings, for images the caller has already decoded to RGB."""
+        embeddings = [None] * len(images)
+        for start in range(0, len(images), batch_size):
+            indices = list(range(start, min(start + batch_size, len(images))))
+            self._fill_batch(embeddings, indices, images[start:start + batch_size])
+        return embeddings
+
+    def _fill_batch(self, embeddings: list, indices: List[int], images: List[Image.Image]):
+        """Runs one forward pass and stores each vector at its index; a failed batch stays None."""
+        try:
+            for index, vector in zip(indices, self._embed_batch(images)):
+                embeddings[index] = vector
+        except Exception as e:
+            print(f"Error processing batch of {len(images)} images: {e}")
+
+    @abstractmethod
+    def _embed_batch(self, images: List[Image.Image]) -> np.ndarray:
+        """Returns one feature vector per image from a single forward pass."""
+
+
+class RESNET50(_BatchedExtractor):
     """Extracts deep features from images using a pre-trained ResNet50 model."""
 
     def __init__(self, device: str = 'cpu'):
@@ -24,20 +86,15 @@ class RESNET50:
             transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
         ])
 
-    def get_embedding(self, image_path: str) -> np.ndarray:
-        """Extracts a feature vector from a single image file."""
-        try:
-            image = Image.open(image_path).convert('RGB')
-            image_tensor = self.transform(image).unsqueeze(0).to(self.device)
-            with torch.no_grad():
-                features = self.model(image_tensor)
-                return features.squeeze().cpu().numpy()
-        except Exception as e:
-            print(f"Error processing {image_path}: {e}")
-            return None
+    def _embed_batch(self, images: List[Image.Image]) -> np.ndarray:
+        """Extracts one feature vector per image in a single forward pass."""
+        image_tensor = torch.stack([self.transform(image) for image in images]).to(self.device)
+        with torch.no_grad():
+            features = self.model(image_tensor).flatten(start_dim=1)
+        return features.cpu().numpy()
 
 
-class DINOV3:
+class DINOV3(_BatchedExtractor):
     """Extracts deep features from images using a pre-trained DINOv3 model."""
 
     def __init__(self, device: str = 'cpu'):
@@ -56,52 +113,78 @@ class DINOV3:
         self.device = self.model.device
         print(f"DINOv3 model loaded on device: {self.device}")
 
-    def get_embedding(self, image_path: str) -> np.ndarray:
-        """Extracts a feature vector from a single image file."""
-        try:
-            image = Image.open(image_path).convert('RGB')
-            
-            inputs = self.processor(images=image, return_tensors="pt").to(
-                self.device, dtype=torch.float16
-            )
-            
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                features = outputs.pooler_output
-                
-            return features.squeeze().cpu().float().numpy()
-        except Exception as e:
-            print(f"Error processing {image_path}: {e}")
-            return None
+    def _embed_batch(self, images: List[Image.Image]) -> np.ndarray:
+        """Extracts one feature vector per image in a single forward pass."""
+        inputs = self.processor(images=images, return_tensors="pt").to(
+            self.device, dtype=torch.float16
+        )
 
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+            features = outputs.pooler_output
 
-class CLIP:
+        return features.cpu().float().numpy()
+
+
+class CLIP(_BatchedExtractor):
     """Extracts deep features from images using OpenAI's CLIP model."""
 
-    def __init__(self, device: str = 'cpu'):
-        """Initializes the CLIP model and processor."""
+    def __init__(self, device: str = 'cpu', weights_path: Optional[str | Path] = None):
+        """
+        Initializes the CLIP model and processor.
+        If weights_path points to a safetensors export (see export_weights), the model
+        is bound to the memory-mapped file instead of loading a private copy.
+        """
         self.model_name = "openai/clip-vit-large-patch14"
         
         self.processor = CLIPProcessor.from_pretrained(self.model_name)
-        self.model = CLIPModel.from_pretrained(self.model_name)
+        if weights_path is not None:
+            self.model = self._load_mapped_model(weights_path)
+        else:
+            self.model = CLIPModel.from_pretrained(self.model_name)
         self.model.eval()
         self.model.to(device)
         
         self.device = device
         print(f"CLIP model loaded on device: {self.device}")
 
-    def get_embedding(self, image_path: str) -> np.ndarray:
-        """Extracts a feature vector from a single image file."""
-        try:
-            image = Image.open(image_path).convert('RGB')
-            
-            inputs = self.processor(images=image, return_tensors="pt").to(self.device)
-            
-            with torch.no_grad():
-                image_features = self.model.get_image_features(**inputs)
-                image_features = image_features / image_features.norm(dim=-1, keepdim=True)
-                
-            return image_features.squeeze().cpu().numpy()
-        except Exception as e:
-            print(f"Error processing {image_path}: {e}")
-            return None
+    def _embed_batch(self, images: List[Image.Image]) -> np.ndarray:
+        """Extracts one L2-normalised feature vector per image in a single forward pass."""
+        inputs = self.processor(images=images, return_tensors="pt").to(self.device)
+
+        with torch.no_grad():
+            image_features = self.model.get_image_features(**inputs)
+            image_features = image_features / image_features.norm(dim=-1, keepdim=True)
+
+        return image_features.cpu().numpy()
+
+    def export_weights(self, weights_path: str | Path):
+        """Writes every parameter and buffer to a safetensors file, atomically."""
+        weights_path = Path(weights_path)
+        weights_path.parent.mkdir(parents=True, exist_ok=True)
+        tensors = {
+            name: tensor.detach().cpu().contiguous()
+            for name, tensor in [*self.model.named_parameters(), *self.model.named_buffers()]
+        }
+        tmp_path = weights_path.with_name(f".{weights_path.name}.{os.getpid()}.tmp")
+        save_file(tensors, str(tmp_path))
+        os.replace(tmp_path, weights_path)
+
+    def _load_mapped_model(self, weights_path: str | Path) -> CLIPModel:
+        """
+        Builds the model skeleton on the meta device (no allocation, no random init)
+        and assigns tensors that safetensors maps straight from the file. The pages are
+        read-only and backed by the page cache, so every process mapping the same file
+        shares one copy of the weights.
+        """
+        tensors = load_file(str(weights_path))
+        with torch.device("meta"):
+            model = CLIPModel(CLIPConfig.from_pretrained(self.model_name))
+        model.load_state_dict(tensors, strict=False, assign=True)
+
+        # Non-persistent buffers are skipped by load_state_dict; bind them explicitly
+        for name, buffer in list(model.named_buffers()):
+            if buffer.is_meta:
+                module_name, _, buffer_name = name.rpartition('.')
+                model.get_submodule(module_name)._buffers[buffer_name] = tensors[name]
+        return model
@@ -24,9 +24,21 @@ def _sanitize_string(value: Union[str, bytes]) -> str:
 
 def extract_exif_data(image_path: str) -> Dict[str, Any]:
     """Extracts relevant EXIF metadata from an image file."""
+    try:
+        with Image.open(image_path) as img:
+            return extract_exif_from_image(img)
+    except Exception as e:
+        logger.warning(f"Could not read metadata for {image_path}: {e}")
+        return {}
+
+
+def extract_exif_from_image(img: Image.Image) -> Dict[str, Any]:
+    """
+    Extracts relevant EXIF metadata from an already opened image.
+    Only the header is read, so callers can decode the pixels afterwards.
+    """
     metadata = {}
     try:
-        img = Image.open(image_path)
         metadata['width'] = img.width
         metadata['height'] = img.height
 
@@ -60,6 +72,6 @@ def extract_exif_data(image_path: str) -> Dict[str, Any]:
                 metadata['focal_length'] = f"{int(value)}mm"
 
     except Exception as e:
-        logger.warning(f"Could not read metadata for {image_path}: {e}")
+        logger.warning(f"Could not read metadata for {getattr(img, 'filename', 'image')}: {e}")
     
     return metadata
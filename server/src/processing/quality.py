@@ -1,10 +1,105 @@
 """Image quality assessment using PyIQA metrics."""
 import logging
+import threading
+from collections import OrderedDict, defaultdict
 from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+from PIL import Image
+
+from config import QUALITY_MODEL_CACHE_MB, QUALITY_MAX_EDGE
+from src.processing.decoding import decode_reduced
 
 logger = logging.getLogger(__name__)
 
 
+class MetricRegistry:
+    """
+    Process-wide cache of loaded PyIQA metrics. Networks stay resident between calls
+    and are evicted least-recently-used once their combined size exceeds the budget.
+    The most recently requested metric is always kept, even if it alone is larger.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._metrics = OrderedDict()  # metric name -> (metric, size in bytes)
+        self._lock = threading.Lock()
+        # Per-metric load locks, so a slow load never blocks hits on resident metrics
+        self._load_locks = defaultdict(threading.Lock)
+
+    def get(self, metric_name: str):
+        """Return the loaded metric, creating it on first use."""
+        metric = self._lookup(metric_name)
+        if metric is not None:
+            return metric
+
+        with self._lock:
+            load_lock = self._load_locks[metric_name]
+        with load_lock:
+            # Another thread may have loaded it while this one waited
+            metric = self._lookup(metric_name)
+            if metric is not None:
+                return metric
+
+            metric = self._create(metric_name)
+            with self._lock:
+                self._metrics[metric_name] = (metric, _module_bytes(metric))
+                evicted = self._evict()
+        if evicted:
+            _release_cuda_cache()
+        return metric
+
+    def _lookup(self, metric_name: str):
+        """The resident metric, marked most recently used, or None."""
+        with self._lock:
+            if metric_name not in self._metrics:
+                return None
+            self._metrics.move_to_end(metric_name)
+            return self._metrics[metric_name][0]
+
+    def loaded(self) -> dict:
+        """Names of resident metrics mapped to their estimated size in bytes."""
+        with self._lock:
+            return {name: size for name, (_, size) in self._metrics.items()}
+
+    def _create(self, metric_name: str):
+        """Load a PyIQA metric on the best available device."""
+        import torch
+        import pyiqa
+
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        logger.info(f"Initializing {metric_name} on device: {device}")
+        metric = pyiqa.create_metric(metric_name, device=device)
+        logger.info(f"Successfully initialized {metric_name}")
+        return metric
+
+    def _evict(self) -> bool:
+        """Drop least recently used metrics until the cache fits the budget; True if any were."""
+        evicted = False
+        while len(self._metrics) > 1 and sum(size for _, size in self._metrics.values()) > self.max_bytes:
+            name, _ = self._metrics.popitem(last=False)
+            logger.info(f"Evicted quality metric {name} from cache")
+            evicted = True
+        return evicted
+
+
+def _release_cuda_cache():
+    """Return memory freed by evicted metrics to the GPU."""
+    import torch
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def _module_bytes(module) -> int:
+    """Estimate the memory held by a torch module's parameters and buffers."""
+    tensors = list(module.parameters()) + list(module.buffers())
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+metric_registry = MetricRegistry(max_bytes=QUALITY_MODEL_CACHE_MB * 1024 * 1024)
+
+
 class ImageQualityAnalyzer:
     """Analyzes image quality using PyIQA metrics."""
     
@@ -30,16 +125,9 @@ class ImageQualityAnalyzer:
         self._initialize_metric()
     
     def _initialize_metric(self):
-        """Lazy initialization of PyIQA metric."""
+        """Fetch the PyIQA metric from the process-wide registry, loading it on first use."""
         try:
-            import torch
-            import pyiqa
-            
-            device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-            logger.info(f"Initializing {self.metric_name} on device: {device}")
-            
-            self.metric = pyiqa.create_metric(self.metric_name, device=device)
-            logger.info(f"Successfully initialized {self.metric_name}")
+            self.metric = metric_registry.get(self.metric_name)
             
         except ImportError as e:
             logger.error(f"Failed to import PyIQA or torch: {e}")
@@ -51,8 +139,13 @@ class ImageQualityAnalyzer:
             logger.error(f"Failed to initialize metric {self.metric_name}: {e}")
             raise
     
-    def analyze(self, image_path: str | Path) -> float:
-        """Calculate quality score for an image."""
+    def analyze(self, image_path: str | Path, max_edge: int = QUALITY_MAX_EDGE) -> float:
+        """
+        Calculate quality score for an image, downscaled to max_edge exactly as
+        analyze_batch does, so scores from either path are comparable.
+        """
+        import torch
+
         image_path = Path(image_path)
         
         if not image_path.exists():
@@ -60,7 +153,10 @@ class ImageQualityAnalyzer:
         
         try:
             logger.info(f"Analyzing {image_path.name} with {self.metric_name}")
-            score = self.metric(str(image_path)).item()
+            with Image.open(image_path) as img:
+                size = _scoring_size(img.size, max_edge)
+            with torch.no_grad():
+                score = self.metric(_load_tensor(image_path, size).unsqueeze(0)).item()
             logger.info(f"Quality score for {image_path.name}: {score:.4f}")
             return float(score)
             
@@ -68,6 +164,52 @@ class ImageQualityAnalyzer:
             logger.error(f"Failed to analyze {image_path}: {e}")
             raise
     
+    def analyze_batch(
+        self,
+        image_paths: List[str | Path],
+        batch_size: int = 8,
+        max_edge: int = QUALITY_MAX_EDGE
+    ) -> List[Optional[float]]:
+        """
+        Calculate quality scores for many images, batch_size images per forward pass.
+
+        Images whose long edge exceeds max_edge are downscaled to it, as in analyze(),
+        so a batch of camera originals never stacks full-resolution tensors. Images are grouped by
+        that scoring size, which for large images depends only on the aspect ratio, and
+        only same-sized images are stacked; smaller images are scored as they are.
+        Returns one score per path, in order; None where an image could not be scored.
+        """
+        import torch
+
+        scores = [None] * len(image_paths)
+        buckets = defaultdict(list)
+        for index, image_path in enumerate(image_paths):
+            try:
+                with Image.open(image_path) as img:
+                    buckets[_scoring_size(img.size, max_edge)].append(index)
+            except Exception as e:
+                logger.error(f"Failed to read {image_path}: {e}")
+
+        for size, indices in buckets.items():
+            for start in range(0, len(indices), batch_size):
+                chunk = indices[start:start + batch_size]
+                try:
+                    batch = torch.stack([_load_tensor(image_paths[index], size) for index in chunk])
+                    with torch.no_grad():
+                        batch_scores = self.metric(batch).flatten().tolist()
+                    for index, score in zip(chunk, batch_scores):
+                        scores[index] = float(score)
+                except Exception as e:
+                    logger.error(f"Batch scoring failed for {len(chunk)} images of size {size}: {e}")
+                    for index in chunk:
+                        try:
+                            scores[index] = self.analyze(image_paths[index], max_edge)
+                        except Exception:
+                            pass
+
+        logger.info(f"Scored {sum(s is not None for s in scores)}/{len(image_paths)} images with {self.metric_name}")
+        return scores
+
     def get_metric_info(self) -> dict:
         """Get information about the current metric."""
         return {
@@ -79,3 +221,28 @@ class ImageQualityAnalyzer:
     def is_higher_better(cls, metric_name: str) -> bool:
         """Check if higher scores are better for a given metric."""
         return cls.SUPPORTED_METRICS.get(metric_name, {}).get('higher_is_better', True)
+
+
+def _scoring_size(size: tuple[int, int], max_edge: int) -> tuple[int, int]:
+    """Size an image is scored at: its own, or scaled so the long edge is max_edge."""
+    width, height = size
+    if max(width, height) <= max_edge:
+        return size
+    if width >= height:
+        return max_edge, max(1, round(max_edge * height / width))
+    return max(1, round(max_edge * width / height)), max_edge
+
+
+def _load_tensor(image_path: str | Path, size: tuple[int, int]):
+    """
+    Decode an image at the given size to a 3xHxW float tensor in [0, 1], as PyIQA
+    does for file paths.
+    """
+    import torch
+
+    with Image.open(image_path) as img:
+        img = decode_reduced(img, max(size), min(size)).convert('RGB')
+        if img.size != size:
+            img = img.resize(size, Image.Resampling.BICUBIC, reducing_gap=2.0)
+        pixels = np.asarray(img, dtype=np.float32) / 255.0
+    return torch.from_numpy(pixels).permute(2, 0, 1)
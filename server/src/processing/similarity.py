@@ -0,0 +1,257 @@
+"""Approximate nearest-neighbour search over image embeddings using an HNSW index."""
+import fcntl
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def _file_lock(lock_path: Path):
+    """Exclusive advisory lock shared by every process writing the index."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class SimilarityIndex:
+    """
+    HNSW index over L2-normalised embeddings, labelled by image id and persisted to
+    a single file. Readers reload the file when it changes on disk, building the new
+    index before swapping it in so queries never wait on a load. Changes are meant
+    to come from one long-lived writer process, which loads the file once, keeps the
+    index in memory and applies buffered additions and deletions to it every
+    save_every changes or save_interval seconds, replacing the file atomically. The
+    file lock only guards against a second writer, which then merges into the
+    latest copy.
+    """
+
+    def __init__(
+        self,
+        index_path: str | Path,
+        dim: int,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        initial_capacity: int = 10_000,
+        reload_interval: float = 30.0,
+        save_every: int = 1024,
+        save_interval: float = 60.0,
+    ):
+        """Configures the index; nothing is loaded until the first query or write."""
+        self.index_path = Path(index_path)
+        self.lock_path = self.index_path.with_name(f"{self.index_path.name}.lock")
+        self.dim = dim
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.initial_capacity = initial_capacity
+        self.reload_interval = reload_interval
+        self.save_every = save_every
+        self.save_interval = save_interval
+
+        self._index = None
+        self._loaded_mtime = None
+        self._checked_at = 0.0
+        # Guards the index reference and the pending changes; never held during I/O
+        self._lock = threading.Lock()
+        # Lets one query thread reload while the others keep using the current index
+        self._reload_lock = threading.Lock()
+        # Serialises flushes and rebuilds within this process
+        self._write_lock = threading.Lock()
+        # Pending changes by image id: a vector to add, or None to delete
+        self._pending: Dict[int, Optional[np.ndarray]] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def exists(self) -> bool:
+        """Whether a persisted index is present on disk."""
+        return self.index_path.is_file()
+
+    def query(self, vector: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        """Returns up to k (image_id, cosine similarity) pairs, most similar first."""
+        if time.monotonic() - self._checked_at >= self.reload_interval:
+            # Only the first query has to wait; later ones keep the index they have
+            if self._reload_lock.acquire(blocking=self._index is None):
+                try:
+                    self._refresh()
+                finally:
+                    self._reload_lock.release()
+        index = self._index
+
+        if index is None:
+            return []
+        k = min(k, index.get_current_count())
+        vector = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        while True:
+            if k == 0:
+                return []
+            try:
+                labels, distances = index.knn_query(vector, k=k)
+                break
+            except RuntimeError:
+                # Deleted vectors still count towards get_current_count, so a small
+                # index can hold fewer than k live ones
+                k -= 1
+        # Inner-product space reports 1 - <a, b>, i.e. cosine distance for unit vectors
+        return [(int(label), 1.0 - float(distance)) for label, distance in zip(labels[0], distances[0])]
+
+    def add(self, image_ids: Sequence[int], vectors: np.ndarray):
+        """Queues vectors to add (or replace) for the given image ids."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self._queue(dict(zip((int(image_id) for image_id in image_ids), vectors)))
+
+    def remove(self, image_ids: Sequence[int]):
+        """Queues the given image ids for deletion, so queries stop returning them."""
+        self._queue({int(image_id): None for image_id in image_ids})
+
+    def flush(self):
+        """
+        Persists every pending addition and deletion. The in-memory index is reused
+        as long as the file is the one this process last wrote.
+        """
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            if not pending:
+                return
+
+            try:
+                with _file_lock(self.lock_path):
+                    self._refresh()
+                    index = self._index or self._new_index(self.initial_capacity)
+                    added, deleted = self._apply(index, pending)
+                    self._save(index)
+            except Exception:
+                # Keep the changes for the next flush, behind any queued since
+                with self._lock:
+                    self._pending = {**pending, **self._pending}
+                raise
+            with self._lock:
+                self._index = index
+        logger.info(f"Saved similarity index: {added} vectors added, {deleted} removed")
+
+    def rebuild(self, batches):
+        """
+        Builds a fresh index from an iterable of (image_ids, vectors) batches and
+        atomically replaces the persisted one. Pending changes are dropped, since
+        the batches already reflect them.
+        """
+        with self._write_lock:
+            with self._lock:
+                self._pending = {}
+            with _file_lock(self.lock_path):
+                index = self._new_index(self.initial_capacity)
+                total = 0
+                for image_ids, vectors in batches:
+                    self._reserve(index, total + len(image_ids))
+                    index.add_items(np.asarray(vectors, dtype=np.float32), np.asarray(image_ids, dtype=np.int64))
+                    total += len(image_ids)
+                self._save(index)
+            with self._lock:
+                self._index = index
+        logger.info(f"Rebuilt similarity index with {total} vectors")
+
+    def _queue(self, changes: Dict[int, Optional[np.ndarray]]):
+        """Records changes and flushes once enough are pending or a timer fires."""
+        if not changes:
+            return
+        with self._lock:
+            self._pending.update(changes)
+            due = len(self._pending) >= self.save_every
+            if not due and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.save_interval, self._flush_on_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if due:
+            self.flush()
+
+    def _flush_on_timer(self):
+        """Timer callback; failures are logged and the changes retried on the next flush."""
+        with self._lock:
+            self._flush_timer = None
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Error saving similarity index: {e}")
+
+    def _apply(self, index, pending: Dict[int, Optional[np.ndarray]]) -> Tuple[int, int]:
+        """Adds and marks deleted the pending vectors in index; returns both counts."""
+        additions = {image_id: vector for image_id, vector in pending.items() if vector is not None}
+        if additions:
+            self._reserve(index, index.get_current_count() + len(additions))
+            index.add_items(np.stack(list(additions.values())), np.asarray(list(additions), dtype=np.int64))
+
+        deleted = 0
+        for image_id, vector in pending.items():
+            if vector is not None:
+                continue
+            try:
+                index.mark_deleted(image_id)
+                deleted += 1
+            except RuntimeError:
+                # Never indexed, or already deleted
+                pass
+        return len(additions), deleted
+
+    def _reserve(self, index, required: int):
+        """Grows index so it can hold at least required elements."""
+        if required > index.get_max_elements():
+            index.resize_index(max(required, 2 * index.get_max_elements()))
+
+    def _new_index(self, capacity: int):
+        """Creates an empty HNSW index in inner-product space."""
+        try:
+            import hnswlib
+        except ImportError:
+            raise ImportError(
+                "hnswlib is required for similarity search. "
+                "Install with: pip install hnswlib"
+            )
+        index = hnswlib.Index(space="ip", dim=self.dim)
+        index.init_index(max_elements=capacity, ef_construction=self.ef_construction, M=self.m)
+        index.set_ef(self.ef_search)
+        return index
+
+    def _refresh(self):
+        """
+        Loads the persisted index if this process has none yet or the file changed.
+        The load runs without holding _lock; only the swap does.
+        """
+        self._checked_at = time.monotonic()
+        try:
+            mtime = self.index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if self._index is not None and mtime == self._loaded_mtime:
+            return
+
+        import hnswlib
+        index = hnswlib.Index(space="ip", dim=self.dim)
+        index.load_index(str(self.index_path))
+        index.set_ef(self.ef_search)
+        with self._lock:
+            self._index, self._loaded_mtime = index, mtime
+        logger.info(f"Loaded similarity index with {index.get_current_count()} vectors")
+
+    def _save(self, index):
+        """Writes index next to its final path and renames it into place."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}.tmp")
+        index.save_index(str(tmp_path))
+        os.replace(tmp_path, self.index_path)
+        with self._lock:
+            self._loaded_mtime = self.index_path.stat().st_mtime_ns
@@ -0,0 +1,12 @@
+"""Uploads domain package: resumable, chunked uploads of single images."""
+from src.uploads import models, schemas, crud, service, exceptions, constants, dependencies
+
+__all__ = [
+    "models",
+    "schemas",
+    "crud",
+    "service",
+    "exceptions",
+    "constants",
+    "dependencies",
+]
@@ -0,0 +1,12 @@
+"""Constants for Uploads domain."""
+
+UPLOAD_STATUS_OPEN = 'open'
+UPLOAD_STATUS_COMPLETED = 'completed'
+
+# How often the API process deletes abandoned upload sessions and part files
+UPLOAD_SWEEP_INTERVAL_SECONDS = 3600
+
+# tus-style protocol headers and chunk media type
+UPLOAD_OFFSET_HEADER = 'Upload-Offset'
+UPLOAD_LENGTH_HEADER = 'Upload-Length'
+UPLOAD_CHUNK_CONTENT_TYPE = 'application/offset+octet-stream'
@@ -0,0 +1,62 @@
+"""CRUD operations for Uploads domain."""
+import uuid
+from datetime import datetime
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from src.uploads.models import UploadSession
+from src.uploads.constants import UPLOAD_STATUS_OPEN
+from typing import Collection, List, Optional
+
+
+def get(db: Session, upload_id: str) -> Optional[UploadSession]:
+    """Get upload session by ID."""
+    return db.query(UploadSession).filter(UploadSession.id == upload_id).first()
+
+
+def create(db: Session, *, filename: str, size: int, mime_type: Optional[str], batch_id: Optional[int]) -> UploadSession:
+    """Create a new open upload session."""
+    new_session = UploadSession(
+        id=str(uuid.uuid4()),
+        filename=filename,
+        size=size,
+        mime_type=mime_type,
+        batch_id=batch_id,
+        offset=0,
+        status=UPLOAD_STATUS_OPEN
+    )
+    db.add(new_session)
+    db.commit()
+    db.refresh(new_session)
+    return new_session
+
+
+def remove(db: Session, upload: UploadSession):
+    """Delete an upload session."""
+    db.delete(upload)
+    db.commit()
+
+
+def lock(db: Session, upload: UploadSession):
+    """
+    Lock an upload's row until the transaction ends and reload it, failing at once
+    with OperationalError if another transaction holds the lock.
+    """
+    db.query(UploadSession).filter(UploadSession.id == upload.id).with_for_update(nowait=True).populate_existing().one()
+
+
+def get_open_ids(db: Session, upload_ids: Collection[str]) -> List[str]:
+    """Get the ids among upload_ids of sessions that are still open."""
+    return list(db.scalars(
+        select(UploadSession.id).where(UploadSession.id.in_(upload_ids), UploadSession.status == UPLOAD_STATUS_OPEN)
+    ))
+
+
+def remove_stale(db: Session, before: datetime) -> List[str]:
+    """Delete open upload sessions not updated since before; returns their ids."""
+    upload_ids = list(db.scalars(
+        delete(UploadSession)
+        .where(UploadSession.status == UPLOAD_STATUS_OPEN, UploadSession.updated_at < before)
+        .returning(UploadSession.id)
+    ))
+    db.commit()
+    return upload_ids
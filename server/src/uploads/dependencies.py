@@ -0,0 +1,15 @@
+"""FastAPI dependencies for Uploads domain."""
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from database import get_db
+from src.uploads import crud
+from src.uploads.models import UploadSession
+from src.uploads.exceptions import UploadNotFound
+
+
+def get_upload_or_404(upload_id: str, db: Session = Depends(get_db)) -> UploadSession:
+    """Validate upload session exists and return it."""
+    upload = crud.get(db, upload_id=upload_id)
+    if not upload:
+        raise UploadNotFound(upload_id)
+    return upload
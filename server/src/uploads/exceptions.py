@@ -0,0 +1,79 @@
+"""Domain-specific exceptions for Uploads."""
+from fastapi import HTTPException, status
+
+
+class UploadNotFound(HTTPException):
+    """Raised when an upload session is not found."""
+    def __init__(self, upload_id: str = None):
+        detail = f"Upload {upload_id} not found" if upload_id else "Upload not found"
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+class UploadOffsetMismatch(HTTPException):
+    """Raised when a chunk does not start at the upload's current offset."""
+    def __init__(self, expected: int, received: int):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Chunk starts at offset {received}, but the upload is at offset {expected}",
+            headers={"Upload-Offset": str(expected)}
+        )
+
+
+class UploadLocked(HTTPException):
+    """Raised when another request is still writing to or finalizing the upload."""
+    def __init__(self, upload_id: str):
+        super().__init__(
+            status_code=status.HTTP_423_LOCKED,
+            detail=f"Upload {upload_id} is busy with another request; retry from its offset once that finishes"
+        )
+
+
+class UploadNotOpen(HTTPException):
+    """Raised when data is sent to an upload that was already finalized."""
+    def __init__(self, upload_id: str):
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=f"Upload {upload_id} is already finalized")
+
+
+class UploadIncomplete(HTTPException):
+    """Raised when finalizing an upload before all of its bytes have arrived."""
+    def __init__(self, offset: int, size: int):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Upload has {offset} of {size} bytes; send the rest before finalizing"
+        )
+
+
+class UploadImageGone(HTTPException):
+    """Raised when finalizing again after the image an upload created was deleted."""
+    def __init__(self, upload_id: str):
+        super().__init__(
+            status_code=status.HTTP_410_GONE,
+            detail=f"The image created by upload {upload_id} has been deleted"
+        )
+
+
+class UploadNotStored(HTTPException):
+    """Raised when a fully received upload could not be stored as an image."""
+    def __init__(self, upload_id: str):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Upload {upload_id} could not be stored as an image"
+        )
+
+
+class UploadLengthExceeded(HTTPException):
+    """Raised when a chunk would grow the upload past its declared size."""
+    def __init__(self, size: int):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Chunk exceeds the declared upload size of {size} bytes"
+        )
+
+
+class UnsupportedChunkType(HTTPException):
+    """Raised when a chunk is not sent as application/offset+octet-stream."""
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Chunks must be sent with Content-Type: application/offset+octet-stream"
+        )
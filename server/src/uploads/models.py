@@ -0,0 +1,25 @@
+"""SQLAlchemy models for Uploads domain."""
+from sqlalchemy import Column, String, BigInteger, Integer, DateTime, ForeignKey
+from sqlalchemy.sql import func
+
+from database import Base
+from config import DB_SCHEMA
+from src.uploads.constants import UPLOAD_STATUS_OPEN
+
+
+class UploadSession(Base):
+    """A resumable upload of one file, assembled chunk by chunk in a part file."""
+    __tablename__ = 'upload_sessions'
+
+    id = Column(String(36), primary_key=True)
+    filename = Column(String(1024), nullable=False)
+    mime_type = Column(String(255), nullable=True)
+    size = Column(BigInteger, nullable=False)
+    offset = Column(BigInteger, default=0, nullable=False)
+    status = Column(String(20), default=UPLOAD_STATUS_OPEN, nullable=False)
+    batch_id = Column(ForeignKey(f'{DB_SCHEMA}.image_batches.id', ondelete='SET NULL'), nullable=True)
+    image_id = Column(ForeignKey(f'{DB_SCHEMA}.images.id', ondelete='SET NULL'), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = {'schema': DB_SCHEMA}
@@ -0,0 +1,92 @@
+"""
+API router for Uploads domain.
+A tus-style resumable protocol: open a session, send chunks with PATCH at the
+current Upload-Offset (HEAD reports it after a dropped connection), then finalize.
+"""
+from fastapi import APIRouter, Depends, Header, Request, Response, status
+from sqlalchemy.orm import Session
+
+from database import get_db
+from src.uploads import service
+from src.uploads.models import UploadSession
+from src.uploads.schemas import UploadSessionCreate, UploadSessionResponse
+from src.uploads.dependencies import get_upload_or_404
+from src.uploads.exceptions import UnsupportedChunkType
+from src.uploads.constants import (
+    UPLOAD_OFFSET_HEADER,
+    UPLOAD_LENGTH_HEADER,
+    UPLOAD_CHUNK_CONTENT_TYPE,
+)
+from src.images.models import Image
+from src.images.schemas import ImageResponse
+from src.images.utils import queue_image_tasks
+from task_queue import ingest_images_task
+
+
+router = APIRouter(prefix="/uploads", tags=["Uploads"])
+
+
+def _offset_headers(upload: UploadSession) -> dict:
+    """Protocol headers describing how much of an upload has arrived."""
+    return {
+        UPLOAD_OFFSET_HEADER: str(upload.offset),
+        UPLOAD_LENGTH_HEADER: str(upload.size),
+        "Cache-Control": "no-store",
+    }
+
+
+@router.post("/", response_model=UploadSessionResponse, status_code=status.HTTP_201_CREATED, operation_id="openUpload")
+def open_upload(data: UploadSessionCreate, response: Response, db: Session = Depends(get_db)):
+    """Opens a resumable upload for one file of a declared size."""
+    upload = service.open_upload(db, data)
+    response.headers["Location"] = f"{router.prefix}/{upload.id}"
+    return upload
+
+
+@router.get("/{upload_id}", response_model=UploadSessionResponse, operation_id="getUpload")
+def get_upload(upload: UploadSession = Depends(get_upload_or_404)):
+    """Returns the state of an upload, including the offset to resume from."""
+    return upload
+
+
+@router.head("/{upload_id}", operation_id="getUploadOffset")
+def get_upload_offset(upload: UploadSession = Depends(get_upload_or_404)):
+    """Reports the offset to resume from in the Upload-Offset header."""
+    return Response(status_code=status.HTTP_204_NO_CONTENT, headers=_offset_headers(upload))
+
+
+@router.patch("/{upload_id}", status_code=status.HTTP_204_NO_CONTENT, operation_id="appendUploadChunk")
+async def append_upload_chunk(
+    request: Request,
+    upload_offset: int = Header(..., alias=UPLOAD_OFFSET_HEADER, ge=0),
+    content_type: str = Header(None),
+    upload: UploadSession = Depends(get_upload_or_404),
+    db: Session = Depends(get_db)
+):
+    """
+    Appends the request body at Upload-Offset, which must equal the upload's
+    current offset. Responds with the new offset.
+    """
+    if content_type != UPLOAD_CHUNK_CONTENT_TYPE:
+        raise UnsupportedChunkType()
+    await service.append_chunk(db, upload, upload_offset, request.stream())
+    return Response(status_code=status.HTTP_204_NO_CONTENT, headers=_offset_headers(upload))
+
+
+@router.post("/{upload_id}/finalize", response_model=ImageResponse, operation_id="finalizeUpload")
+def finalize_upload(upload: UploadSession = Depends(get_upload_or_404), db: Session = Depends(get_db)):
+    """
+    Registers a fully received upload as an image, or as a duplicate of an existing
+    one, and queues processing for new images.
+    """
+    result, finalized = service.finalize_upload(db, upload)
+    if isinstance(result, Image) and finalized:
+        queue_image_tasks([result], ingest_images_task)
+    return result
+
+
+@router.delete("/{upload_id}", status_code=status.HTTP_204_NO_CONTENT, operation_id="abortUpload")
+def abort_upload(upload: UploadSession = Depends(get_upload_or_404), db: Session = Depends(get_db)):
+    """Cancels an upload and discards the bytes received so far."""
+    service.abort_upload(db, upload)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,28 @@
+"""Pydantic schemas for Uploads domain."""
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+
+
+class UploadSessionCreate(BaseModel):
+    """Request model for opening a resumable upload."""
+    filename: str = Field(min_length=1, max_length=1024)
+    size: int = Field(gt=0)
+    mime_type: Optional[str] = None
+    batch_id: Optional[int] = None
+
+
+class UploadSessionResponse(BaseModel):
+    """State of a resumable upload; offset is where the next chunk must start."""
+    id: str
+    filename: str
+    mime_type: str | None = None
+    size: int
+    offset: int
+    status: str
+    batch_id: int | None = None
+    image_id: int | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
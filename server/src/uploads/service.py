@@ -0,0 +1,283 @@
+"""
+Business logic for Uploads domain.
+Chunks are appended to a part file in the incoming directory; finalizing hands
+the assembled file to the same hashing, dedupe and Image creation path as
+multipart uploads.
+"""
+import fcntl
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Tuple, Union
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from src.uploads import crud
+from src.uploads.models import UploadSession
+from src.uploads.schemas import UploadSessionCreate
+from src.uploads.constants import UPLOAD_STATUS_OPEN, UPLOAD_STATUS_COMPLETED
+from src.uploads.exceptions import (
+    UploadOffsetMismatch,
+    UploadLocked,
+    UploadNotOpen,
+    UploadIncomplete,
+    UploadImageGone,
+    UploadNotStored,
+    UploadLengthExceeded,
+)
+from src.images import crud as image_crud
+from src.images import service as image_service
+from src.images.constants import MAX_IMAGE_SIZE
+from src.images.exceptions import ImageTooLarge
+from src.images.models import Image
+from src.images.schemas import ImageResponse
+from src.batches import crud as batch_crud
+from src.batches.exceptions import BatchNotFound
+from utils.file_handling import INCOMING_DIR, hash_file, discard_temp_file
+from config import UPLOAD_SESSION_TTL_HOURS
+
+logger = logging.getLogger(__name__)
+
+
+def part_path(upload_id: str) -> Path:
+    """Location of the partially assembled file of an upload."""
+    return INCOMING_DIR / f"{upload_id}.upload"
+
+
+def open_upload(db: Session, data: UploadSessionCreate) -> UploadSession:
+    """
+    Create an upload session and its empty part file.
+
+    Raises:
+        ImageTooLarge: If the declared size exceeds MAX_IMAGE_SIZE
+        BatchNotFound: If the target batch doesn't exist
+    """
+    if data.size > MAX_IMAGE_SIZE:
+        raise ImageTooLarge(data.filename, MAX_IMAGE_SIZE)
+    if data.batch_id is not None and not batch_crud.get(db, data.batch_id):
+        raise BatchNotFound(data.batch_id)
+
+    upload = crud.create(db, filename=data.filename, size=data.size, mime_type=data.mime_type, batch_id=data.batch_id)
+    INCOMING_DIR.mkdir(parents=True, exist_ok=True)
+    part_path(upload.id).touch()
+    logger.info(f"Opened upload {upload.id} for '{upload.filename}' ({upload.size} bytes)")
+    return upload
+
+
+async def append_chunk(db: Session, upload: UploadSession, offset: int, chunks: AsyncIterator[bytes]) -> int:
+    """
+    Write a chunk that starts at the upload's current offset. Bytes that arrive
+    before the client disconnects are kept, so an interrupted chunk resumes at
+    the last byte that reached the disk. An exclusive lock on the part file keeps
+    concurrent chunks from interleaving; the row is only locked in two short
+    transactions that check the offset and then record the new one, so no
+    connection is held while the body streams in. File I/O runs in the
+    threadpool to keep the event loop free.
+
+    Returns:
+        The new offset
+
+    Raises:
+        UploadLocked: If another request is writing to the upload
+        UploadNotOpen: If the upload was already finalized
+        UploadOffsetMismatch: If offset is not the upload's current offset
+        UploadLengthExceeded: If the chunk runs past the declared size
+    """
+    upload_id = upload.id
+    try:
+        part = await run_in_threadpool(_lock_part, part_path(upload_id))
+    except FileNotFoundError:
+        raise UploadNotOpen(upload_id)
+
+    try:
+        size = await run_in_threadpool(_claim_offset, db, upload, offset)
+        await run_in_threadpool(_truncate_part, part, offset)
+        written = offset
+        try:
+            async for chunk in chunks:
+                if written + len(chunk) > size:
+                    raise UploadLengthExceeded(size)
+                await run_in_threadpool(part.write, chunk)
+                written += len(chunk)
+        finally:
+            await run_in_threadpool(_sync_part, part)
+            if written != offset:
+                await run_in_threadpool(_record_offset, db, upload, written)
+    finally:
+        # Also releases the file lock, after the new offset is committed
+        await run_in_threadpool(part.close)
+
+    return written
+
+
+def _lock_part(path: Path) -> BinaryIO:
+    """
+    Open a part file for writing and lock it exclusively.
+
+    Raises:
+        UploadLocked: If another request holds the lock
+        FileNotFoundError: If the part file is gone
+    """
+    part = open(path, "r+b")
+    try:
+        fcntl.flock(part, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        part.close()
+        raise UploadLocked(path.stem)
+    return part
+
+
+def _claim_offset(db: Session, upload: UploadSession, offset: int) -> int:
+    """
+    Check under a short row lock that the upload is open and at offset, then
+    commit to release the lock and the connection. Returns the declared size.
+    """
+    _lock_row(db, upload)
+    try:
+        if upload.status != UPLOAD_STATUS_OPEN:
+            raise UploadNotOpen(upload.id)
+        if offset != upload.offset:
+            raise UploadOffsetMismatch(upload.offset, offset)
+        return upload.size
+    finally:
+        db.commit()
+
+
+def _record_offset(db: Session, upload: UploadSession, offset: int):
+    """Commit the new offset of an upload in its own short transaction."""
+    _lock_row(db, upload)
+    upload.offset = offset
+    db.commit()
+
+
+def _lock_row(db: Session, upload: UploadSession):
+    """Lock and reload an upload's row, raising UploadLocked if another transaction holds it."""
+    try:
+        crud.lock(db, upload)
+    except OperationalError:
+        db.rollback()
+        raise UploadLocked(upload.id)
+
+
+def _truncate_part(part: BinaryIO, offset: int):
+    """Position a part file at offset, dropping anything an interrupted write left past it."""
+    part.seek(offset)
+    part.truncate()
+
+
+def _sync_part(part: BinaryIO):
+    """Flush a part file to disk."""
+    part.flush()
+    os.fsync(part.fileno())
+
+
+def finalize_upload(db: Session, upload: UploadSession) -> Tuple[Union[Image, ImageResponse], bool]:
+    """
+    Hash the assembled file and register it like a multipart upload: duplicates
+    resolve to the existing image, new content is moved into storage and gets an
+    Image row. The upload's row stays locked until the image and the completed
+    status are committed together, so concurrent calls finalize it only once.
+    Finalizing again returns the image already created.
+
+    Returns:
+        The image or duplicate response, and whether this call finalized the upload
+
+    Raises:
+        UploadLocked: If another request is writing to or finalizing the upload
+        UploadImageGone: If the upload was finalized but its image was deleted since
+        UploadIncomplete: If not all declared bytes have been received
+        UploadNotStored: If the received file could not be stored
+    """
+    _lock_row(db, upload)
+    try:
+        if upload.status == UPLOAD_STATUS_COMPLETED:
+            image = image_crud.get(db, image_id=upload.image_id) if upload.image_id is not None else None
+            if image is None:
+                raise UploadImageGone(upload.id)
+            return image, False
+        if upload.offset != upload.size:
+            raise UploadIncomplete(upload.offset, upload.size)
+
+        path = part_path(upload.id)
+        try:
+            image_hash = hash_file(path)
+        except FileNotFoundError:
+            raise UploadNotStored(upload.id)
+        staged = (upload.filename, upload.mime_type, path, image_hash, upload.size)
+        results = image_service.register_staged_uploads(db, [staged], commit=False)
+        if not results:
+            raise UploadNotStored(upload.id)
+        result = results[0]
+
+        if upload.batch_id is not None:
+            batch_crud.add_image_ids(db, batch_id=upload.batch_id, image_ids=[result.id])
+        upload.status = UPLOAD_STATUS_COMPLETED
+        upload.image_id = result.id
+        db.commit()
+    finally:
+        # Releases the row lock on the early returns and errors; a no-op after the commit
+        db.rollback()
+
+    logger.info(f"Finalized upload {upload.id} as image {result.id}")
+    return result, True
+
+
+def abort_upload(db: Session, upload: UploadSession):
+    """
+    Delete an upload session and whatever part of its file was received.
+
+    Raises:
+        UploadLocked: If a chunk is still being written to the upload
+    """
+    path = part_path(upload.id)
+    try:
+        part = _lock_part(path)
+    except FileNotFoundError:
+        part = None
+    try:
+        discard_temp_file(path)
+        crud.remove(db, upload=upload)
+    finally:
+        if part is not None:
+            part.close()
+
+
+def expire_stale_uploads(db: Session) -> int:
+    """
+    Delete open upload sessions with no activity for UPLOAD_SESSION_TTL_HOURS,
+    along with their part files, and any partial file in the incoming directory
+    that old without an open session (multipart uploads cut off by a crash,
+    sessions removed by a truncate).
+
+    Returns:
+        Number of files deleted
+    """
+    ttl = timedelta(hours=UPLOAD_SESSION_TTL_HOURS)
+    deleted = 0
+    for upload_id in crud.remove_stale(db, before=datetime.now(timezone.utc) - ttl):
+        discard_temp_file(part_path(upload_id))
+        deleted += 1
+        logger.info(f"Expired abandoned upload {upload_id}")
+
+    cutoff = time.time() - ttl.total_seconds()
+    orphans = {}
+    for path in INCOMING_DIR.glob("*"):
+        try:
+            if path.suffix in (".upload", ".part") and path.stat().st_mtime < cutoff:
+                orphans[path.stem] = path
+        except FileNotFoundError:
+            pass
+    # An idle session's file may be older than its last activity, e.g. after a rejected chunk
+    for upload_id in crud.get_open_ids(db, [stem for stem, path in orphans.items() if path.suffix == ".upload"]):
+        del orphans[upload_id]
+
+    for path in orphans.values():
+        discard_temp_file(path)
+        deleted += 1
+    if deleted:
+        logger.info(f"Deleted {deleted} abandoned partial uploads")
+    return deleted
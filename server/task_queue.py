@@ -0,0 +1,24 @@
+"""
+Celery application and task signatures used to enqueue background work.
+Producers such as the API only need to publish messages, so this module depends on
+Celery and config alone. The task bodies, and the ML libraries they need, live in
+tasks.py, which only workers import (celery -A tasks worker).
+"""
+from celery import Celery
+
+from config import CELERY_BROKER_URL, CELERY_TASK_CONFIG
+
+celery_app = Celery('tasks', broker=CELERY_BROKER_URL)
+celery_app.conf.update(**CELERY_TASK_CONFIG)
+
+# Signatures resolve to send_task by name when the task body isn't registered locally
+extract_metadata_task = celery_app.signature('tasks.extract_metadata_task')
+generate_thumbnail_task = celery_app.signature('tasks.generate_thumbnail_task')
+generate_embedding_task = celery_app.signature('tasks.generate_embedding_task')
+generate_embeddings_batch_task = celery_app.signature('tasks.generate_embeddings_batch_task')
+ingest_images_task = celery_app.signature('tasks.ingest_images_task')
+update_similarity_index_task = celery_app.signature('tasks.update_similarity_index_task')
+remove_from_similarity_index_task = celery_app.signature('tasks.remove_from_similarity_index_task')
+rebuild_similarity_index_task = celery_app.signature('tasks.rebuild_similarity_index_task')
+analyze_batch_task = celery_app.signature('tasks.analyze_batch_task')
+import_images_task = celery_app.signature('tasks.import_images_task')
@@ -1,22 +1,46 @@
 import logging
 import torch
-from celery import Celery
+from pathlib import Path
+from typing import List
+from celery.signals import worker_init, worker_process_shutdown, worker_shutdown
+from PIL import Image as PILImage, ImageOps
 from sqlalchemy.orm import Session
 
 from database import get_db
 from src.images import crud
+from src.images import service as image_service
 from src.images.models import Image
+from src.images.constants import IMPORT_CHUNK_SIZE, IMPORT_PHASE_ATTACHING
 from src.batches.models import ImageBatch, ImageBatchAssociation
-from utils.file_handling import create_thumbnail
+from src.batches import crud as batch_crud
+from src.batches import service as batch_service
+from src.batches.schemas import BatchAnalyze
+from src.batches.constants import BATCH_STATUS_ANALYZING, BATCH_STATUS_FAILED
+from src.jobs import crud as job_crud
+from src.jobs.service import JobReporter
+from utils.file_handling import (
+    create_thumbnail,
+    write_thumbnail,
+    thumbnail_path,
+    has_all_renditions,
+    create_renditions,
+    THUMB_LONG_EDGE,
+    THUMB_SHORT_EDGE,
+)
+from src.processing.decoding import MODEL_INPUT_SIZE, decode_reduced
+from src.images.utils import chunked
 from src.processing.features import CLIP
-from src.processing.metadata import extract_exif_data
-from config import CELERY_BROKER_URL, CELERY_TASK_CONFIG
+from src.processing.metadata import extract_exif_data, extract_exif_from_image
+from task_queue import celery_app
+from config import (
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_TASK_CHUNK_SIZE,
+    CLIP_WEIGHTS_MODE,
+    CLIP_SHARED_WEIGHTS_PATH,
+)
 
 logger = logging.getLogger(__name__)
 
-celery_app = Celery('tasks', broker=CELERY_BROKER_URL)
-celery_app.conf.update(**CELERY_TASK_CONFIG)
-
 # Global model cache - loaded once per worker process
 _clip_model_cache = None
 
@@ -24,12 +48,34 @@ def get_clip_model():
     """Get or initialize the CLIP model (singleton per worker process)."""
     global _clip_model_cache
     if _clip_model_cache is None:
-        device = 'cuda' if torch.cuda.is_available() else 'cpu'
-        logger.info(f"Loading CLIP model on device: {device}")
-        _clip_model_cache = CLIP(device=device)
+        if CLIP_WEIGHTS_MODE == "shared":
+            _clip_model_cache = _load_shared_clip_model()
+        else:
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            logger.info(f"Loading CLIP model on device: {device}")
+            _clip_model_cache = CLIP(device=device)
         logger.info("CLIP model loaded and cached")
     return _clip_model_cache
 
+
+def _load_shared_clip_model():
+    """Map the exported CLIP weights read-only, exporting them first if needed."""
+    if not CLIP_SHARED_WEIGHTS_PATH.is_file():
+        logger.info(f"Exporting CLIP weights to {CLIP_SHARED_WEIGHTS_PATH}")
+        CLIP(device='cpu').export_weights(CLIP_SHARED_WEIGHTS_PATH)
+    logger.info(f"Mapping shared CLIP weights from {CLIP_SHARED_WEIGHTS_PATH}")
+    return CLIP(device='cpu', weights_path=CLIP_SHARED_WEIGHTS_PATH)
+
+
+@worker_init.connect
+def preload_shared_clip_model(**kwargs):
+    """
+    Runs once in the worker parent before the pool forks. In shared mode the
+    mapped model is cached here, so recycled children inherit it instead of reloading.
+    """
+    if CLIP_WEIGHTS_MODE == "shared":
+        get_clip_model()
+
 @celery_app.task(bind=True, max_retries=3)
 def extract_metadata_task(self, image_id: int):
     logger.info(f"Metadata task started for image_id: {image_id}")
@@ -80,7 +126,7 @@ def generate_embedding_task(self, image_id: int):
     logger.info(f"Embedding task started for image_id: {image_id}")
     db: Session = next(get_db())
     try:
-        image = crud.get(db, image_id=image_id)
+        image = crud.get(db, image_id=image_id, with_features=True)
         if not image:
             logger.error(f"Image with id {image_id} not found")
             return
@@ -92,6 +138,7 @@ def generate_embedding_task(self, image_id: int):
                 image.features = features
                 db.commit()
                 logger.info(f"Embedding generated for image_id: {image_id}")
+                update_similarity_index_task.delay([image_id])
     except Exception as e:
         logger.error(f"Error generating embedding for image_id {image_id}: {e}")
         db.rollback()
@@ -99,3 +146,241 @@ def generate_embedding_task(self, image_id: int):
     finally:
         db.close()
 
+
+@celery_app.task(bind=True, max_retries=3)
+def generate_embeddings_batch_task(self, image_ids: List[int]):
+    """Embeds a chunk of images in batched forward passes and commits them together."""
+    logger.info(f"Batch embedding task started for {len(image_ids)} images")
+    db: Session = next(get_db())
+    try:
+        images = [
+            image for image in crud.get_multi_by_ids(db, image_ids=image_ids, with_features=True)
+            if image.features is None
+        ]
+        if not images:
+            logger.info("Batch embedding task: all images already have embeddings")
+            return
+
+        extractor = get_clip_model()
+        embeddings = extractor.get_embeddings(
+            [image.file_path for image in images],
+            batch_size=EMBEDDING_BATCH_SIZE
+        )
+
+        embedded_ids = []
+        for image, features in zip(images, embeddings):
+            if features is not None:
+                image.features = features
+                embedded_ids.append(image.id)
+
+        db.commit()
+        logger.info(f"Embeddings generated for {len(embedded_ids)}/{len(images)} images")
+        if embedded_ids:
+            update_similarity_index_task.delay(embedded_ids)
+    except Exception as e:
+        logger.error(f"Error generating embeddings for image_ids {image_ids}: {e}")
+        db.rollback()
+        raise self.retry(exc=e, countdown=60)
+    finally:
+        db.close()
+
+
+def _decode_and_fan_out(image: Image) -> PILImage.Image | None:
+    """
+    Opens the original once and fills in whatever the record is missing: metadata
+    from the header, then a single small decode shared by the thumbnail and the
+    embedding. Renditions, which need far more pixels, come from their own
+    reduced decode, so they never enlarge the shared one. Returns the decoded RGB
+    pixels if an embedding is still needed, else None.
+    """
+    needs_thumbnail = not image.has_thumbnail
+    needs_renditions = not has_all_renditions(image)
+    needs_embedding = image.features is None
+
+    with PILImage.open(image.file_path) as img:
+        if image.width is None:
+            for key, value in extract_exif_from_image(img).items():
+                setattr(image, key, value)
+
+        pixels = None
+        if needs_thumbnail or needs_embedding:
+            # One reduced-resolution decode that covers the thumbnail and the model input
+            decoded = decode_reduced(
+                img,
+                min_long_edge=THUMB_LONG_EDGE,
+                min_short_edge=max(THUMB_SHORT_EDGE, MODEL_INPUT_SIZE) if needs_embedding else THUMB_SHORT_EDGE,
+            )
+            pixels = ImageOps.exif_transpose(decoded).convert('RGB')
+
+    if needs_thumbnail:
+        write_thumbnail(pixels, thumbnail_path(image))
+        image.has_thumbnail = True
+
+    if needs_renditions:
+        create_renditions(image)
+
+    return pixels if needs_embedding else None
+
+
+@celery_app.task(bind=True, max_retries=3)
+def ingest_images_task(self, image_ids: List[int]):
+    """
+    Single-decode ingest stage: metadata, thumbnail and CLIP embedding for a chunk
+    of images, with every result committed in one transaction.
+    """
+    logger.info(f"Ingest task started for {len(image_ids)} images")
+    db: Session = next(get_db())
+    try:
+        images = crud.get_multi_by_ids(db, image_ids=image_ids, with_features=True)
+        embedded_ids = []
+
+        # Decode at most one forward pass worth of images at a time to bound memory
+        for image_chunk in chunked(images, EMBEDDING_BATCH_SIZE):
+            to_embed, pixels = [], []
+            for image in image_chunk:
+                try:
+                    decoded = _decode_and_fan_out(image)
+                except Exception as e:
+                    logger.error(f"Failed to decode image_id {image.id}: {e}")
+                    continue
+                if decoded is not None:
+                    to_embed.append(image)
+                    pixels.append(decoded)
+
+            if to_embed:
+                embeddings = get_clip_model().get_image_embeddings(pixels, batch_size=EMBEDDING_BATCH_SIZE)
+                for image, features in zip(to_embed, embeddings):
+                    if features is not None:
+                        image.features = features
+                        embedded_ids.append(image.id)
+
+        db.commit()
+        logger.info(f"Ingested {len(images)} images ({len(embedded_ids)} new embeddings)")
+        if embedded_ids:
+            update_similarity_index_task.delay(embedded_ids)
+    except Exception as e:
+        logger.error(f"Error ingesting image_ids {image_ids}: {e}")
+        db.rollback()
+        raise self.retry(exc=e, countdown=60)
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, max_retries=3)
+def update_similarity_index_task(self, image_ids: List[int]):
+    """Adds freshly stored embeddings to the persisted similarity index."""
+    db: Session = next(get_db())
+    try:
+        added = image_service.add_to_similarity_index(db, image_ids=image_ids)
+        logger.info(f"Similarity index updated with {added} embeddings")
+    except Exception as e:
+        logger.error(f"Error updating similarity index for image_ids {image_ids}: {e}")
+        raise self.retry(exc=e, countdown=60)
+    finally:
+        db.close()
+
+
+@celery_app.task
+def remove_from_similarity_index_task(image_ids: List[int]):
+    """Removes deleted images from the persisted similarity index."""
+    image_service.remove_from_similarity_index(image_ids)
+
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def save_similarity_index(**kwargs):
+    """Persists index changes still buffered when the index worker exits."""
+    image_service.similarity_index.flush()
+
+
+@celery_app.task(bind=True, max_retries=1)
+def rebuild_similarity_index_task(self):
+    """Rebuilds the similarity index from every stored embedding."""
+    logger.info("Similarity index rebuild started")
+    db: Session = next(get_db())
+    try:
+        image_service.rebuild_similarity_index(db)
+    except Exception as e:
+        logger.error(f"Error rebuilding similarity index: {e}")
+        raise self.retry(exc=e, countdown=300)
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True)
+def analyze_batch_task(self, job_id: str):
+    """Runs a queued batch analysis job, recording per-phase progress on the job."""
+    logger.info(f"Batch analysis job started: {job_id}")
+    reporter = JobReporter(job_id)
+    db: Session = next(get_db())
+    batch_id = None
+    try:
+        job = job_crud.get(db, job_id=job_id)
+        if not job:
+            logger.error(f"Job {job_id} not found")
+            return
+
+        job_params = dict(job.params)
+        batch_id = job_params.pop("batch_id")
+        reporter.start()
+
+        batch = batch_service.analyze_batch(
+            db,
+            batch_id=batch_id,
+            params=BatchAnalyze(**job_params),
+            progress=reporter.progress
+        )
+        groups = {assoc.group_label for assoc in batch.image_associations}
+        reporter.complete(result={"batch_id": batch_id, "group_count": len(groups - {"Ungrouped"})})
+        logger.info(f"Batch analysis job finished: {job_id}")
+    except Exception as e:
+        logger.error(f"Batch analysis job {job_id} failed: {e}")
+        db.rollback()
+        if batch_id is not None:
+            batch = batch_crud.get(db, batch_id)
+            if batch and batch.status == BATCH_STATUS_ANALYZING:
+                batch.status = BATCH_STATUS_FAILED
+                db.commit()
+        reporter.fail(getattr(e, "detail", None) or str(e))
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True)
+def import_images_task(self, job_id: str):
+    """
+    Runs a queued server-local import job: stores and registers new images,
+    optionally adds every imported image to a batch, then queues ingestion.
+    """
+    logger.info(f"Image import job started: {job_id}")
+    reporter = JobReporter(job_id)
+    db: Session = next(get_db())
+    try:
+        job = job_crud.get(db, job_id=job_id)
+        if not job:
+            logger.error(f"Job {job_id} not found")
+            return
+
+        reporter.start()
+        result = image_service.import_images(db, Path(job.params["path"]), progress=reporter.progress)
+        image_ids = result.pop("image_ids")
+        new_image_ids = result.pop("new_image_ids")
+
+        batch_id = job.params.get("batch_id")
+        if batch_id is not None:
+            for done, id_chunk in enumerate(chunked(image_ids, IMPORT_CHUNK_SIZE), start=1):
+                batch_crud.add_image_ids(db, batch_id=batch_id, image_ids=id_chunk)
+                reporter.progress(IMPORT_PHASE_ATTACHING, min(done * IMPORT_CHUNK_SIZE, len(image_ids)), len(image_ids))
+            db.commit()
+
+        for id_chunk in chunked(new_image_ids, EMBEDDING_TASK_CHUNK_SIZE):
+            ingest_images_task.delay(id_chunk)
+
+        reporter.complete(result={**result, "batch_id": batch_id})
+        logger.info(f"Image import job finished: {job_id}")
+    except Exception as e:
+        logger.error(f"Image import job {job_id} failed: {e}")
+        db.rollback()
+        reporter.fail(getattr(e, "detail", None) or str(e))
+    finally:
+        db.close()
@@ -0,0 +1,50 @@
+"""decode_reduced must shrink every mode Pillow can open, not only RGB and L."""
+import io
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from src.processing.decoding import decode_reduced, reduction_factor
+from utils.file_handling import write_variant
+
+
+def _encoded(mode: str, size=(2000, 1500), format="PNG") -> Image.Image:
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, format)
+    buffer.seek(0)
+    return Image.open(buffer)
+
+
+@pytest.mark.parametrize("mode", ["P", "1", "I;16", "RGB", "L"])
+def test_decode_reduced_handles_mode(mode):
+    img = decode_reduced(_encoded(mode), min_long_edge=400)
+    assert 400 <= max(img.size) < 1000
+
+
+def test_decode_reduced_keeps_palette_transparency():
+    source = Image.new("P", (2000, 1500))
+    source.info["transparency"] = 0
+    buffer = io.BytesIO()
+    source.save(buffer, "PNG")
+    buffer.seek(0)
+    assert decode_reduced(Image.open(buffer), min_long_edge=400).mode == "RGBA"
+
+
+def test_decode_reduced_gif():
+    assert max(decode_reduced(_encoded("P", format="GIF"), min_long_edge=400).size) < 1000
+
+
+@pytest.mark.parametrize("mode", ["P", "1"])
+def test_write_variant_handles_mode(tmp_path, mode):
+    source = tmp_path / "source.png"
+    Image.new(mode, (2000, 1500)).save(source)
+    target = tmp_path / "variant.webp"
+    write_variant(SimpleNamespace(file_path=str(source)), target, 300, None, "contain", "webp")
+    with Image.open(target) as variant:
+        assert variant.size == (300, 225)
+
+
+def test_reduction_factor_without_minimums_stops_at_one_pixel():
+    assert reduction_factor((2000, 1500), 0, 0) == 1024
+    assert reduction_factor((1, 1), 0, 0) == 1
@@ -0,0 +1,155 @@
+"""
+Size-bounded least-recently-used cache of generated files on disk.
+Recency is the file's mtime, which every hit refreshes, so the cache survives
+restarts and is shared by every process pointing at the same directory.
+"""
+import os
+import logging
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Eviction trims the cache to this fraction of its budget, so it does not run on every write
+EVICTION_TARGET_RATIO = 0.9
+
+
+class RenderLocks:
+    """
+    Per-key locks for generating files on demand: concurrent requests for the same
+    missing file in one process wait for a single render instead of repeating it.
+    Callers check for the file again once they hold the lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Render lock and number of waiting requests per key being generated
+        self._pending: Dict[Hashable, List] = {}
+
+    @contextmanager
+    def hold(self, key: Hashable) -> Iterator[None]:
+        """Holds the render lock for key, dropping it once no request waits on it."""
+        with self._lock:
+            entry = self._pending.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._pending[key]
+
+
+class DiskLRUCache:
+    """
+    Files below a root directory, created on first request and evicted oldest-first
+    once their total size exceeds max_bytes. Concurrent requests for the same
+    missing file in one process wait for a single render instead of repeating it;
+    across processes, renders are written to a temporary file and renamed into
+    place, so readers only ever see complete files.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int):
+        """Configures the cache; the directory is scanned lazily on the first write."""
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+        self._size: Optional[int] = None
+        # Guards _size only; directory scans run under _scan_lock instead
+        self._lock = threading.Lock()
+        self._scan_lock = threading.Lock()
+        self._render_locks = RenderLocks()
+
+    def get_or_create(self, path: Path, render: Callable[[Path], None]) -> Path:
+        """
+        Returns path, calling render(tmp_path) to produce it first if it isn't
+        cached. render writes the complete file to tmp_path, which is then renamed
+        to path.
+        """
+        if self._touch(path):
+            return path
+
+        with self._render_locks.hold(path):
+            # Another request may have rendered it while this one waited
+            if not self._touch(path):
+                self._render(path, render)
+        return path
+
+    def _touch(self, path: Path) -> bool:
+        """Marks a cached file as recently used; returns False if it isn't cached."""
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _render(self, path: Path, render: Callable[[Path], None]):
+        """Renders into a temporary file next to path and renames it into place."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            render(tmp_path)
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        with self._lock:
+            if self._size is not None:
+                self._size += size
+            needs_scan = self._size is None or self._size > self.max_bytes
+        # One thread scans at a time; others carry on, the scan covers their files too
+        if needs_scan and self._scan_lock.acquire(blocking=False):
+            try:
+                self._scan(keep=path)
+            finally:
+                self._scan_lock.release()
+
+    def _files(self) -> List[tuple[Path, os.stat_result]]:
+        """(path, stat) of every cached file, skipping renders still in progress."""
+        files = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.startswith("."):
+                    continue
+                file_path = Path(dirpath, filename)
+                try:
+                    files.append((file_path, file_path.stat()))
+                except FileNotFoundError:
+                    pass
+        return files
+
+    def _scan(self, keep: Path):
+        """
+        Walks the cache to measure it, evicting if it is over budget. Rescanning
+        also picks up files written or removed by other processes.
+        """
+        files = self._files()
+        total = sum(stat.st_size for _, stat in files)
+        if total > self.max_bytes:
+            total = self._evict(files, total, keep)
+        with self._lock:
+            self._size = total
+
+    def _evict(self, files: List[tuple[Path, os.stat_result]], total: int, keep: Path) -> int:
+        """
+        Deletes the least recently used files until the cache is back under its
+        target size; returns the size that remains.
+        """
+        target = self.max_bytes * EVICTION_TARGET_RATIO
+        evicted = 0
+        for file_path, stat in sorted(files, key=lambda item: item[1].st_mtime_ns):
+            if total <= target:
+                break
+            if file_path == keep:
+                continue
+            file_path.unlink(missing_ok=True)
+            total -= stat.st_size
+            evicted += 1
+        logger.info(f"Evicted {evicted} files from {self.root}, {total} bytes remain")
+        return total
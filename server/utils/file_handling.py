@@ -2,56 +2,274 @@
 Handles all file system operations like saving, deleting, and thumbnailing images.
 This module is decoupled from the database and business logic.
 """
+import os
 import shutil
+import tarfile
 import uuid
 import logging
 import hashlib
-from pathlib import Path
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Callable, Iterator, List
 from fastapi import UploadFile
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, features
 
 from src.images.models import Image as ImageModel
-from config import IMAGE_DIR, THUMB_DIR, THUMB_SIZES
+from src.images.constants import ALLOWED_IMAGE_EXTENSIONS
+from src.images.exceptions import ImageTooLarge
+from src.processing.decoding import decode_reduced
+from config import (
+    IMAGE_DIR,
+    THUMB_DIR,
+    THUMB_SIZES,
+    RENDITION_DIR,
+    RENDITION_SIZES,
+    RENDITION_FORMAT,
+    RENDITION_QUALITY,
+    VARIANT_DIR,
+)
 
 logger = logging.getLogger(__name__)
 
+# Edge lengths a decoded image needs to cover to produce a full-quality thumbnail
+THUMB_LONG_EDGE = max(THUMB_SIZES["landscape"].values())
+THUMB_SHORT_EDGE = min(THUMB_SIZES["landscape"].values())
+
+# Pillow format, file extension and media type per rendition format
+RENDITION_FORMATS = {
+    "jpeg": ("JPEG", ".jpg", "image/jpeg"),
+    "webp": ("WEBP", ".webp", "image/webp"),
+    "avif": ("AVIF", ".avif", "image/avif"),
+}
+
+def can_encode(name: str) -> bool:
+    """Whether name is a rendition format this Pillow build can write."""
+    if name == "jpeg":
+        return True
+    try:
+        return name in RENDITION_FORMATS and features.check(name)
+    except ValueError:
+        # Pillow versions without an AVIF plugin don't know the feature name
+        return False
+
+def _supported_rendition_format(name: str) -> str:
+    """Returns the configured rendition format if Pillow can encode it, else jpeg."""
+    if not can_encode(name):
+        logger.warning(f"Rendition format '{name}' is not available, using jpeg")
+        return "jpeg"
+    return name
+
+RENDITION_FORMAT_NAME = _supported_rendition_format(RENDITION_FORMAT)
+RENDITION_PIL_FORMAT, RENDITION_EXTENSION, RENDITION_MEDIA_TYPE = RENDITION_FORMATS[RENDITION_FORMAT_NAME]
+RENDITION_LONG_EDGE = max(RENDITION_SIZES.values())
+
+# Uploads are staged on the same filesystem as IMAGE_DIR so they can be renamed into place
+INCOMING_DIR = IMAGE_DIR / ".incoming"
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 def setup_directories():
     """Creates the necessary asset directories if they don't exist."""
     IMAGE_DIR.mkdir(parents=True, exist_ok=True)
     THUMB_DIR.mkdir(parents=True, exist_ok=True)
+    RENDITION_DIR.mkdir(parents=True, exist_ok=True)
+    VARIANT_DIR.mkdir(parents=True, exist_ok=True)
+
+def clear_directory(root: Path) -> int:
+    """Deletes every file below root, including shard directories, and returns the file count."""
+    deleted = 0
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        for filename in filenames:
+            Path(dirpath, filename).unlink()
+            deleted += 1
+        for dirname in dirnames:
+            Path(dirpath, dirname).rmdir()
+    return deleted
 
-def _calculate_file_hash(file: UploadFile) -> str:
+def content_filename(image_hash: str, original_filename: str) -> str:
+    """Names a stored file after its SHA-256 hash, keeping the original extension."""
+    return f"{image_hash}{Path(original_filename).suffix.lower()}"
+
+def shard_path(root: Path, filename: str) -> Path:
     """
-    Calculates the SHA-256 hash of a file in chunks to handle large files efficiently.
-    Resets the file pointer to the beginning after reading.
+    Places a file under two levels of fan-out directories taken from its name,
+    e.g. root/ab/cd/abcd..., so no single directory grows past a few thousand entries.
     """
-    sha256_hash = hashlib.sha256()
-    # Read the file in 4KB chunks
-    for chunk in iter(lambda: file.file.read(4096), b""):
-        sha256_hash.update(chunk)
-    # Reset file pointer to the start for subsequent operations
-    file.file.seek(0)
-    return sha256_hash.hexdigest()
+    return root / filename[:2] / filename[2:4] / filename
+
+def thumbnail_path(image_record: ImageModel) -> Path:
+    """Location of an image's thumbnail."""
+    return shard_path(THUMB_DIR, image_record.filename)
+
+def rendition_path(image_record: ImageModel, size: str) -> Path:
+    """Location of one named rendition of an image, keyed by content hash."""
+    return shard_path(RENDITION_DIR / size, f"{image_record.image_hash}{RENDITION_EXTENSION}")
 
-def save_uploaded_file(file: UploadFile) -> tuple[Path, str]:
+def variant_path(image_record: ImageModel, width: int | None, height: int | None, fit: str, format: str) -> Path:
+    """Cache location of an on-demand variant, sharded by content hash so it is shared by duplicates."""
+    extension = RENDITION_FORMATS[format][1]
+    return shard_path(VARIANT_DIR, f"{image_record.image_hash}_{width or 0}x{height or 0}_{fit}{extension}")
+
+def has_all_renditions(image_record: ImageModel) -> bool:
+    """Whether every configured rendition of an image exists on disk."""
+    return all(rendition_path(image_record, size).is_file() for size in RENDITION_SIZES)
+
+def stream_upload_to_temp(file: UploadFile, max_bytes: int) -> tuple[Path, str, int]:
     """
-    Saves an uploaded file to the designated image directory with a unique name.
+    Streams an upload to a temporary file in the image directory, hashing it on the way.
+    The upload is read exactly once, in large chunks, and never rewound.
 
     Args:
         file: The uploaded file object from FastAPI.
+        max_bytes: Largest accepted upload; the temp file is removed once it is exceeded.
+
+    Returns:
+        A tuple of the temporary path, the SHA-256 hex digest and the size in bytes.
+
+    Raises:
+        ImageTooLarge: If the upload exceeds max_bytes.
+    """
+    return stream_to_temp(file.file, file.filename, max_bytes)
+
+def stream_to_temp(source: BinaryIO, name: str, max_bytes: int) -> tuple[Path, str, int]:
+    """Copies a readable binary stream to a temporary file while hashing it; see stream_upload_to_temp."""
+    INCOMING_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = INCOMING_DIR / f"{uuid.uuid4()}.part"
+    sha256_hash = hashlib.sha256()
+    size = 0
+
+    try:
+        with open(tmp_path, "wb", buffering=UPLOAD_CHUNK_SIZE) as buffer:
+            for chunk in iter(lambda: source.read(UPLOAD_CHUNK_SIZE), b""):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ImageTooLarge(name, max_bytes)
+                sha256_hash.update(chunk)
+                buffer.write(chunk)
+    except BaseException:
+        discard_temp_file(tmp_path)
+        raise
+
+    return tmp_path, sha256_hash.hexdigest(), size
+
+def commit_temp_file(tmp_path: Path, image_hash: str, original_filename: str) -> tuple[Path, str]:
+    """
+    Atomically moves a streamed upload to its content-addressed path in the image directory.
+    If identical content is already stored there, the temporary file is discarded instead.
+
+    Returns:
+        A tuple containing the full path to the saved image and its content-addressed filename.
+    """
+    filename = content_filename(image_hash, original_filename)
+    image_path = shard_path(IMAGE_DIR, filename)
+
+    if image_path.is_file():
+        discard_temp_file(tmp_path)
+        logger.info(f"Content of '{original_filename}' already stored as '{filename}'")
+        return image_path, filename
+
+    image_path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(tmp_path, image_path)
+
+    logger.info(f"Saved file '{original_filename}' as '{filename}'")
+    return image_path, filename
+
+def discard_temp_file(tmp_path: Path):
+    """Removes a streamed upload that will not be kept."""
+    tmp_path.unlink(missing_ok=True)
+
+def hash_file(path: Path) -> str:
+    """Calculates the SHA-256 hash of a file on disk in large chunks."""
+    sha256_hash = hashlib.sha256()
+    with open(path, "rb", buffering=0) as source:
+        for chunk in iter(lambda: source.read(UPLOAD_CHUNK_SIZE), b""):
+            sha256_hash.update(chunk)
+    return sha256_hash.hexdigest()
+
+def store_local_file(source: Path, image_hash: str, hardlink: bool = False) -> tuple[Path, str]:
+    """
+    Places a server-local file at its content-addressed path in the image directory,
+    hardlinking it when asked and possible and copying it otherwise.
 
     Returns:
-        A tuple containing the full path to the saved image and its unique filename.
+        A tuple containing the full path to the stored image and its content-addressed filename.
+    """
+    filename = content_filename(image_hash, source.name)
+    image_path = shard_path(IMAGE_DIR, filename)
+
+    if image_path.is_file():
+        return image_path, filename
+
+    image_path.parent.mkdir(parents=True, exist_ok=True)
+    if hardlink:
+        try:
+            os.link(source, image_path)
+            return image_path, filename
+        except FileExistsError:
+            return image_path, filename
+        except OSError as e:
+            # Different filesystem or links not permitted
+            logger.debug(f"Could not hardlink {source}, copying instead: {e}")
+
+    INCOMING_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = INCOMING_DIR / f"{uuid.uuid4()}.part"
+    try:
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, image_path)
+    except BaseException:
+        discard_temp_file(tmp_path)
+        raise
+    return image_path, filename
+
+def is_image_filename(name: str) -> bool:
+    """Whether a file name has an accepted image extension and is not a hidden or metadata file."""
+    basename = PurePosixPath(name).name
+    return not basename.startswith(".") and PurePosixPath(basename).suffix.lower() in ALLOWED_IMAGE_EXTENSIONS
+
+def scan_image_files(root: Path) -> List[Path]:
+    """
+    Lists image files below a directory with os.scandir, skipping hidden entries
+    and not following symlinks.
+    """
+    found = []
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False) and is_image_filename(entry.name):
+                    found.append(Path(entry.path))
+    return sorted(found)
+
+@contextmanager
+def open_image_archive(path: Path) -> Iterator[List[tuple[str, int, Callable[[], BinaryIO]]]]:
     """
-    file_extension = Path(file.filename).suffix
-    unique_filename = f"{uuid.uuid4()}{file_extension}"
-    image_path = IMAGE_DIR / unique_filename
+    Opens a zip or tar archive (optionally compressed) and yields its image members as
+    (name, size, open) tuples. Members are only ever read as streams, never extracted
+    to their archived paths.
 
-    with open(image_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
-    logger.info(f"Saved file '{file.filename}' as '{unique_filename}'")
-    return image_path, unique_filename
+    Raises:
+        ValueError: If the file is neither a zip nor a tar archive.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            yield [
+                (info.filename, info.file_size, lambda info=info: archive.open(info))
+                for info in archive.infolist()
+                if not info.is_dir() and is_image_filename(info.filename)
+            ]
+    elif tarfile.is_tarfile(path):
+        with tarfile.open(path, "r:*") as archive:
+            yield [
+                (member.name, member.size, lambda member=member: archive.extractfile(member))
+                for member in archive.getmembers()
+                if member.isfile() and is_image_filename(member.name)
+            ]
+    else:
+        raise ValueError(f"{path.name} is not a zip or tar archive")
 
 def create_thumbnail(image_record: ImageModel):
     """
@@ -63,26 +281,15 @@ def create_thumbnail(image_record: ImageModel):
         return
 
     image_path = Path(image_record.file_path)
-    thumb_path = THUMB_DIR / image_record.filename
 
     try:
         with Image.open(image_path) as img:
+            # Decode only as many pixels as the thumbnail needs
+            img = decode_reduced(img, THUMB_LONG_EDGE, THUMB_SHORT_EDGE)
+
             # Auto-correct orientation using EXIF data before resizing
             img = ImageOps.exif_transpose(img)
-
-            # Determine target size based on aspect ratio
-            if img.width > img.height:
-                target_size = (THUMB_SIZES["landscape"]["height"], THUMB_SIZES["landscape"]["width"])
-            else:
-                target_size = (THUMB_SIZES["portrait"]["height"], THUMB_SIZES["portrait"]["width"])
-
-            thumb = img.resize(target_size, Image.Resampling.LANCZOS)
-
-            # Ensure the image is in RGB format before saving as JPEG
-            if thumb.mode in ('RGBA', 'LA', 'P'):
-                thumb = thumb.convert('RGB')
-
-            thumb.save(thumb_path, "JPEG", quality=85)
+            write_thumbnail(img, thumbnail_path(image_record))
 
             # This flag will be committed by the calling service
             image_record.has_thumbnail = True
@@ -91,13 +298,96 @@ def create_thumbnail(image_record: ImageModel):
     except Exception as e:
         logger.error(f"Failed to create thumbnail for {image_path}: {e}")
 
+def write_thumbnail(img: Image.Image, thumb_path: Path):
+    """
+    Resizes an already decoded, correctly oriented image to the thumbnail size
+    for its orientation and saves it as JPEG.
+    """
+    # Determine target size based on aspect ratio
+    if img.width > img.height:
+        target_size = (THUMB_SIZES["landscape"]["height"], THUMB_SIZES["landscape"]["width"])
+    else:
+        target_size = (THUMB_SIZES["portrait"]["height"], THUMB_SIZES["portrait"]["width"])
+
+    thumb = img.resize(target_size, Image.Resampling.LANCZOS)
+
+    # Ensure the image is in RGB format before saving as JPEG
+    if thumb.mode in ('RGBA', 'LA', 'P'):
+        thumb = thumb.convert('RGB')
+
+    thumb_path.parent.mkdir(parents=True, exist_ok=True)
+    thumb.save(thumb_path, "JPEG", quality=85)
+
+def write_renditions(img: Image.Image, image_record: ImageModel):
+    """
+    Writes every configured rendition from one decoded, correctly oriented image,
+    largest first, each downscaled from the previous one. Images are never upscaled.
+    """
+    current = img
+    for size, long_edge in sorted(RENDITION_SIZES.items(), key=lambda item: item[1], reverse=True):
+        if max(current.size) > long_edge:
+            current = current.copy()
+            current.thumbnail((long_edge, long_edge), Image.Resampling.LANCZOS)
+
+        path = rendition_path(image_record, size)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        current.save(tmp_path, RENDITION_PIL_FORMAT, quality=RENDITION_QUALITY)
+        os.replace(tmp_path, path)
+
+def create_renditions(image_record: ImageModel):
+    """Creates all renditions of an image from a single reduced-resolution decode of the original."""
+    with Image.open(image_record.file_path) as img:
+        img = decode_reduced(img, RENDITION_LONG_EDGE)
+        img = ImageOps.exif_transpose(img).convert("RGB")
+    write_renditions(img, image_record)
+    logger.info(f"Created renditions for {image_record.filename}")
+
+def _oriented_size(img: Image.Image) -> tuple[int, int]:
+    """Width and height of an opened image after EXIF orientation is applied."""
+    # Orientations 5-8 rotate by 90 degrees
+    if img.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+        return img.height, img.width
+    return img.size
+
+def _variant_scale(size: tuple[int, int], width: int | None, height: int | None, fit: str) -> float:
+    """
+    Scale applied to an image of the given size: "contain" fits it inside the
+    requested box, "cover" fills the box so it can be center-cropped. Never above 1.
+    """
+    scales = [target / source for target, source in zip((width, height), size) if target]
+    scale = max(scales) if fit == "cover" else min(scales)
+    return min(scale, 1.0)
+
+def write_variant(image_record: ImageModel, target_path: Path, width: int | None, height: int | None, fit: str, format: str):
+    """
+    Renders a resized or cropped variant of the original to target_path, decoding
+    only as many pixels as the output needs. Images are never upscaled; with
+    "cover" the result is center-cropped to the requested aspect ratio.
+    """
+    with Image.open(image_record.file_path) as img:
+        oriented_size = _oriented_size(img)
+        scale = _variant_scale(oriented_size, width, height, fit)
+        scaled_size = tuple(max(1, round(edge * scale)) for edge in oriented_size)
+        img = decode_reduced(img, max(scaled_size), min(scaled_size))
+        img = ImageOps.exif_transpose(img).convert("RGB")
+
+    if fit == "cover" and width and height:
+        crop_size = (min(width, scaled_size[0]), min(height, scaled_size[1]))
+        img = ImageOps.fit(img, crop_size, Image.Resampling.LANCZOS)
+    elif scaled_size != img.size:
+        img = img.resize(scaled_size, Image.Resampling.LANCZOS)
+
+    pil_format = RENDITION_FORMATS[format][0]
+    img.save(target_path, pil_format, quality=RENDITION_QUALITY)
+
 def delete_image_files(image_record: ImageModel) -> bool:
     """
-    Deletes the physical image and its corresponding thumbnail file from the disk.
+    Deletes the physical image and its corresponding thumbnail and rendition files from the disk.
     """
     try:
         image_path = Path(image_record.file_path)
-        thumb_path = THUMB_DIR / image_record.filename
+        thumb_path = thumbnail_path(image_record)
 
         if image_path.exists():
             image_path.unlink()
@@ -106,6 +396,12 @@ def delete_image_files(image_record: ImageModel) -> bool:
         if thumb_path.exists():
             thumb_path.unlink()
             logger.info(f"Deleted thumbnail file: {thumb_path}")
+
+        for size in RENDITION_SIZES:
+            rendition_path(image_record, size).unlink(missing_ok=True)
+
+        for variant in shard_path(VARIANT_DIR, image_record.image_hash).parent.glob(f"{image_record.image_hash}_*"):
+            variant.unlink(missing_ok=True)
             
         return True
     except Exception as e:
@@ -124,7 +124,7 @@ export function ImageDetailPanel({
   image: ImageResponse;
   onClose: () => void;
 }) {
-  const imageUrl = siteConfig.urls.image(image.id);
+  const imageUrl = siteConfig.urls.imageRendition(image.id, "preview");
 
   const {
     data: metadata,
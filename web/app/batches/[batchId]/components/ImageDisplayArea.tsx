@@ -10,6 +10,7 @@ import { useBatchViewStore } from "./useBatchViewStore";
 import { NavToolBar } from "./NavToolbar";
 import { ImageGrid } from "./ImageGrid";
 
+import { useBatchThumbnails } from "@/hooks/useBatchThumbnails";
 import { useGroupRanking } from "@/hooks/useGroupRanking";
 
 type ClusterEntry = readonly [
@@ -37,6 +38,11 @@ export function ImageDisplayArea({
 }) {
   const { view } = useBatchViewStore();
   const { rankGroup, rankingGroup } = useGroupRanking();
+  // One request per page of thumbnails rather than one per image
+  const { thumbnailUrls, isLoading: thumbnailsLoading } = useBatchThumbnails(
+    batchId,
+    allImages.length,
+  );
 
   const handleRankGroup = async (groupLabel: string) => {
     try {
@@ -58,6 +64,8 @@ export function ImageDisplayArea({
           <ImageGrid
             images={allImages}
             selectedImageIds={selectedImageIds}
+            thumbnailUrls={thumbnailUrls}
+            thumbnailsLoading={thumbnailsLoading}
             onImageClick={onImageClick}
             onImageSelect={onImageSelect}
           />
@@ -99,6 +107,8 @@ export function ImageDisplayArea({
                   <ImageGrid
                     images={images}
                     selectedImageIds={selectedImageIds}
+                    thumbnailUrls={thumbnailUrls}
+                    thumbnailsLoading={thumbnailsLoading}
                     onImageClick={onImageClick}
                     onImageSelect={onImageSelect}
                   />
@@ -11,11 +11,15 @@ export function ImageGrid({
   onImageClick,
   onImageSelect,
   selectedImageIds,
+  thumbnailUrls,
+  thumbnailsLoading,
 }: {
   images: ImageResponse[];
   onImageClick: (image: ImageResponse) => void;
   onImageSelect: (image: ImageResponse) => void;
   selectedImageIds: Set<number>;
+  thumbnailUrls: Map<number, string>;
+  thumbnailsLoading: boolean;
 }) {
   if (!images || images.length === 0) {
     return (
@@ -51,6 +55,10 @@ export function ImageGrid({
           hasAnySelection={selectedImageIds.size > 0}
           image={image}
           isSelected={selectedImageIds.has(image.id)}
+          thumbnailUrl={
+            thumbnailUrls.get(image.id) ??
+            (thumbnailsLoading ? null : undefined)
+          }
           onDetailClick={onImageClick}
           onSelectToggle={onImageSelect}
         />
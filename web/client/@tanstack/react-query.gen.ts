@@ -4,10 +4,21 @@ import type {
   UploadImagesData,
   UploadImagesError,
   UploadImagesResponse,
+  StartImageImportJobData,
+  StartImageImportJobError,
+  StartImageImportJobResponse,
+  CheckImageHashesData,
+  CheckImageHashesError,
+  CheckImageHashesResponse,
   GetAllImagesData,
+  GetAllImagesResponse,
+  GetAllImagesError,
   DeleteImageData,
   DeleteImageError,
   GetImageFileData,
+  GetImageRenditionData,
+  GetImageVariantData,
+  GetSimilarImagesData,
   GetImageThumbnailData,
   GetImageMetadataData,
   GetImageQualityImagesQualityImageIdGetData,
@@ -24,6 +35,8 @@ import type {
   RenameBatchData,
   RenameBatchError,
   RenameBatchResponse,
+  GetBatchThumbnailBundleData,
+  GetBatchThumbnailBundleError,
   RemoveImagesFromBatchData,
   RemoveImagesFromBatchError,
   RemoveImagesFromBatchResponse,
@@ -36,23 +49,53 @@ import type {
   AnalyzeBatchData,
   AnalyzeBatchError,
   AnalyzeBatchResponse,
+  StartBatchAnalysisJobData,
+  StartBatchAnalysisJobError,
+  StartBatchAnalysisJobResponse,
   UpdateGroupsInBatchData,
   UpdateGroupsInBatchError,
   UpdateGroupsInBatchResponse,
   RankGroupImagesData,
   RankGroupImagesError,
   RankGroupImagesResponse,
+  GetJobData,
+  StreamJobEventsData,
+  OpenUploadData,
+  OpenUploadError,
+  OpenUploadResponse,
+  AbortUploadData,
+  AbortUploadError,
+  AbortUploadResponse,
+  GetUploadData,
+  AppendUploadChunkData,
+  AppendUploadChunkError,
+  AppendUploadChunkResponse,
+  FinalizeUploadData,
+  FinalizeUploadError,
+  FinalizeUploadResponse,
   ReadRootGetData,
+  TruncateAllDataAdminTruncateAllDeleteData,
 } from "../types.gen";
 
-import { type UseMutationOptions, queryOptions } from "@tanstack/react-query";
+import {
+  type UseMutationOptions,
+  queryOptions,
+  type InfiniteData,
+  infiniteQueryOptions,
+  type DefaultError,
+} from "@tanstack/react-query";
 
 import {
   type Options,
   uploadImages,
+  startImageImportJob,
+  checkImageHashes,
   getAllImages,
   deleteImage,
   getImageFile,
+  getImageRendition,
+  getImageVariant,
+  getSimilarImages,
   getImageThumbnail,
   getImageMetadata,
   getImageQualityImagesQualityImageIdGet,
@@ -62,13 +105,24 @@ import {
   deleteBatch,
   getBatch,
   renameBatch,
+  getBatchThumbnailBundle,
   removeImagesFromBatch,
   addImagesToBatch,
   uploadAndAddImagesToBatch,
   analyzeBatch,
+  startBatchAnalysisJob,
   updateGroupsInBatch,
   rankGroupImages,
+  getJob,
+  streamJobEvents,
+  openUpload,
+  abortUpload,
+  getUpload,
+  getUploadOffset,
+  appendUploadChunk,
+  finalizeUpload,
   readRootGet,
+  truncateAllDataAdminTruncateAllDelete,
 } from "../sdk.gen";
 import { client } from "../client.gen";
 
@@ -102,6 +156,68 @@ export const uploadImagesMutation = (
   return mutationOptions;
 };
 
+/**
+ * Start Image Import Job
+ * Queues an import of a server-local directory, zip or tar archive below IMPORT_ROOTS,
+ * optionally adding every imported image to a batch. Follow progress at /jobs/{job_id}.
+ */
+export const startImageImportJobMutation = (
+  options?: Partial<Options<StartImageImportJobData>>,
+): UseMutationOptions<
+  StartImageImportJobResponse,
+  StartImageImportJobError,
+  Options<StartImageImportJobData>
+> => {
+  const mutationOptions: UseMutationOptions<
+    StartImageImportJobResponse,
+    StartImageImportJobError,
+    Options<StartImageImportJobData>
+  > = {
+    mutationFn: async (fnOptions) => {
+      const { data } = await startImageImportJob({
+        ...options,
+        ...fnOptions,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+  };
+
+  return mutationOptions;
+};
+
+/**
+ * Check Image Hashes
+ * Reports which SHA-256 content hashes are already stored, with their image IDs.
+ * Clients upload only the missing files and add existing ones to batches by ID.
+ */
+export const checkImageHashesMutation = (
+  options?: Partial<Options<CheckImageHashesData>>,
+): UseMutationOptions<
+  CheckImageHashesResponse,
+  CheckImageHashesError,
+  Options<CheckImageHashesData>
+> => {
+  const mutationOptions: UseMutationOptions<
+    CheckImageHashesResponse,
+    CheckImageHashesError,
+    Options<CheckImageHashesData>
+  > = {
+    mutationFn: async (fnOptions) => {
+      const { data } = await checkImageHashes({
+        ...options,
+        ...fnOptions,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+  };
+
+  return mutationOptions;
+};
+
 export type QueryKey<TOptions extends Options> = [
   Pick<TOptions, "baseUrl" | "body" | "headers" | "path" | "query"> & {
     _id: string;
@@ -149,6 +265,9 @@ export const getAllImagesQueryKey = (options?: Options<GetAllImagesData>) =>
 
 /**
  * Get All Images
+ * Lists images newest first by created_at or shot_at, one page at a time.
+ * Pass the X-Next-Cursor header of a response as `cursor` to get the next
+ * page; the header is absent on the last page.
  */
 export const getAllImagesOptions = (options?: Options<GetAllImagesData>) => {
   return queryOptions({
@@ -166,8 +285,100 @@ export const getAllImagesOptions = (options?: Options<GetAllImagesData>) => {
   });
 };
 
+const createInfiniteParams = <
+  K extends Pick<QueryKey<Options>[0], "body" | "headers" | "path" | "query">,
+>(
+  queryKey: QueryKey<Options>,
+  page: K,
+) => {
+  const params = {
+    ...queryKey[0],
+  };
+  if (page.body) {
+    params.body = {
+      ...(queryKey[0].body as any),
+      ...(page.body as any),
+    };
+  }
+  if (page.headers) {
+    params.headers = {
+      ...queryKey[0].headers,
+      ...page.headers,
+    };
+  }
+  if (page.path) {
+    params.path = {
+      ...(queryKey[0].path as any),
+      ...(page.path as any),
+    };
+  }
+  if (page.query) {
+    params.query = {
+      ...(queryKey[0].query as any),
+      ...(page.query as any),
+    };
+  }
+  return params as unknown as typeof page;
+};
+
+export const getAllImagesInfiniteQueryKey = (
+  options?: Options<GetAllImagesData>,
+): QueryKey<Options<GetAllImagesData>> =>
+  createQueryKey("getAllImages", options, true);
+
+/**
+ * Get All Images
+ * Lists images newest first by created_at or shot_at, one page at a time.
+ * Pass the X-Next-Cursor header of a response as `cursor` to get the next
+ * page; the header is absent on the last page.
+ */
+export const getAllImagesInfiniteOptions = (
+  options?: Options<GetAllImagesData>,
+) => {
+  return infiniteQueryOptions<
+    GetAllImagesResponse,
+    GetAllImagesError,
+    InfiniteData<GetAllImagesResponse>,
+    QueryKey<Options<GetAllImagesData>>,
+    | string
+    | null
+    | Pick<
+        QueryKey<Options<GetAllImagesData>>[0],
+        "body" | "headers" | "path" | "query"
+      >
+  >(
+    // @ts-ignore
+    {
+      queryFn: async ({ pageParam, queryKey, signal }) => {
+        // @ts-ignore
+        const page: Pick<
+          QueryKey<Options<GetAllImagesData>>[0],
+          "body" | "headers" | "path" | "query"
+        > =
+          typeof pageParam === "object"
+            ? pageParam
+            : {
+                query: {
+                  cursor: pageParam,
+                },
+              };
+        const params = createInfiniteParams(queryKey, page);
+        const { data } = await getAllImages({
+          ...options,
+          ...params,
+          signal,
+          throwOnError: true,
+        });
+        return data;
+      },
+      queryKey: getAllImagesInfiniteQueryKey(options),
+    },
+  );
+};
+
 /**
  * Delete Image
+ * Delete an image and its files.
  */
 export const deleteImageMutation = (
   options?: Partial<Options<DeleteImageData>>,
@@ -196,7 +407,8 @@ export const getImageFileQueryKey = (options: Options<GetImageFileData>) =>
 
 /**
  * Get Image File
- * Returns the full-size image file.
+ * Returns the full-size image file with a content-hash ETag and immutable caching.
+ * Supports Range requests; revalidation answers 304 without touching the disk.
  */
 export const getImageFileOptions = (options: Options<GetImageFileData>) => {
   return queryOptions({
@@ -214,13 +426,96 @@ export const getImageFileOptions = (options: Options<GetImageFileData>) => {
   });
 };
 
+export const getImageRenditionQueryKey = (
+  options: Options<GetImageRenditionData>,
+) => createQueryKey("getImageRendition", options);
+
+/**
+ * Get Image Rendition
+ * Returns a downscaled rendition (e.g. grid, preview, large) with the same caching
+ * as the original. Renditions missing on disk are generated on first request.
+ */
+export const getImageRenditionOptions = (
+  options: Options<GetImageRenditionData>,
+) => {
+  return queryOptions({
+    queryFn: async ({ queryKey, signal }) => {
+      const { data } = await getImageRendition({
+        ...options,
+        ...queryKey[0],
+        signal,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+    queryKey: getImageRenditionQueryKey(options),
+  });
+};
+
+export const getImageVariantQueryKey = (
+  options: Options<GetImageVariantData>,
+) => createQueryKey("getImageVariant", options);
+
+/**
+ * Get Image Variant
+ * Returns the image resized to fit inside (fit=contain) or cropped to fill
+ * (fit=cover) width x height, in the requested format. Images are never
+ * upscaled. Variants are rendered on first request and kept in a size-bounded
+ * disk cache.
+ */
+export const getImageVariantOptions = (
+  options: Options<GetImageVariantData>,
+) => {
+  return queryOptions({
+    queryFn: async ({ queryKey, signal }) => {
+      const { data } = await getImageVariant({
+        ...options,
+        ...queryKey[0],
+        signal,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+    queryKey: getImageVariantQueryKey(options),
+  });
+};
+
+export const getSimilarImagesQueryKey = (
+  options: Options<GetSimilarImagesData>,
+) => createQueryKey("getSimilarImages", options);
+
+/**
+ * Get Similar Images
+ * Returns the k most visually similar images by CLIP embedding.
+ */
+export const getSimilarImagesOptions = (
+  options: Options<GetSimilarImagesData>,
+) => {
+  return queryOptions({
+    queryFn: async ({ queryKey, signal }) => {
+      const { data } = await getSimilarImages({
+        ...options,
+        ...queryKey[0],
+        signal,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+    queryKey: getSimilarImagesQueryKey(options),
+  });
+};
+
 export const getImageThumbnailQueryKey = (
   options: Options<GetImageThumbnailData>,
 ) => createQueryKey("getImageThumbnail", options);
 
 /**
  * Get Thumbnail File
- * Returns the thumbnail image file.
+ * Returns the thumbnail image file with a content-hash ETag and immutable caching.
+ * Revalidation answers 304 without touching the disk.
  */
 export const getImageThumbnailOptions = (
   options: Options<GetImageThumbnailData>,
@@ -298,7 +593,7 @@ export const getImageQualityImagesQualityImageIdGetOptions = (
 
 /**
  * Analyze Batch Quality
- * Analyze quality for multiple images at once.
+ * Analyze quality for multiple images at once, scoring them in batched forward passes.
  */
 export const analyzeBatchQualityMutation = (
   options?: Partial<Options<AnalyzeBatchQualityData>>,
@@ -331,7 +626,7 @@ export const getAllBatchesQueryKey = (options?: Options<GetAllBatchesData>) =>
 
 /**
  * Get All Batches
- * Returns all batches.
+ * Returns a summary of every batch; associations are only served by the detail endpoint.
  */
 export const getAllBatchesOptions = (options?: Options<GetAllBatchesData>) => {
   return queryOptions({
@@ -458,6 +753,90 @@ export const renameBatchMutation = (
   return mutationOptions;
 };
 
+export const getBatchThumbnailBundleQueryKey = (
+  options: Options<GetBatchThumbnailBundleData>,
+) => createQueryKey("getBatchThumbnailBundle", options);
+
+/**
+ * Get Batch Thumbnail Bundle
+ * Returns the thumbnails of one page of a batch, ordered by image ID, in a single
+ * binary body so a grid loads with one request instead of one per image. Each
+ * record is a big-endian uint32 image ID, a big-endian uint32 byte length and
+ * that many JPEG bytes; a length of 0 means the thumbnail is not generated yet.
+ */
+export const getBatchThumbnailBundleOptions = (
+  options: Options<GetBatchThumbnailBundleData>,
+) => {
+  return queryOptions({
+    queryFn: async ({ queryKey, signal }) => {
+      const { data } = await getBatchThumbnailBundle({
+        ...options,
+        ...queryKey[0],
+        signal,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+    queryKey: getBatchThumbnailBundleQueryKey(options),
+  });
+};
+
+export const getBatchThumbnailBundleInfiniteQueryKey = (
+  options: Options<GetBatchThumbnailBundleData>,
+): QueryKey<Options<GetBatchThumbnailBundleData>> =>
+  createQueryKey("getBatchThumbnailBundle", options, true);
+
+/**
+ * Get Batch Thumbnail Bundle
+ * Returns the thumbnails of one page of a batch, ordered by image ID, in a single
+ * binary body so a grid loads with one request instead of one per image. Each
+ * record is a big-endian uint32 image ID, a big-endian uint32 byte length and
+ * that many JPEG bytes; a length of 0 means the thumbnail is not generated yet.
+ */
+export const getBatchThumbnailBundleInfiniteOptions = (
+  options: Options<GetBatchThumbnailBundleData>,
+) => {
+  return infiniteQueryOptions<
+    unknown,
+    GetBatchThumbnailBundleError,
+    InfiniteData<unknown>,
+    QueryKey<Options<GetBatchThumbnailBundleData>>,
+    | number
+    | Pick<
+        QueryKey<Options<GetBatchThumbnailBundleData>>[0],
+        "body" | "headers" | "path" | "query"
+      >
+  >(
+    // @ts-ignore
+    {
+      queryFn: async ({ pageParam, queryKey, signal }) => {
+        // @ts-ignore
+        const page: Pick<
+          QueryKey<Options<GetBatchThumbnailBundleData>>[0],
+          "body" | "headers" | "path" | "query"
+        > =
+          typeof pageParam === "object"
+            ? pageParam
+            : {
+                query: {
+                  offset: pageParam,
+                },
+              };
+        const params = createInfiniteParams(queryKey, page);
+        const { data } = await getBatchThumbnailBundle({
+          ...options,
+          ...params,
+          signal,
+          throwOnError: true,
+        });
+        return data;
+      },
+      queryKey: getBatchThumbnailBundleInfiniteQueryKey(options),
+    },
+  );
+};
+
 /**
  * Remove Images From Batch
  * Removes images from a batch.
@@ -578,6 +957,37 @@ export const analyzeBatchMutation = (
   return mutationOptions;
 };
 
+/**
+ * Start Batch Analysis Job
+ * Queues clustering of a batch as a background job and returns the job.
+ * Follow progress at /jobs/{job_id} or /jobs/{job_id}/events.
+ */
+export const startBatchAnalysisJobMutation = (
+  options?: Partial<Options<StartBatchAnalysisJobData>>,
+): UseMutationOptions<
+  StartBatchAnalysisJobResponse,
+  StartBatchAnalysisJobError,
+  Options<StartBatchAnalysisJobData>
+> => {
+  const mutationOptions: UseMutationOptions<
+    StartBatchAnalysisJobResponse,
+    StartBatchAnalysisJobError,
+    Options<StartBatchAnalysisJobData>
+  > = {
+    mutationFn: async (fnOptions) => {
+      const { data } = await startBatchAnalysisJob({
+        ...options,
+        ...fnOptions,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+  };
+
+  return mutationOptions;
+};
+
 /**
  * Update Groups
  * Manually updates the group assignments for images in a batch.
@@ -638,12 +1048,205 @@ export const rankGroupImagesMutation = (
   return mutationOptions;
 };
 
+export const getJobQueryKey = (options: Options<GetJobData>) =>
+  createQueryKey("getJob", options);
+
+/**
+ * Get Job
+ * Returns the status and per-phase progress of a background job.
+ */
+export const getJobOptions = (options: Options<GetJobData>) => {
+  return queryOptions({
+    queryFn: async ({ queryKey, signal }) => {
+      const { data } = await getJob({
+        ...options,
+        ...queryKey[0],
+        signal,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+    queryKey: getJobQueryKey(options),
+  });
+};
+
+export const streamJobEventsQueryKey = (
+  options: Options<StreamJobEventsData>,
+) => createQueryKey("streamJobEvents", options);
+
+/**
+ * Stream Job Events
+ * Streams job progress as server-sent events until the job finishes.
+ */
+export const streamJobEventsOptions = (
+  options: Options<StreamJobEventsData>,
+) => {
+  return queryOptions({
+    queryFn: async ({ queryKey, signal }) => {
+      const { data } = await streamJobEvents({
+        ...options,
+        ...queryKey[0],
+        signal,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+    queryKey: streamJobEventsQueryKey(options),
+  });
+};
+
+/**
+ * Open Upload
+ * Opens a resumable upload for one file of a declared size.
+ */
+export const openUploadMutation = (
+  options?: Partial<Options<OpenUploadData>>,
+): UseMutationOptions<
+  OpenUploadResponse,
+  OpenUploadError,
+  Options<OpenUploadData>
+> => {
+  const mutationOptions: UseMutationOptions<
+    OpenUploadResponse,
+    OpenUploadError,
+    Options<OpenUploadData>
+  > = {
+    mutationFn: async (fnOptions) => {
+      const { data } = await openUpload({
+        ...options,
+        ...fnOptions,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+  };
+
+  return mutationOptions;
+};
+
+/**
+ * Abort Upload
+ * Cancels an upload and discards the bytes received so far.
+ */
+export const abortUploadMutation = (
+  options?: Partial<Options<AbortUploadData>>,
+): UseMutationOptions<
+  AbortUploadResponse,
+  AbortUploadError,
+  Options<AbortUploadData>
+> => {
+  const mutationOptions: UseMutationOptions<
+    AbortUploadResponse,
+    AbortUploadError,
+    Options<AbortUploadData>
+  > = {
+    mutationFn: async (fnOptions) => {
+      const { data } = await abortUpload({
+        ...options,
+        ...fnOptions,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+  };
+
+  return mutationOptions;
+};
+
+export const getUploadQueryKey = (options: Options<GetUploadData>) =>
+  createQueryKey("getUpload", options);
+
+/**
+ * Get Upload
+ * Returns the state of an upload, including the offset to resume from.
+ */
+export const getUploadOptions = (options: Options<GetUploadData>) => {
+  return queryOptions({
+    queryFn: async ({ queryKey, signal }) => {
+      const { data } = await getUpload({
+        ...options,
+        ...queryKey[0],
+        signal,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+    queryKey: getUploadQueryKey(options),
+  });
+};
+
+/**
+ * Append Upload Chunk
+ * Appends the request body at Upload-Offset, which must equal the upload's
+ * current offset. Responds with the new offset.
+ */
+export const appendUploadChunkMutation = (
+  options?: Partial<Options<AppendUploadChunkData>>,
+): UseMutationOptions<
+  AppendUploadChunkResponse,
+  AppendUploadChunkError,
+  Options<AppendUploadChunkData>
+> => {
+  const mutationOptions: UseMutationOptions<
+    AppendUploadChunkResponse,
+    AppendUploadChunkError,
+    Options<AppendUploadChunkData>
+  > = {
+    mutationFn: async (fnOptions) => {
+      const { data } = await appendUploadChunk({
+        ...options,
+        ...fnOptions,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+  };
+
+  return mutationOptions;
+};
+
+/**
+ * Finalize Upload
+ * Registers a fully received upload as an image, or as a duplicate of an existing
+ * one, and queues processing for new images.
+ */
+export const finalizeUploadMutation = (
+  options?: Partial<Options<FinalizeUploadData>>,
+): UseMutationOptions<
+  FinalizeUploadResponse,
+  FinalizeUploadError,
+  Options<FinalizeUploadData>
+> => {
+  const mutationOptions: UseMutationOptions<
+    FinalizeUploadResponse,
+    FinalizeUploadError,
+    Options<FinalizeUploadData>
+  > = {
+    mutationFn: async (fnOptions) => {
+      const { data } = await finalizeUpload({
+        ...options,
+        ...fnOptions,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+  };
+
+  return mutationOptions;
+};
+
 export const readRootGetQueryKey = (options?: Options<ReadRootGetData>) =>
   createQueryKey("readRootGet", options);
 
 /**
  * Read Root
- * A simple health check endpoint.
  */
 export const readRootGetOptions = (options?: Options<ReadRootGetData>) => {
   return queryOptions({
@@ -660,3 +1263,34 @@ export const readRootGetOptions = (options?: Options<ReadRootGetData>) => {
     queryKey: readRootGetQueryKey(options),
   });
 };
+
+/**
+ * Truncate All Data
+ * DANGER: Truncate all data from database tables and delete all uploaded files.
+ * Keeps table structure intact. USE WITH CAUTION!
+ */
+export const truncateAllDataAdminTruncateAllDeleteMutation = (
+  options?: Partial<Options<TruncateAllDataAdminTruncateAllDeleteData>>,
+): UseMutationOptions<
+  unknown,
+  DefaultError,
+  Options<TruncateAllDataAdminTruncateAllDeleteData>
+> => {
+  const mutationOptions: UseMutationOptions<
+    unknown,
+    DefaultError,
+    Options<TruncateAllDataAdminTruncateAllDeleteData>
+  > = {
+    mutationFn: async (fnOptions) => {
+      const { data } = await truncateAllDataAdminTruncateAllDelete({
+        ...options,
+        ...fnOptions,
+        throwOnError: true,
+      });
+
+      return data;
+    },
+  };
+
+  return mutationOptions;
+};
@@ -20,7 +20,7 @@ export const BatchAnalyzeSchema = {
   },
   type: "object",
   title: "BatchAnalyze",
-  description: "Schema for the analysis request using HDBSCAN parameters.",
+  description: "Request to analyze batch with HDBSCAN parameters.",
 } as const;
 
 export const BatchCreateSchema = {
@@ -40,7 +40,7 @@ export const BatchCreateSchema = {
   type: "object",
   required: ["name", "image_ids"],
   title: "BatchCreate",
-  description: "Schema for the initial creation of a batch.",
+  description: "Request to create a new batch.",
 } as const;
 
 export const BatchGroupUpdateSchema = {
@@ -59,7 +59,7 @@ export const BatchGroupUpdateSchema = {
   type: "object",
   required: ["group_map"],
   title: "BatchGroupUpdate",
-  description: "Schema for manually updating a batch's group map.",
+  description: "Request to manually update batch group mappings.",
 } as const;
 
 export const BatchRenameSchema = {
@@ -72,7 +72,7 @@ export const BatchRenameSchema = {
   type: "object",
   required: ["name"],
   title: "BatchRename",
-  description: "Schema for renaming a batch.",
+  description: "Request to rename a batch.",
 } as const;
 
 export const BatchResponseSchema = {
@@ -112,7 +112,74 @@ export const BatchResponseSchema = {
   type: "object",
   required: ["id", "batch_name", "status", "parameters", "image_associations"],
   title: "BatchResponse",
-  description: "Schema for returning full batch details.",
+  description: "Full batch details with image associations.",
+} as const;
+
+export const BatchSummaryResponseSchema = {
+  properties: {
+    id: {
+      type: "integer",
+      title: "Id",
+    },
+    batch_name: {
+      type: "string",
+      title: "Batch Name",
+    },
+    status: {
+      type: "string",
+      title: "Status",
+    },
+    created_at: {
+      anyOf: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Created At",
+    },
+    image_count: {
+      type: "integer",
+      title: "Image Count",
+    },
+    group_count: {
+      type: "integer",
+      title: "Group Count",
+    },
+    cover_image_id: {
+      anyOf: [
+        {
+          type: "integer",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Cover Image Id",
+    },
+    preview_image_ids: {
+      items: {
+        type: "integer",
+      },
+      type: "array",
+      title: "Preview Image Ids",
+    },
+  },
+  type: "object",
+  required: [
+    "id",
+    "batch_name",
+    "status",
+    "image_count",
+    "group_count",
+    "preview_image_ids",
+  ],
+  title: "BatchSummaryResponse",
+  description:
+    "Batch as listed on the landing page: counts and preview images instead of associations.",
 } as const;
 
 export const BatchUpdateImagesSchema = {
@@ -128,7 +195,7 @@ export const BatchUpdateImagesSchema = {
   type: "object",
   required: ["image_ids"],
   title: "BatchUpdateImages",
-  description: "Schema for adding/removing images from a batch.",
+  description: "Request to add/remove images from a batch.",
 } as const;
 
 export const Body_uploadAndAddImagesToBatchSchema = {
@@ -163,6 +230,23 @@ export const Body_uploadImagesSchema = {
   title: "Body_uploadImages",
 } as const;
 
+export const ExistingImageSchema = {
+  properties: {
+    image_hash: {
+      type: "string",
+      title: "Image Hash",
+    },
+    id: {
+      type: "integer",
+      title: "Id",
+    },
+  },
+  type: "object",
+  required: ["image_hash", "id"],
+  title: "ExistingImage",
+  description: "An already stored image matched by its content hash.",
+} as const;
+
 export const GroupAssociationResponseSchema = {
   properties: {
     image: {
@@ -217,8 +301,7 @@ export const GroupAssociationResponseSchema = {
   type: "object",
   required: ["image", "group_label"],
   title: "GroupAssociationResponse",
-  description:
-    "Schema for an image's association within a batch, including its group.",
+  description: "Image association within a batch with group metadata.",
 } as const;
 
 export const HTTPValidationErrorSchema = {
@@ -235,6 +318,73 @@ export const HTTPValidationErrorSchema = {
   title: "HTTPValidationError",
 } as const;
 
+export const ImageHashCheckRequestSchema = {
+  properties: {
+    hashes: {
+      items: {
+        type: "string",
+      },
+      type: "array",
+      maxItems: 10000,
+      title: "Hashes",
+    },
+  },
+  type: "object",
+  required: ["hashes"],
+  title: "ImageHashCheckRequest",
+  description:
+    "Request model for checking which content hashes are already stored.",
+} as const;
+
+export const ImageHashCheckResponseSchema = {
+  properties: {
+    existing: {
+      items: {
+        $ref: "#/components/schemas/ExistingImage",
+      },
+      type: "array",
+      title: "Existing",
+    },
+    missing: {
+      items: {
+        type: "string",
+      },
+      type: "array",
+      title: "Missing",
+    },
+  },
+  type: "object",
+  required: ["existing", "missing"],
+  title: "ImageHashCheckResponse",
+  description:
+    "Which of the requested hashes are already stored and which still need uploading.",
+} as const;
+
+export const ImageImportRequestSchema = {
+  properties: {
+    path: {
+      type: "string",
+      title: "Path",
+    },
+    batch_id: {
+      anyOf: [
+        {
+          type: "integer",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Batch Id",
+    },
+  },
+  type: "object",
+  required: ["path"],
+  title: "ImageImportRequest",
+  description:
+    "Request model for importing a server-local directory or archive.",
+} as const;
+
 export const ImageQualityResponseSchema = {
   properties: {
     image_id: {
@@ -341,7 +491,124 @@ export const ImageResponseSchema = {
     "has_thumbnail",
   ],
   title: "ImageResponse",
-  description: "Schema for returning image details. This model is unchanged.",
+  description: "Schema for returning image details.",
+} as const;
+
+export const JobResponseSchema = {
+  properties: {
+    id: {
+      type: "string",
+      title: "Id",
+    },
+    kind: {
+      type: "string",
+      title: "Kind",
+    },
+    status: {
+      type: "string",
+      title: "Status",
+    },
+    params: {
+      anyOf: [
+        {
+          additionalProperties: true,
+          type: "object",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Params",
+    },
+    phase: {
+      anyOf: [
+        {
+          type: "string",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Phase",
+    },
+    progress: {
+      anyOf: [
+        {
+          additionalProperties: {
+            $ref: "#/components/schemas/PhaseProgress",
+          },
+          type: "object",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Progress",
+    },
+    result: {
+      anyOf: [
+        {
+          additionalProperties: true,
+          type: "object",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Result",
+    },
+    error: {
+      anyOf: [
+        {
+          type: "string",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Error",
+    },
+    created_at: {
+      anyOf: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Created At",
+    },
+    updated_at: {
+      anyOf: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Updated At",
+    },
+    finished_at: {
+      anyOf: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Finished At",
+    },
+  },
+  type: "object",
+  required: ["id", "kind", "status"],
+  title: "JobResponse",
+  description: "Job status with per-phase progress.",
 } as const;
 
 export const MetadataSchema = {
@@ -516,6 +783,187 @@ export const MetadataSchema = {
   description: "Schema for detailed image metadata.",
 } as const;
 
+export const PhaseProgressSchema = {
+  properties: {
+    done: {
+      type: "integer",
+      title: "Done",
+    },
+    total: {
+      type: "integer",
+      title: "Total",
+    },
+  },
+  type: "object",
+  required: ["done", "total"],
+  title: "PhaseProgress",
+  description: "Completed and total work units of one job phase.",
+} as const;
+
+export const SimilarImageResponseSchema = {
+  properties: {
+    id: {
+      type: "integer",
+      title: "Id",
+    },
+    filename: {
+      type: "string",
+      title: "Filename",
+    },
+    original_filename: {
+      type: "string",
+      title: "Original Filename",
+    },
+    has_thumbnail: {
+      type: "boolean",
+      title: "Has Thumbnail",
+    },
+    similarity: {
+      type: "number",
+      title: "Similarity",
+    },
+  },
+  type: "object",
+  required: [
+    "id",
+    "filename",
+    "original_filename",
+    "has_thumbnail",
+    "similarity",
+  ],
+  title: "SimilarImageResponse",
+  description: "Schema for a nearest-neighbour match of an image.",
+} as const;
+
+export const UploadSessionCreateSchema = {
+  properties: {
+    filename: {
+      type: "string",
+      maxLength: 1024,
+      minLength: 1,
+      title: "Filename",
+    },
+    size: {
+      type: "integer",
+      exclusiveMinimum: 0.0,
+      title: "Size",
+    },
+    mime_type: {
+      anyOf: [
+        {
+          type: "string",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Mime Type",
+    },
+    batch_id: {
+      anyOf: [
+        {
+          type: "integer",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Batch Id",
+    },
+  },
+  type: "object",
+  required: ["filename", "size"],
+  title: "UploadSessionCreate",
+  description: "Request model for opening a resumable upload.",
+} as const;
+
+export const UploadSessionResponseSchema = {
+  properties: {
+    id: {
+      type: "string",
+      title: "Id",
+    },
+    filename: {
+      type: "string",
+      title: "Filename",
+    },
+    mime_type: {
+      anyOf: [
+        {
+          type: "string",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Mime Type",
+    },
+    size: {
+      type: "integer",
+      title: "Size",
+    },
+    offset: {
+      type: "integer",
+      title: "Offset",
+    },
+    status: {
+      type: "string",
+      title: "Status",
+    },
+    batch_id: {
+      anyOf: [
+        {
+          type: "integer",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Batch Id",
+    },
+    image_id: {
+      anyOf: [
+        {
+          type: "integer",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Image Id",
+    },
+    created_at: {
+      anyOf: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Created At",
+    },
+    updated_at: {
+      anyOf: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Updated At",
+    },
+  },
+  type: "object",
+  required: ["id", "filename", "size", "offset", "status"],
+  title: "UploadSessionResponse",
+  description:
+    "State of a resumable upload; offset is where the next chunk must start.",
+} as const;
+
 export const ValidationErrorSchema = {
   properties: {
     loc: {
@@ -4,14 +4,30 @@ import type {
   UploadImagesData,
   UploadImagesResponses,
   UploadImagesErrors,
+  StartImageImportJobData,
+  StartImageImportJobResponses,
+  StartImageImportJobErrors,
+  CheckImageHashesData,
+  CheckImageHashesResponses,
+  CheckImageHashesErrors,
   GetAllImagesData,
   GetAllImagesResponses,
+  GetAllImagesErrors,
   DeleteImageData,
   DeleteImageResponses,
   DeleteImageErrors,
   GetImageFileData,
   GetImageFileResponses,
   GetImageFileErrors,
+  GetImageRenditionData,
+  GetImageRenditionResponses,
+  GetImageRenditionErrors,
+  GetImageVariantData,
+  GetImageVariantResponses,
+  GetImageVariantErrors,
+  GetSimilarImagesData,
+  GetSimilarImagesResponses,
+  GetSimilarImagesErrors,
   GetImageThumbnailData,
   GetImageThumbnailResponses,
   GetImageThumbnailErrors,
@@ -38,6 +54,9 @@ import type {
   RenameBatchData,
   RenameBatchResponses,
   RenameBatchErrors,
+  GetBatchThumbnailBundleData,
+  GetBatchThumbnailBundleResponses,
+  GetBatchThumbnailBundleErrors,
   RemoveImagesFromBatchData,
   RemoveImagesFromBatchResponses,
   RemoveImagesFromBatchErrors,
@@ -50,14 +69,43 @@ import type {
   AnalyzeBatchData,
   AnalyzeBatchResponses,
   AnalyzeBatchErrors,
+  StartBatchAnalysisJobData,
+  StartBatchAnalysisJobResponses,
+  StartBatchAnalysisJobErrors,
   UpdateGroupsInBatchData,
   UpdateGroupsInBatchResponses,
   UpdateGroupsInBatchErrors,
   RankGroupImagesData,
   RankGroupImagesResponses,
   RankGroupImagesErrors,
+  GetJobData,
+  GetJobResponses,
+  GetJobErrors,
+  StreamJobEventsData,
+  StreamJobEventsResponses,
+  StreamJobEventsErrors,
+  OpenUploadData,
+  OpenUploadResponses,
+  OpenUploadErrors,
+  AbortUploadData,
+  AbortUploadResponses,
+  AbortUploadErrors,
+  GetUploadData,
+  GetUploadResponses,
+  GetUploadErrors,
+  GetUploadOffsetData,
+  GetUploadOffsetResponses,
+  GetUploadOffsetErrors,
+  AppendUploadChunkData,
+  AppendUploadChunkResponses,
+  AppendUploadChunkErrors,
+  FinalizeUploadData,
+  FinalizeUploadResponses,
+  FinalizeUploadErrors,
   ReadRootGetData,
   ReadRootGetResponses,
+  TruncateAllDataAdminTruncateAllDeleteData,
+  TruncateAllDataAdminTruncateAllDeleteResponses,
 } from "./types.gen";
 
 import {
@@ -107,15 +155,62 @@ export const uploadImages = <ThrowOnError extends boolean = false>(
   });
 };
 
+/**
+ * Start Image Import Job
+ * Queues an import of a server-local directory, zip or tar archive below IMPORT_ROOTS,
+ * optionally adding every imported image to a batch. Follow progress at /jobs/{job_id}.
+ */
+export const startImageImportJob = <ThrowOnError extends boolean = false>(
+  options: Options<StartImageImportJobData, ThrowOnError>,
+) => {
+  return (options.client ?? client).post<
+    StartImageImportJobResponses,
+    StartImageImportJobErrors,
+    ThrowOnError
+  >({
+    url: "/images/import-jobs",
+    ...options,
+    headers: {
+      "Content-Type": "application/json",
+      ...options.headers,
+    },
+  });
+};
+
+/**
+ * Check Image Hashes
+ * Reports which SHA-256 content hashes are already stored, with their image IDs.
+ * Clients upload only the missing files and add existing ones to batches by ID.
+ */
+export const checkImageHashes = <ThrowOnError extends boolean = false>(
+  options: Options<CheckImageHashesData, ThrowOnError>,
+) => {
+  return (options.client ?? client).post<
+    CheckImageHashesResponses,
+    CheckImageHashesErrors,
+    ThrowOnError
+  >({
+    url: "/images/exists",
+    ...options,
+    headers: {
+      "Content-Type": "application/json",
+      ...options.headers,
+    },
+  });
+};
+
 /**
  * Get All Images
+ * Lists images newest first by created_at or shot_at, one page at a time.
+ * Pass the X-Next-Cursor header of a response as `cursor` to get the next
+ * page; the header is absent on the last page.
  */
 export const getAllImages = <ThrowOnError extends boolean = false>(
   options?: Options<GetAllImagesData, ThrowOnError>,
 ) => {
   return (options?.client ?? client).get<
     GetAllImagesResponses,
-    unknown,
+    GetAllImagesErrors,
     ThrowOnError
   >({
     url: "/images/",
@@ -125,6 +220,7 @@ export const getAllImages = <ThrowOnError extends boolean = false>(
 
 /**
  * Delete Image
+ * Delete an image and its files.
  */
 export const deleteImage = <ThrowOnError extends boolean = false>(
   options: Options<DeleteImageData, ThrowOnError>,
@@ -141,7 +237,8 @@ export const deleteImage = <ThrowOnError extends boolean = false>(
 
 /**
  * Get Image File
- * Returns the full-size image file.
+ * Returns the full-size image file with a content-hash ETag and immutable caching.
+ * Supports Range requests; revalidation answers 304 without touching the disk.
  */
 export const getImageFile = <ThrowOnError extends boolean = false>(
   options: Options<GetImageFileData, ThrowOnError>,
@@ -156,9 +253,65 @@ export const getImageFile = <ThrowOnError extends boolean = false>(
   });
 };
 
+/**
+ * Get Image Rendition
+ * Returns a downscaled rendition (e.g. grid, preview, large) with the same caching
+ * as the original. Renditions missing on disk are generated on first request.
+ */
+export const getImageRendition = <ThrowOnError extends boolean = false>(
+  options: Options<GetImageRenditionData, ThrowOnError>,
+) => {
+  return (options.client ?? client).get<
+    GetImageRenditionResponses,
+    GetImageRenditionErrors,
+    ThrowOnError
+  >({
+    url: "/images/{image_id}/rendition/{size}",
+    ...options,
+  });
+};
+
+/**
+ * Get Image Variant
+ * Returns the image resized to fit inside (fit=contain) or cropped to fill
+ * (fit=cover) width x height, in the requested format. Images are never
+ * upscaled. Variants are rendered on first request and kept in a size-bounded
+ * disk cache.
+ */
+export const getImageVariant = <ThrowOnError extends boolean = false>(
+  options: Options<GetImageVariantData, ThrowOnError>,
+) => {
+  return (options.client ?? client).get<
+    GetImageVariantResponses,
+    GetImageVariantErrors,
+    ThrowOnError
+  >({
+    url: "/images/{image_id}/variant",
+    ...options,
+  });
+};
+
+/**
+ * Get Similar Images
+ * Returns the k most visually similar images by CLIP embedding.
+ */
+export const getSimilarImages = <ThrowOnError extends boolean = false>(
+  options: Options<GetSimilarImagesData, ThrowOnError>,
+) => {
+  return (options.client ?? client).get<
+    GetSimilarImagesResponses,
+    GetSimilarImagesErrors,
+    ThrowOnError
+  >({
+    url: "/images/{image_id}/similar",
+    ...options,
+  });
+};
+
 /**
  * Get Thumbnail File
- * Returns the thumbnail image file.
+ * Returns the thumbnail image file with a content-hash ETag and immutable caching.
+ * Revalidation answers 304 without touching the disk.
  */
 export const getImageThumbnail = <ThrowOnError extends boolean = false>(
   options: Options<GetImageThumbnailData, ThrowOnError>,
@@ -215,7 +368,7 @@ export const getImageQualityImagesQualityImageIdGet = <
 
 /**
  * Analyze Batch Quality
- * Analyze quality for multiple images at once.
+ * Analyze quality for multiple images at once, scoring them in batched forward passes.
  */
 export const analyzeBatchQuality = <ThrowOnError extends boolean = false>(
   options: Options<AnalyzeBatchQualityData, ThrowOnError>,
@@ -236,7 +389,7 @@ export const analyzeBatchQuality = <ThrowOnError extends boolean = false>(
 
 /**
  * Get All Batches
- * Returns all batches.
+ * Returns a summary of every batch; associations are only served by the detail endpoint.
  */
 export const getAllBatches = <ThrowOnError extends boolean = false>(
   options?: Options<GetAllBatchesData, ThrowOnError>,
@@ -327,6 +480,26 @@ export const renameBatch = <ThrowOnError extends boolean = false>(
   });
 };
 
+/**
+ * Get Batch Thumbnail Bundle
+ * Returns the thumbnails of one page of a batch, ordered by image ID, in a single
+ * binary body so a grid loads with one request instead of one per image. Each
+ * record is a big-endian uint32 image ID, a big-endian uint32 byte length and
+ * that many JPEG bytes; a length of 0 means the thumbnail is not generated yet.
+ */
+export const getBatchThumbnailBundle = <ThrowOnError extends boolean = false>(
+  options: Options<GetBatchThumbnailBundleData, ThrowOnError>,
+) => {
+  return (options.client ?? client).get<
+    GetBatchThumbnailBundleResponses,
+    GetBatchThumbnailBundleErrors,
+    ThrowOnError
+  >({
+    url: "/batches/{batch_id}/thumbnails",
+    ...options,
+  });
+};
+
 /**
  * Remove Images From Batch
  * Removes images from a batch.
@@ -412,6 +585,28 @@ export const analyzeBatch = <ThrowOnError extends boolean = false>(
   });
 };
 
+/**
+ * Start Batch Analysis Job
+ * Queues clustering of a batch as a background job and returns the job.
+ * Follow progress at /jobs/{job_id} or /jobs/{job_id}/events.
+ */
+export const startBatchAnalysisJob = <ThrowOnError extends boolean = false>(
+  options: Options<StartBatchAnalysisJobData, ThrowOnError>,
+) => {
+  return (options.client ?? client).post<
+    StartBatchAnalysisJobResponses,
+    StartBatchAnalysisJobErrors,
+    ThrowOnError
+  >({
+    url: "/batches/{batch_id}/analysis-jobs",
+    ...options,
+    headers: {
+      "Content-Type": "application/json",
+      ...options.headers,
+    },
+  });
+};
+
 /**
  * Update Groups
  * Manually updates the group assignments for images in a batch.
@@ -450,9 +645,150 @@ export const rankGroupImages = <ThrowOnError extends boolean = false>(
   });
 };
 
+/**
+ * Get Job
+ * Returns the status and per-phase progress of a background job.
+ */
+export const getJob = <ThrowOnError extends boolean = false>(
+  options: Options<GetJobData, ThrowOnError>,
+) => {
+  return (options.client ?? client).get<
+    GetJobResponses,
+    GetJobErrors,
+    ThrowOnError
+  >({
+    url: "/jobs/{job_id}",
+    ...options,
+  });
+};
+
+/**
+ * Stream Job Events
+ * Streams job progress as server-sent events until the job finishes.
+ */
+export const streamJobEvents = <ThrowOnError extends boolean = false>(
+  options: Options<StreamJobEventsData, ThrowOnError>,
+) => {
+  return (options.client ?? client).get<
+    StreamJobEventsResponses,
+    StreamJobEventsErrors,
+    ThrowOnError
+  >({
+    url: "/jobs/{job_id}/events",
+    ...options,
+  });
+};
+
+/**
+ * Open Upload
+ * Opens a resumable upload for one file of a declared size.
+ */
+export const openUpload = <ThrowOnError extends boolean = false>(
+  options: Options<OpenUploadData, ThrowOnError>,
+) => {
+  return (options.client ?? client).post<
+    OpenUploadResponses,
+    OpenUploadErrors,
+    ThrowOnError
+  >({
+    url: "/uploads/",
+    ...options,
+    headers: {
+      "Content-Type": "application/json",
+      ...options.headers,
+    },
+  });
+};
+
+/**
+ * Abort Upload
+ * Cancels an upload and discards the bytes received so far.
+ */
+export const abortUpload = <ThrowOnError extends boolean = false>(
+  options: Options<AbortUploadData, ThrowOnError>,
+) => {
+  return (options.client ?? client).delete<
+    AbortUploadResponses,
+    AbortUploadErrors,
+    ThrowOnError
+  >({
+    url: "/uploads/{upload_id}",
+    ...options,
+  });
+};
+
+/**
+ * Get Upload
+ * Returns the state of an upload, including the offset to resume from.
+ */
+export const getUpload = <ThrowOnError extends boolean = false>(
+  options: Options<GetUploadData, ThrowOnError>,
+) => {
+  return (options.client ?? client).get<
+    GetUploadResponses,
+    GetUploadErrors,
+    ThrowOnError
+  >({
+    url: "/uploads/{upload_id}",
+    ...options,
+  });
+};
+
+/**
+ * Get Upload Offset
+ * Reports the offset to resume from in the Upload-Offset header.
+ */
+export const getUploadOffset = <ThrowOnError extends boolean = false>(
+  options: Options<GetUploadOffsetData, ThrowOnError>,
+) => {
+  return (options.client ?? client).head<
+    GetUploadOffsetResponses,
+    GetUploadOffsetErrors,
+    ThrowOnError
+  >({
+    url: "/uploads/{upload_id}",
+    ...options,
+  });
+};
+
+/**
+ * Append Upload Chunk
+ * Appends the request body at Upload-Offset, which must equal the upload's
+ * current offset. Responds with the new offset.
+ */
+export const appendUploadChunk = <ThrowOnError extends boolean = false>(
+  options: Options<AppendUploadChunkData, ThrowOnError>,
+) => {
+  return (options.client ?? client).patch<
+    AppendUploadChunkResponses,
+    AppendUploadChunkErrors,
+    ThrowOnError
+  >({
+    url: "/uploads/{upload_id}",
+    ...options,
+  });
+};
+
+/**
+ * Finalize Upload
+ * Registers a fully received upload as an image, or as a duplicate of an existing
+ * one, and queues processing for new images.
+ */
+export const finalizeUpload = <ThrowOnError extends boolean = false>(
+  options: Options<FinalizeUploadData, ThrowOnError>,
+) => {
+  return (options.client ?? client).post<
+    FinalizeUploadResponses,
+    FinalizeUploadErrors,
+    ThrowOnError
+  >({
+    url: "/uploads/{upload_id}/finalize",
+    ...options,
+  });
+};
+
 /**
  * Read Root
- * A simple health check endpoint.
  */
 export const readRootGet = <ThrowOnError extends boolean = false>(
   options?: Options<ReadRootGetData, ThrowOnError>,
@@ -466,3 +802,23 @@ export const readRootGet = <ThrowOnError extends boolean = false>(
     ...options,
   });
 };
+
+/**
+ * Truncate All Data
+ * DANGER: Truncate all data from database tables and delete all uploaded files.
+ * Keeps table structure intact. USE WITH CAUTION!
+ */
+export const truncateAllDataAdminTruncateAllDelete = <
+  ThrowOnError extends boolean = false,
+>(
+  options?: Options<TruncateAllDataAdminTruncateAllDeleteData, ThrowOnError>,
+) => {
+  return (options?.client ?? client).delete<
+    TruncateAllDataAdminTruncateAllDeleteResponses,
+    unknown,
+    ThrowOnError
+  >({
+    url: "/admin/truncate-all",
+    ...options,
+  });
+};
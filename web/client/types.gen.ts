@@ -2,7 +2,7 @@
 
 /**
  * BatchAnalyze
- * Schema for the analysis request using HDBSCAN parameters.
+ * Request to analyze batch with HDBSCAN parameters.
  */
 export type BatchAnalyze = {
   /**
@@ -21,7 +21,7 @@ export type BatchAnalyze = {
 
 /**
  * BatchCreate
- * Schema for the initial creation of a batch.
+ * Request to create a new batch.
  */
 export type BatchCreate = {
   /**
@@ -36,7 +36,7 @@ export type BatchCreate = {
 
 /**
  * BatchGroupUpdate
- * Schema for manually updating a batch's group map.
+ * Request to manually update batch group mappings.
  */
 export type BatchGroupUpdate = {
   /**
@@ -49,7 +49,7 @@ export type BatchGroupUpdate = {
 
 /**
  * BatchRename
- * Schema for renaming a batch.
+ * Request to rename a batch.
  */
 export type BatchRename = {
   /**
@@ -60,7 +60,7 @@ export type BatchRename = {
 
 /**
  * BatchResponse
- * Schema for returning full batch details.
+ * Full batch details with image associations.
  */
 export type BatchResponse = {
   /**
@@ -87,9 +87,48 @@ export type BatchResponse = {
   image_associations: Array<GroupAssociationResponse>;
 };
 
+/**
+ * BatchSummaryResponse
+ * Batch as listed on the landing page: counts and preview images instead of associations.
+ */
+export type BatchSummaryResponse = {
+  /**
+   * Id
+   */
+  id: number;
+  /**
+   * Batch Name
+   */
+  batch_name: string;
+  /**
+   * Status
+   */
+  status: string;
+  /**
+   * Created At
+   */
+  created_at?: string | null;
+  /**
+   * Image Count
+   */
+  image_count: number;
+  /**
+   * Group Count
+   */
+  group_count: number;
+  /**
+   * Cover Image Id
+   */
+  cover_image_id?: number | null;
+  /**
+   * Preview Image Ids
+   */
+  preview_image_ids: Array<number>;
+};
+
 /**
  * BatchUpdateImages
- * Schema for adding/removing images from a batch.
+ * Request to add/remove images from a batch.
  */
 export type BatchUpdateImages = {
   /**
@@ -118,9 +157,24 @@ export type BodyUploadImages = {
   files: Array<Blob | File>;
 };
 
+/**
+ * ExistingImage
+ * An already stored image matched by its content hash.
+ */
+export type ExistingImage = {
+  /**
+   * Image Hash
+   */
+  image_hash: string;
+  /**
+   * Id
+   */
+  id: number;
+};
+
 /**
  * GroupAssociationResponse
- * Schema for an image's association within a batch, including its group.
+ * Image association within a batch with group metadata.
  */
 export type GroupAssociationResponse = {
   image: ImageResponse;
@@ -152,6 +206,47 @@ export type HttpValidationError = {
   detail?: Array<ValidationError>;
 };
 
+/**
+ * ImageHashCheckRequest
+ * Request model for checking which content hashes are already stored.
+ */
+export type ImageHashCheckRequest = {
+  /**
+   * Hashes
+   */
+  hashes: Array<string>;
+};
+
+/**
+ * ImageHashCheckResponse
+ * Which of the requested hashes are already stored and which still need uploading.
+ */
+export type ImageHashCheckResponse = {
+  /**
+   * Existing
+   */
+  existing: Array<ExistingImage>;
+  /**
+   * Missing
+   */
+  missing: Array<string>;
+};
+
+/**
+ * ImageImportRequest
+ * Request model for importing a server-local directory or archive.
+ */
+export type ImageImportRequest = {
+  /**
+   * Path
+   */
+  path: string;
+  /**
+   * Batch Id
+   */
+  batch_id?: number | null;
+};
+
 /**
  * ImageQualityResponse
  * Response with image quality score.
@@ -181,7 +276,7 @@ export type ImageQualityResponse = {
 
 /**
  * ImageResponse
- * Schema for returning image details. This model is unchanged.
+ * Schema for returning image details.
  */
 export type ImageResponse = {
   /**
@@ -222,6 +317,63 @@ export type ImageResponse = {
   quality_metric?: string | null;
 };
 
+/**
+ * JobResponse
+ * Job status with per-phase progress.
+ */
+export type JobResponse = {
+  /**
+   * Id
+   */
+  id: string;
+  /**
+   * Kind
+   */
+  kind: string;
+  /**
+   * Status
+   */
+  status: string;
+  /**
+   * Params
+   */
+  params?: {
+    [key: string]: unknown;
+  } | null;
+  /**
+   * Phase
+   */
+  phase?: string | null;
+  /**
+   * Progress
+   */
+  progress?: {
+    [key: string]: PhaseProgress;
+  } | null;
+  /**
+   * Result
+   */
+  result?: {
+    [key: string]: unknown;
+  } | null;
+  /**
+   * Error
+   */
+  error?: string | null;
+  /**
+   * Created At
+   */
+  created_at?: string | null;
+  /**
+   * Updated At
+   */
+  updated_at?: string | null;
+  /**
+   * Finished At
+   */
+  finished_at?: string | null;
+};
+
 /**
  * Metadata
  * Schema for detailed image metadata.
@@ -289,6 +441,118 @@ export type Metadata = {
   rating?: number | null;
 };
 
+/**
+ * PhaseProgress
+ * Completed and total work units of one job phase.
+ */
+export type PhaseProgress = {
+  /**
+   * Done
+   */
+  done: number;
+  /**
+   * Total
+   */
+  total: number;
+};
+
+/**
+ * SimilarImageResponse
+ * Schema for a nearest-neighbour match of an image.
+ */
+export type SimilarImageResponse = {
+  /**
+   * Id
+   */
+  id: number;
+  /**
+   * Filename
+   */
+  filename: string;
+  /**
+   * Original Filename
+   */
+  original_filename: string;
+  /**
+   * Has Thumbnail
+   */
+  has_thumbnail: boolean;
+  /**
+   * Similarity
+   */
+  similarity: number;
+};
+
+/**
+ * UploadSessionCreate
+ * Request model for opening a resumable upload.
+ */
+export type UploadSessionCreate = {
+  /**
+   * Filename
+   */
+  filename: string;
+  /**
+   * Size
+   */
+  size: number;
+  /**
+   * Mime Type
+   */
+  mime_type?: string | null;
+  /**
+   * Batch Id
+   */
+  batch_id?: number | null;
+};
+
+/**
+ * UploadSessionResponse
+ * State of a resumable upload; offset is where the next chunk must start.
+ */
+export type UploadSessionResponse = {
+  /**
+   * Id
+   */
+  id: string;
+  /**
+   * Filename
+   */
+  filename: string;
+  /**
+   * Mime Type
+   */
+  mime_type?: string | null;
+  /**
+   * Size
+   */
+  size: number;
+  /**
+   * Offset
+   */
+  offset: number;
+  /**
+   * Status
+   */
+  status: string;
+  /**
+   * Batch Id
+   */
+  batch_id?: number | null;
+  /**
+   * Image Id
+   */
+  image_id?: number | null;
+  /**
+   * Created At
+   */
+  created_at?: string | null;
+  /**
+   * Updated At
+   */
+  updated_at?: string | null;
+};
+
 /**
  * ValidationError
  */
@@ -334,13 +598,137 @@ export type UploadImagesResponses = {
 export type UploadImagesResponse =
   UploadImagesResponses[keyof UploadImagesResponses];
 
+export type StartImageImportJobData = {
+  body: ImageImportRequest;
+  path?: never;
+  query?: never;
+  url: "/images/import-jobs";
+};
+
+export type StartImageImportJobErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type StartImageImportJobError =
+  StartImageImportJobErrors[keyof StartImageImportJobErrors];
+
+export type StartImageImportJobResponses = {
+  /**
+   * Successful Response
+   */
+  202: JobResponse;
+};
+
+export type StartImageImportJobResponse =
+  StartImageImportJobResponses[keyof StartImageImportJobResponses];
+
+export type CheckImageHashesData = {
+  body: ImageHashCheckRequest;
+  path?: never;
+  query?: never;
+  url: "/images/exists";
+};
+
+export type CheckImageHashesErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type CheckImageHashesError =
+  CheckImageHashesErrors[keyof CheckImageHashesErrors];
+
+export type CheckImageHashesResponses = {
+  /**
+   * Successful Response
+   */
+  200: ImageHashCheckResponse;
+};
+
+export type CheckImageHashesResponse =
+  CheckImageHashesResponses[keyof CheckImageHashesResponses];
+
 export type GetAllImagesData = {
   body?: never;
   path?: never;
-  query?: never;
+  query?: {
+    /**
+     * Sort
+     */
+    sort?: "created_at" | "shot_at";
+    /**
+     * Cursor
+     */
+    cursor?: string | null;
+    /**
+     * Limit
+     */
+    limit?: number;
+    /**
+     * Camera Make
+     */
+    camera_make?: string | null;
+    /**
+     * Camera Model
+     */
+    camera_model?: string | null;
+    /**
+     * Iso Min
+     */
+    iso_min?: number | null;
+    /**
+     * Iso Max
+     */
+    iso_max?: number | null;
+    /**
+     * F Number Min
+     */
+    f_number_min?: number | null;
+    /**
+     * F Number Max
+     */
+    f_number_max?: number | null;
+    /**
+     * Shot After
+     */
+    shot_after?: string | null;
+    /**
+     * Shot Before
+     */
+    shot_before?: string | null;
+    /**
+     * Has Thumbnail
+     */
+    has_thumbnail?: boolean | null;
+    /**
+     * Quality Min
+     */
+    quality_min?: number | null;
+    /**
+     * Quality Max
+     */
+    quality_max?: number | null;
+    /**
+     * Rating Min
+     */
+    rating_min?: number | null;
+  };
   url: "/images/";
 };
 
+export type GetAllImagesErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type GetAllImagesError = GetAllImagesErrors[keyof GetAllImagesErrors];
+
 export type GetAllImagesResponses = {
   /**
    * Response Getallimages
@@ -356,31 +744,156 @@ export type DeleteImageData = {
   body?: never;
   path: {
     /**
-     * Image Id
+     * Image Id
+     */
+    image_id: number;
+  };
+  query?: never;
+  url: "/images/{image_id}";
+};
+
+export type DeleteImageErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type DeleteImageError = DeleteImageErrors[keyof DeleteImageErrors];
+
+export type DeleteImageResponses = {
+  /**
+   * Successful Response
+   */
+  200: unknown;
+};
+
+export type GetImageFileData = {
+  body?: never;
+  headers?: {
+    /**
+     * If-None-Match
+     */
+    "if-none-match"?: string | null;
+  };
+  path: {
+    /**
+     * Image Id
+     */
+    image_id: number;
+  };
+  query?: never;
+  url: "/images/{image_id}";
+};
+
+export type GetImageFileErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type GetImageFileError = GetImageFileErrors[keyof GetImageFileErrors];
+
+export type GetImageFileResponses = {
+  /**
+   * Successful Response
+   */
+  200: unknown;
+};
+
+export type GetImageRenditionData = {
+  body?: never;
+  headers?: {
+    /**
+     * If-None-Match
+     */
+    "if-none-match"?: string | null;
+  };
+  path: {
+    /**
+     * Image Id
+     */
+    image_id: number;
+    /**
+     * Size
+     */
+    size: string;
+  };
+  query?: never;
+  url: "/images/{image_id}/rendition/{size}";
+};
+
+export type GetImageRenditionErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type GetImageRenditionError =
+  GetImageRenditionErrors[keyof GetImageRenditionErrors];
+
+export type GetImageRenditionResponses = {
+  /**
+   * Successful Response
+   */
+  200: unknown;
+};
+
+export type GetImageVariantData = {
+  body?: never;
+  headers?: {
+    /**
+     * If-None-Match
+     */
+    "if-none-match"?: string | null;
+  };
+  path: {
+    /**
+     * Image Id
+     */
+    image_id: number;
+  };
+  query?: {
+    /**
+     * Width
+     */
+    width?: number | null;
+    /**
+     * Height
+     */
+    height?: number | null;
+    /**
+     * Fit
+     */
+    fit?: string;
+    /**
+     * Format
      */
-    image_id: number;
+    format?: string;
   };
-  query?: never;
-  url: "/images/{image_id}";
+  url: "/images/{image_id}/variant";
 };
 
-export type DeleteImageErrors = {
+export type GetImageVariantErrors = {
   /**
    * Validation Error
    */
   422: HttpValidationError;
 };
 
-export type DeleteImageError = DeleteImageErrors[keyof DeleteImageErrors];
+export type GetImageVariantError =
+  GetImageVariantErrors[keyof GetImageVariantErrors];
 
-export type DeleteImageResponses = {
+export type GetImageVariantResponses = {
   /**
    * Successful Response
    */
   200: unknown;
 };
 
-export type GetImageFileData = {
+export type GetSimilarImagesData = {
   body?: never;
   path: {
     /**
@@ -388,28 +901,44 @@ export type GetImageFileData = {
      */
     image_id: number;
   };
-  query?: never;
-  url: "/images/{image_id}";
+  query?: {
+    /**
+     * K
+     */
+    k?: number;
+  };
+  url: "/images/{image_id}/similar";
 };
 
-export type GetImageFileErrors = {
+export type GetSimilarImagesErrors = {
   /**
    * Validation Error
    */
   422: HttpValidationError;
 };
 
-export type GetImageFileError = GetImageFileErrors[keyof GetImageFileErrors];
+export type GetSimilarImagesError =
+  GetSimilarImagesErrors[keyof GetSimilarImagesErrors];
 
-export type GetImageFileResponses = {
+export type GetSimilarImagesResponses = {
   /**
+   * Response Getsimilarimages
    * Successful Response
    */
-  200: unknown;
+  200: Array<SimilarImageResponse>;
 };
 
+export type GetSimilarImagesResponse =
+  GetSimilarImagesResponses[keyof GetSimilarImagesResponses];
+
 export type GetImageThumbnailData = {
   body?: never;
+  headers?: {
+    /**
+     * If-None-Match
+     */
+    "if-none-match"?: string | null;
+  };
   path: {
     /**
      * Image Id
@@ -562,7 +1091,7 @@ export type GetAllBatchesResponses = {
    * Response Getallbatches
    * Successful Response
    */
-  200: Array<BatchResponse>;
+  200: Array<BatchSummaryResponse>;
 };
 
 export type GetAllBatchesResponse =
@@ -683,6 +1212,50 @@ export type RenameBatchResponses = {
 export type RenameBatchResponse =
   RenameBatchResponses[keyof RenameBatchResponses];
 
+export type GetBatchThumbnailBundleData = {
+  body?: never;
+  headers?: {
+    /**
+     * If-None-Match
+     */
+    "if-none-match"?: string | null;
+  };
+  path: {
+    /**
+     * Batch Id
+     */
+    batch_id: number;
+  };
+  query?: {
+    /**
+     * Offset
+     */
+    offset?: number;
+    /**
+     * Limit
+     */
+    limit?: number;
+  };
+  url: "/batches/{batch_id}/thumbnails";
+};
+
+export type GetBatchThumbnailBundleErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type GetBatchThumbnailBundleError =
+  GetBatchThumbnailBundleErrors[keyof GetBatchThumbnailBundleErrors];
+
+export type GetBatchThumbnailBundleResponses = {
+  /**
+   * Successful Response
+   */
+  200: unknown;
+};
+
 export type RemoveImagesFromBatchData = {
   body: BatchUpdateImages;
   path: {
@@ -810,6 +1383,38 @@ export type AnalyzeBatchResponses = {
 export type AnalyzeBatchResponse =
   AnalyzeBatchResponses[keyof AnalyzeBatchResponses];
 
+export type StartBatchAnalysisJobData = {
+  body: BatchAnalyze;
+  path: {
+    /**
+     * Batch Id
+     */
+    batch_id: number;
+  };
+  query?: never;
+  url: "/batches/{batch_id}/analysis-jobs";
+};
+
+export type StartBatchAnalysisJobErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type StartBatchAnalysisJobError =
+  StartBatchAnalysisJobErrors[keyof StartBatchAnalysisJobErrors];
+
+export type StartBatchAnalysisJobResponses = {
+  /**
+   * Successful Response
+   */
+  202: JobResponse;
+};
+
+export type StartBatchAnalysisJobResponse =
+  StartBatchAnalysisJobResponses[keyof StartBatchAnalysisJobResponses];
+
 export type UpdateGroupsInBatchData = {
   body: BatchGroupUpdate;
   path: {
@@ -883,6 +1488,254 @@ export type RankGroupImagesResponses = {
 export type RankGroupImagesResponse =
   RankGroupImagesResponses[keyof RankGroupImagesResponses];
 
+export type GetJobData = {
+  body?: never;
+  path: {
+    /**
+     * Job Id
+     */
+    job_id: string;
+  };
+  query?: never;
+  url: "/jobs/{job_id}";
+};
+
+export type GetJobErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type GetJobError = GetJobErrors[keyof GetJobErrors];
+
+export type GetJobResponses = {
+  /**
+   * Successful Response
+   */
+  200: JobResponse;
+};
+
+export type GetJobResponse = GetJobResponses[keyof GetJobResponses];
+
+export type StreamJobEventsData = {
+  body?: never;
+  path: {
+    /**
+     * Job Id
+     */
+    job_id: string;
+  };
+  query?: never;
+  url: "/jobs/{job_id}/events";
+};
+
+export type StreamJobEventsErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type StreamJobEventsError =
+  StreamJobEventsErrors[keyof StreamJobEventsErrors];
+
+export type StreamJobEventsResponses = {
+  /**
+   * Successful Response
+   */
+  200: unknown;
+};
+
+export type OpenUploadData = {
+  body: UploadSessionCreate;
+  path?: never;
+  query?: never;
+  url: "/uploads/";
+};
+
+export type OpenUploadErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type OpenUploadError = OpenUploadErrors[keyof OpenUploadErrors];
+
+export type OpenUploadResponses = {
+  /**
+   * Successful Response
+   */
+  201: UploadSessionResponse;
+};
+
+export type OpenUploadResponse = OpenUploadResponses[keyof OpenUploadResponses];
+
+export type AbortUploadData = {
+  body?: never;
+  path: {
+    /**
+     * Upload Id
+     */
+    upload_id: string;
+  };
+  query?: never;
+  url: "/uploads/{upload_id}";
+};
+
+export type AbortUploadErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type AbortUploadError = AbortUploadErrors[keyof AbortUploadErrors];
+
+export type AbortUploadResponses = {
+  /**
+   * Successful Response
+   */
+  204: void;
+};
+
+export type AbortUploadResponse =
+  AbortUploadResponses[keyof AbortUploadResponses];
+
+export type GetUploadData = {
+  body?: never;
+  path: {
+    /**
+     * Upload Id
+     */
+    upload_id: string;
+  };
+  query?: never;
+  url: "/uploads/{upload_id}";
+};
+
+export type GetUploadErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type GetUploadError = GetUploadErrors[keyof GetUploadErrors];
+
+export type GetUploadResponses = {
+  /**
+   * Successful Response
+   */
+  200: UploadSessionResponse;
+};
+
+export type GetUploadResponse = GetUploadResponses[keyof GetUploadResponses];
+
+export type GetUploadOffsetData = {
+  body?: never;
+  path: {
+    /**
+     * Upload Id
+     */
+    upload_id: string;
+  };
+  query?: never;
+  url: "/uploads/{upload_id}";
+};
+
+export type GetUploadOffsetErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type GetUploadOffsetError =
+  GetUploadOffsetErrors[keyof GetUploadOffsetErrors];
+
+export type GetUploadOffsetResponses = {
+  /**
+   * Successful Response
+   */
+  200: unknown;
+};
+
+export type AppendUploadChunkData = {
+  body?: never;
+  headers: {
+    /**
+     * Upload-Offset
+     */
+    "Upload-Offset": number;
+    /**
+     * Content-Type
+     */
+    "content-type"?: string;
+  };
+  path: {
+    /**
+     * Upload Id
+     */
+    upload_id: string;
+  };
+  query?: never;
+  url: "/uploads/{upload_id}";
+};
+
+export type AppendUploadChunkErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type AppendUploadChunkError =
+  AppendUploadChunkErrors[keyof AppendUploadChunkErrors];
+
+export type AppendUploadChunkResponses = {
+  /**
+   * Successful Response
+   */
+  204: void;
+};
+
+export type AppendUploadChunkResponse =
+  AppendUploadChunkResponses[keyof AppendUploadChunkResponses];
+
+export type FinalizeUploadData = {
+  body?: never;
+  path: {
+    /**
+     * Upload Id
+     */
+    upload_id: string;
+  };
+  query?: never;
+  url: "/uploads/{upload_id}/finalize";
+};
+
+export type FinalizeUploadErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type FinalizeUploadError =
+  FinalizeUploadErrors[keyof FinalizeUploadErrors];
+
+export type FinalizeUploadResponses = {
+  /**
+   * Successful Response
+   */
+  200: ImageResponse;
+};
+
+export type FinalizeUploadResponse =
+  FinalizeUploadResponses[keyof FinalizeUploadResponses];
+
 export type ReadRootGetData = {
   body?: never;
   path?: never;
@@ -897,6 +1750,20 @@ export type ReadRootGetResponses = {
   200: unknown;
 };
 
+export type TruncateAllDataAdminTruncateAllDeleteData = {
+  body?: never;
+  path?: never;
+  query?: never;
+  url: "/admin/truncate-all";
+};
+
+export type TruncateAllDataAdminTruncateAllDeleteResponses = {
+  /**
+   * Successful Response
+   */
+  200: unknown;
+};
+
 export type ClientOptions = {
   baseUrl: `${string}://${string}` | (string & {});
 };
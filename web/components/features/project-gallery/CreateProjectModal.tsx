@@ -1,5 +1,9 @@
 import { useState, FormEvent } from "react";
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import {
+  useInfiniteQuery,
+  useMutation,
+  useQueryClient,
+} from "@tanstack/react-query";
 import { Button } from "@heroui/button";
 import {
   Modal,
@@ -12,12 +16,16 @@ import {
 } from "@heroui/react";
 
 import {
-  getAllImagesOptions,
+  getAllImages,
+  getAllImagesQueryKey,
   createBatchMutation,
   getAllBatchesQueryKey,
 } from "@/lib/api/queries";
 import { siteConfig } from "@/config/site";
 
+// Images per listing request; further pages follow the X-Next-Cursor header
+const IMAGE_PAGE_SIZE = 200;
+
 interface CreateProjectModalProps {
   isOpen: boolean;
   onClose: () => void;
@@ -34,9 +42,31 @@ export function CreateProjectModal({
   const [error, setError] = useState<string | null>(null);
   const reactQueryClient = useQueryClient();
 
-  const { data: allImages = [], isLoading: isLoadingImages } = useQuery(
-    getAllImagesOptions(),
-  );
+  const {
+    data: allImages = [],
+    isLoading: isLoadingImages,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: [...getAllImagesQueryKey(), "pages", IMAGE_PAGE_SIZE],
+    queryFn: async ({ pageParam, signal }) => {
+      const { data, response } = await getAllImages({
+        query: { limit: IMAGE_PAGE_SIZE, cursor: pageParam },
+        signal,
+        throwOnError: true,
+      });
+
+      return {
+        images: data,
+        nextCursor: response.headers.get("X-Next-Cursor"),
+      };
+    },
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
+    select: (data) => data.pages.flatMap((page) => page.images),
+    enabled: isOpen,
+  });
 
   const createProject = useMutation(createBatchMutation());
 
@@ -149,6 +179,19 @@ export function CreateProjectModal({
                     ))}
                   </div>
                 )}
+                {hasNextPage && (
+                  <div className="flex justify-center pt-2">
+                    <Button
+                      isLoading={isFetchingNextPage}
+                      radius="none"
+                      size="sm"
+                      variant="flat"
+                      onPress={() => fetchNextPage()}
+                    >
+                      Load more images
+                    </Button>
+                  </div>
+                )}
               </div>
             </div>
             {error && <p className="text-red-500 text-sm">{error}</p>}
@@ -14,12 +14,15 @@ export function ImageCard({
   onDetailClick,
   onSelectToggle,
   hasAnySelection,
+  thumbnailUrl,
 }: {
   image: ImageResponse;
   isSelected: boolean;
   onDetailClick: (image: ImageResponse) => void;
   onSelectToggle: (image: ImageResponse) => void;
   hasAnySelection?: boolean;
+  // Overrides the image's own thumbnail URL; null shows nothing until it is known
+  thumbnailUrl?: string | null;
 }) {
   const handleSelectClick = (e: React.MouseEvent) => {
     e.stopPropagation();
@@ -45,13 +48,15 @@ export function ImageCard({
       )}
     >
       <div className="relative flex-grow min-h-0" onClick={handleImageClick}>
-        <Image
-          fill
-          alt={image.original_filename}
-          className="object-contain p-1"
-          sizes="(max-width: 640px) 50vw, (max-width: 768px) 25vw, 16vw"
-          src={siteConfig.urls.imageThumbnail(image.id)}
-        />
+        {thumbnailUrl !== null && (
+          <Image
+            fill
+            alt={image.original_filename}
+            className="object-contain p-1"
+            sizes="(max-width: 640px) 50vw, (max-width: 768px) 25vw, 16vw"
+            src={thumbnailUrl ?? siteConfig.urls.imageThumbnail(image.id)}
+          />
+        )}
       </div>
 
       {/* Filename container - Click opens detail panel or toggles selection */}
@@ -1,4 +1,4 @@
-import type { BatchResponse } from "@/client/types.gen";
+import type { BatchSummaryResponse } from "@/client/types.gen";
 
 import Link from "next/link";
 import { Card, CardHeader, CardBody } from "@heroui/card";
@@ -7,12 +7,12 @@ import { Calendar } from "lucide-react";
 import { siteConfig } from "@/config/site";
 
 interface ProjectCardProps {
-  project: BatchResponse;
+  project: BatchSummaryResponse;
 }
 
 export const ProjectCard = ({ project }: ProjectCardProps) => {
-  const previewImages = project.image_associations.slice(0, 4);
-  const totalImages = project.image_associations.length;
+  const previewImageIds = project.preview_image_ids;
+  const totalImages = project.image_count;
 
   return (
     <Link href={`/batches/${project.id}`}>
@@ -25,7 +25,7 @@ export const ProjectCard = ({ project }: ProjectCardProps) => {
         <CardHeader className="aspect-video bg-neutral-800 flex items-center justify-center">
           <div className="relative w-44 h-44 flex-shrink-0 group flex items-center justify-center">
             {/* Image previews */}
-            {previewImages.map((assoc, index: number) => {
+            {previewImageIds.map((imageId, index: number) => {
               const offset = index * 20;
               const scale = 1 - index * 0.05;
               const brightnessClasses = [
@@ -36,7 +36,7 @@ export const ProjectCard = ({ project }: ProjectCardProps) => {
 
               return (
                 <div
-                  key={assoc.image.id}
+                  key={imageId}
                   className={`absolute w-28 h-40 rounded-sm overflow-hidden bg-neutral-800 shadow-lg ${brightnessClasses[index]}`}
                   style={{
                     left: `${offset}px`,
@@ -47,17 +47,17 @@ export const ProjectCard = ({ project }: ProjectCardProps) => {
                   <img
                     alt="Project image preview"
                     className="w-full h-full object-cover"
-                    src={siteConfig.urls.imageThumbnail(assoc.image.id)}
+                    src={siteConfig.urls.imageThumbnail(imageId)}
                   />
                 </div>
               );
             })}
 
             {/* Placeholder slots if fewer than 4 images */}
-            {previewImages.length > 0 &&
-              Array.from({ length: Math.max(0, 4 - previewImages.length) }).map(
+            {previewImageIds.length > 0 &&
+              Array.from({ length: Math.max(0, 4 - previewImageIds.length) }).map(
                 (_, i) => {
-                  const index = previewImages.length + i;
+                  const index = previewImageIds.length + i;
                   const offset = index * 20;
                   const scale = 1 - index * 0.05;
 
@@ -76,7 +76,7 @@ export const ProjectCard = ({ project }: ProjectCardProps) => {
               )}
 
             {/* Placeholder if no images */}
-            {previewImages.length === 0 && (
+            {previewImageIds.length === 0 && (
               <div className="absolute w-28 h-40 rounded-lg flex items-center justify-center text-center text-sm text-neutral-500 bg-neutral-800 border-2 border-dashed border-neutral-700">
                 No Images
               </div>
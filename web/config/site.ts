@@ -11,6 +11,16 @@ export const siteConfig = {
     projectDetails: (id: number | string) => `/batches/${id}`,
     imageThumbnail: (id: number | string) =>
       `${apiBaseUrl}/images/thumbnail/${id}`,
+    batchThumbnailBundle: (
+      id: number | string,
+      offset: number,
+      limit: number,
+    ) =>
+      `${apiBaseUrl}/batches/${id}/thumbnails?offset=${offset}&limit=${limit}`,
     image: (id: number | string) => `${apiBaseUrl}/images/${id}`,
+    imageRendition: (
+      id: number | string,
+      size: "grid" | "preview" | "large",
+    ) => `${apiBaseUrl}/images/${id}/rendition/${size}`,
   },
 };
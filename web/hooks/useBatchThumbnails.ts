@@ -0,0 +1,99 @@
+import type { UseQueryResult } from "@tanstack/react-query";
+
+import { useEffect, useMemo } from "react";
+import { useQueries } from "@tanstack/react-query";
+
+import { siteConfig } from "@/config/site";
+
+// Images per bundle request (the server's default page size)
+const BUNDLE_PAGE_SIZE = 200;
+// Each record starts with a big-endian uint32 image ID and uint32 byte length
+const RECORD_HEADER_BYTES = 8;
+
+type ThumbnailPage = Map<number, Blob>;
+
+/**
+ * Fetches one page of a batch's thumbnail bundle and splits it into one JPEG
+ * Blob per image.
+ */
+async function fetchThumbnailPage(
+  batchId: number,
+  offset: number,
+): Promise<ThumbnailPage> {
+  const response = await fetch(
+    siteConfig.urls.batchThumbnailBundle(batchId, offset, BUNDLE_PAGE_SIZE),
+  );
+
+  if (!response.ok) {
+    throw new Error(`Thumbnail bundle request failed: ${response.status}`);
+  }
+
+  const buffer = await response.arrayBuffer();
+  const view = new DataView(buffer);
+  const thumbnails: ThumbnailPage = new Map();
+  let position = 0;
+
+  while (position + RECORD_HEADER_BYTES <= buffer.byteLength) {
+    const imageId = view.getUint32(position);
+    const length = view.getUint32(position + 4);
+
+    position += RECORD_HEADER_BYTES;
+    // A length of 0 means the thumbnail hasn't been generated yet
+    if (length > 0) {
+      thumbnails.set(
+        imageId,
+        new Blob([buffer.slice(position, position + length)], {
+          type: "image/jpeg",
+        }),
+      );
+    }
+    position += length;
+  }
+
+  return thumbnails;
+}
+
+// Defined once so useQueries only recombines when a page's result changes
+function combinePages(results: UseQueryResult<ThumbnailPage>[]) {
+  return {
+    pages: results.map((result) => result.data),
+    isLoading: results.some((result) => result.isPending),
+  };
+}
+
+/**
+ * Loads a batch's thumbnails a page at a time from GET /batches/{id}/thumbnails
+ * instead of one request per image. Returns object URLs by image ID; images
+ * missing from the map fall back to their own thumbnail URL once loading is done.
+ */
+export function useBatchThumbnails(batchId: number, imageCount: number) {
+  const pageCount = Math.ceil(imageCount / BUNDLE_PAGE_SIZE);
+
+  const { pages, isLoading } = useQueries({
+    queries: Array.from({ length: pageCount }, (_, page) => ({
+      queryKey: ["batchThumbnailBundle", batchId, page * BUNDLE_PAGE_SIZE],
+      queryFn: () => fetchThumbnailPage(batchId, page * BUNDLE_PAGE_SIZE),
+    })),
+    combine: combinePages,
+  });
+
+  const thumbnailUrls = useMemo(() => {
+    const urls = new Map<number, string>();
+
+    pages.forEach((page) =>
+      page?.forEach((blob, imageId) =>
+        urls.set(imageId, URL.createObjectURL(blob)),
+      ),
+    );
+
+    return urls;
+  }, [pages]);
+
+  // Release the previous object URLs whenever a page reloads, and on unmount
+  useEffect(
+    () => () => thumbnailUrls.forEach((url) => URL.revokeObjectURL(url)),
+    [thumbnailUrls],
+  );
+
+  return { thumbnailUrls, isLoading };
+}